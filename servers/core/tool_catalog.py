@@ -0,0 +1,196 @@
+"""
+Tool catalog for the Core Tools MCP server.
+
+Pure data: the name, description and input schema of every tool, importable
+without loading the server or any of its tools.
+"""
+
+TOOLS = [
+    # Project Structure and Code Analysis
+    {
+        "name": "generate_project_tree",
+        "description": "Generate a visual tree structure of a project directory with optional filtering",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "root_path": {"type": "string", "description": "Root directory path to analyze (defaults to Biting Lip project root)"},
+                "ignore_patterns": {"type": "array", "items": {"type": "string"}, "description": "Array of patterns to ignore (e.g., ['*.pyc', '__pycache__'])"},
+                "max_depth": {"type": "integer", "description": "Maximum depth to traverse"}
+            },
+            "required": []
+        }
+    },
+    {
+        "name": "analyze_python_file",
+        "description": "Analyze a Python file and extract classes, functions, imports, and constants",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "file_path": {"type": "string", "description": "Path to the Python file to analyze (relative to project root)"},
+                "file_paths": {"type": "array", "items": {"type": "string"}, "description": "Analyze several files in one call instead of file_path (optional); results are keyed by path"}
+            },
+            "required": [],
+            "anyOf": [{"required": ["file_path"]}, {"required": ["file_paths"]}]
+        }
+    },
+    {
+        "name": "get_project_overview",
+        "description": "Get a lightweight project overview (FIXED: no longer causes MCP loops)",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "max_files": {"type": "integer", "description": "Maximum number of files to analyze (default: 20)", "default": 20},
+                "include_details": {"type": "boolean", "description": "Include detailed class/function info (default: false)", "default": False}
+            },
+            "required": []
+        }
+    },
+    {
+        "name": "get_project_overview_paginated",
+        "description": "Get paginated project overview for large projects",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "page": {"type": "integer", "description": "Page number (0-based)", "default": 0},
+                "files_per_page": {"type": "integer", "description": "Files per page (default: 10)", "default": 10}
+            },
+            "required": []
+        }
+    },
+    {
+        "name": "search_code",
+        "description": "Search for code patterns in the project",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Search query string"},
+                "file_type": {"type": "string", "description": "File extension to search in (default: 'py')"},
+                "project_root": {"type": "string", "description": "Root directory to search in (defaults to Biting Lip project root)"}
+            },
+            "required": ["query"]
+        }
+    },
+    {
+        "name": "find_python_files",
+        "description": "Find all Python files in a directory",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "directory": {"type": "string", "description": "Directory to search in (defaults to Biting Lip project root)"}
+            },
+            "required": []
+        }
+    },
+    # Service Discovery Tools
+    {
+        "name": "discover_services",
+        "description": "Discover and analyze all services in the Biting Lip platform including managers, interfaces, and their configurations",
+        "inputSchema": {"type": "object", "properties": {}, "required": []}
+    },
+    {
+        "name": "get_service_dependencies",
+        "description": "Get dependencies for a specific service including internal and external dependencies",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "service_name": {"type": "string", "description": "Name of the service to analyze dependencies for"}
+            },
+            "required": ["service_name"]
+        }
+    },
+    # Configuration Analysis
+    {
+        "name": "analyze_config_files",
+        "description": "Analyze configuration files in the project including .env, YAML, JSON, Python configs, and Docker files",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "target_path": {"type": "string", "description": "Specific path to analyze (defaults to project root)"}
+            },
+            "required": []
+        }
+    },
+    {
+        "name": "get_config_summary",
+        "description": "Get a high-level summary of all configuration in the project",
+        "inputSchema": {"type": "object", "properties": {}, "required": []}
+    },
+    # Docker and Infrastructure
+    {
+        "name": "get_docker_info",
+        "description": "Get comprehensive Docker analysis including containers, images, Compose files, and Dockerfiles",
+        "inputSchema": {"type": "object", "properties": {}, "required": []}
+    },
+    # Testing
+    {
+        "name": "find_test_files",
+        "description": "Find test files mapping to source files or analyze overall test structure",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "target_file": {"type": "string", "description": "Specific source file to find tests for (optional)"}
+            },
+            "required": []
+        }
+    },
+    # Dependencies
+    {
+        "name": "analyze_dependencies",
+        "description": "Analyze project dependencies including Python packages, system requirements, and internal modules",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "analysis_type": {"type": "string", "enum": ["all", "python", "system", "internal"], "description": "Type of dependency analysis to perform"}
+            },
+            "required": []
+        }
+    },
+    # Git Analysis
+    {
+        "name": "get_git_info",
+        "description": "Get git repository information including status, branches, commits, and remote info",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "info_type": {"type": "string", "enum": ["all", "status", "branches", "commits", "remote"], "description": "Type of git information to retrieve"}
+            },
+            "required": []
+        }
+    },
+    # API and Database Analysis
+    {
+        "name": "discover_api_endpoints",
+        "description": "Discover and analyze API endpoints across different frameworks (Flask, FastAPI, Django, Express.js, etc.)",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "framework": {"type": "string", "enum": ["flask", "fastapi", "django", "express", "nextjs", "spring"], "description": "Specific framework to analyze (optional, analyzes all if not specified)"}
+            },
+            "required": []
+        }
+    },
+    {
+        "name": "analyze_database_schemas",
+        "description": "Analyze database schemas and structures across different database systems",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "database_type": {"type": "string", "enum": ["sqlite", "postgresql", "mysql", "mongodb", "django_orm", "sqlalchemy"], "description": "Specific database type to analyze (optional, analyzes all if not specified)"}
+            },
+            "required": []
+        }
+    },
+    # Log Analysis
+    {
+        "name": "analyze_logs",
+        "description": "Analyze application logs, error patterns, and performance metrics",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "log_type": {"type": "string", "enum": ["error", "access", "application", "system"], "description": "Specific log type to analyze (optional, analyzes all if not specified)"},
+                "time_range": {"type": "object", "properties": {"start": {"type": "string", "description": "Start time (ISO format)"}, "end": {"type": "string", "description": "End time (ISO format)"}}, "description": "Time range filter for log analysis"}
+            },
+            "required": []
+        }
+    }
+]
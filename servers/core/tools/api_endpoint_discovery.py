@@ -6,47 +6,121 @@ including Flask, FastAPI, Django, Express.js, and more.
 """
 
 import ast
+import copy
 import json
+import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 import logging
 
+from .file_index import INDEX_TTL_SECONDS, get_file_index
+
 logger = logging.getLogger(__name__)
 
+# Directory names skipped while collecting source files
+PYTHON_EXCLUDED_DIRS = frozenset({
+    'node_modules', '.git', '__pycache__', '.pytest_cache', 
+    'venv', 'env', '.venv', '.env', 'build', 'dist', 
+    '.tox', 'site-packages', '.mypy_cache'
+})
+JS_EXCLUDED_DIRS = frozenset({
+    'node_modules', '.git', '.next', 'build', 'dist',
+    '.cache', 'coverage', '.nyc_output'
+})
+
+# A full scan answers later single-framework queries until it is this old; it expires
+# with the file index so new routes show up as soon as a fresh walk would find them
+CACHE_ENABLED = os.getenv("CACHE_ENABLED", "true").lower() == "true"
+FULL_SCAN_TTL_SECONDS = INDEX_TTL_SECONDS
+
+# Analyzer method for each supported framework, grouped by source language
+PYTHON_FRAMEWORK_ANALYZERS = {
+    "flask": "_analyze_flask",
+    "fastapi": "_analyze_fastapi",
+    "django": "_analyze_django"
+}
+JS_FRAMEWORK_ANALYZERS = {
+    "express": "_analyze_express",
+    "nextjs": "_analyze_nextjs"
+}
+
+
+def _keyword_union(keywords: List[str]) -> "re.Pattern[str]":
+    """Compile keywords into one case-insensitive alternation matched in a single scan."""
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+# Security categories detected in endpoint source, one combined pattern per category
+SECURITY_PATTERNS = [
+    ("authentication", _keyword_union(["@login_required", "authenticate", "jwt", "token", "auth"])),
+    ("authorization", _keyword_union(["@permission_required", "authorize", "role", "permission"])),
+    ("input_validation", _keyword_union(["validate", "sanitize", "escape", "request.form", "request.json"])),
+    ("csrf_protection", _keyword_union(["csrf", "CSRFProtect", "csrf_token"])),
+    ("rate_limiting", _keyword_union(["rate_limit", "throttle", "limit"]))
+]
+
+
+# Route declarations per framework, compiled once at import
+FLASK_ROUTE_PATTERN = re.compile(
+    r'@(?:app|bp|blueprint)\.route\([\'"]([^\'"]+)[\'"](?:.*?methods\s*=\s*\[([^\]]+)\])?.*?\)',
+    re.MULTILINE | re.DOTALL
+)
+FASTAPI_ROUTE_PATTERNS = tuple(
+    (re.compile(rf'@(?:app|router)\.{verb}\([\'"]([^\'"]+)[\'"].*?\)', re.MULTILINE), verb.upper())
+    for verb in ("get", "post", "put", "delete", "patch")
+)
+EXPRESS_ROUTE_PATTERNS = tuple(
+    (re.compile(rf'(?:app|router)\.{verb}\([\'"]([^\'"]+)[\'"]'), verb.upper())
+    for verb in ("get", "post", "put", "delete", "patch")
+)
+DJANGO_URL_PATTERNS = (
+    re.compile(r'path\([\'"]([^\'"]+)[\'"]'),
+    re.compile(r'url\(r[\'"]([^\'"]+)[\'"]'),
+    re.compile(r're_path\(r[\'"]([^\'"]+)[\'"]')
+)
+IMPORT_PATTERNS = (
+    re.compile(r'import\s+([^\s;]+)'),
+    re.compile(r'from\s+([^\s]+)\s+import'),
+    re.compile(r'require\([\'"]([^\'"]+)[\'"]'),
+    re.compile(r'import\s+[^from]*from\s+[\'"]([^\'"]+)[\'"]')
+)
+
 
 class APIEndpointDiscovery:
     """Discovers API endpoints in web applications."""
     
     def __init__(self, project_root: str):
         self.project_root = Path(project_root)
+        self.file_index = get_file_index(project_root)
+        self._full_scan: Optional[Dict[str, Any]] = None
+        self._full_scan_expires = 0.0
+        
+    def _cached_framework(self, framework: str) -> Optional[Dict[str, Any]]:
+        """Return one framework's results from a recent full scan, if there is one."""
+        if not CACHE_ENABLED or self._full_scan is None or time.monotonic() >= self._full_scan_expires:
+            return None
+        framework_data = self._full_scan["endpoints"].get(framework)
+        return copy.deepcopy(framework_data) if framework_data is not None else None
         
     def _get_python_files(self):
         """Get Python files excluding common irrelevant directories."""
-        excluded_dirs = {
-            'node_modules', '.git', '__pycache__', '.pytest_cache', 
-            'venv', 'env', '.venv', '.env', 'build', 'dist', 
-            '.tox', 'site-packages', '.mypy_cache'
-        }
-        
-        for py_file in self.project_root.rglob("*.py"):
+        for py_file in self.file_index.rglob("*.py"):
             # Check if file is in excluded directory
-            if all(excluded_dir not in py_file.parts for excluded_dir in excluded_dirs):
+            if PYTHON_EXCLUDED_DIRS.isdisjoint(py_file.parts):
                 yield py_file
             
     def _get_js_files(self):
         """Get JavaScript/TypeScript files excluding common irrelevant directories."""
-        excluded_dirs = {
-            'node_modules', '.git', '.next', 'build', 'dist',
-            '.cache', 'coverage', '.nyc_output'
-        }
-        
-        for js_file in self.project_root.rglob("*.js"):
-            if all(excluded_dir not in js_file.parts for excluded_dir in excluded_dirs):
+        for js_file in self.file_index.rglob("*.js"):
+            if JS_EXCLUDED_DIRS.isdisjoint(js_file.parts):
                 yield js_file
 
-        for ts_file in self.project_root.rglob("*.ts"):
-            if all(excluded_dir not in ts_file.parts for excluded_dir in excluded_dirs):
+        for ts_file in self.file_index.rglob("*.ts"):
+            if JS_EXCLUDED_DIRS.isdisjoint(ts_file.parts):
                 yield ts_file
     def discover_endpoints(self, framework: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -76,9 +150,12 @@ class APIEndpointDiscovery:
             
             # If framework specified, analyze only that framework
             if framework:
-                if framework.lower() in ["flask", "fastapi", "django"]:
+                cached = self._cached_framework(framework.lower())
+                if cached is not None:
+                    result = {framework.lower(): cached}
+                elif framework.lower() in PYTHON_FRAMEWORK_ANALYZERS:
                     result = self._analyze_python_frameworks(framework.lower())
-                elif framework.lower() in ["express", "nextjs"]:
+                elif framework.lower() in JS_FRAMEWORK_ANALYZERS:
                     result = self._analyze_javascript_frameworks(framework.lower())
                 else:
                     result = {"endpoints": [], "files": []}
@@ -86,30 +163,32 @@ class APIEndpointDiscovery:
                 endpoints["endpoints"][framework.lower()] = result
                 endpoints["summary"]["frameworks_detected"] = [framework.lower()]
             else:
-                # Discover all frameworks
-                python_frameworks = self._analyze_python_frameworks()
-                js_frameworks = self._analyze_javascript_frameworks()
+                # Discover all frameworks; the Python and JavaScript scans are independent
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    python_future = executor.submit(self._analyze_python_frameworks)
+                    js_future = executor.submit(self._analyze_javascript_frameworks)
+                    python_frameworks = python_future.result()
+                    js_frameworks = js_future.result()
                 
                 endpoints["endpoints"].update(python_frameworks)
                 endpoints["endpoints"].update(js_frameworks)
-                
-                # Update summary
-                detected_frameworks = [k for k, v in endpoints["endpoints"].items() 
-                                     if v.get("endpoints")]
-                endpoints["summary"]["frameworks_detected"] = detected_frameworks
             
-            # Calculate totals
-            total_endpoints = sum(
-                len(fw_data.get("endpoints", [])) 
-                for fw_data in endpoints["endpoints"].values()
-            )
-            total_files = sum(
-                len(fw_data.get("files", [])) 
-                for fw_data in endpoints["endpoints"].values()
-            )
+            # Calculate totals and detected frameworks in one pass
+            summary = endpoints["summary"]
+            detected_frameworks = []
+            for fw_name, fw_data in endpoints["endpoints"].items():
+                fw_endpoints = fw_data.get("endpoints", [])
+                if fw_endpoints:
+                    detected_frameworks.append(fw_name)
+                summary["total_endpoints"] += len(fw_endpoints)
+                summary["files_analyzed"] += len(fw_data.get("files", []))
             
-            endpoints["summary"]["total_endpoints"] = total_endpoints
-            endpoints["summary"]["files_analyzed"] = total_files
+            if not framework:
+                summary["frameworks_detected"] = detected_frameworks
+            
+            if not framework and CACHE_ENABLED:
+                self._full_scan = copy.deepcopy(endpoints)
+                self._full_scan_expires = time.monotonic() + FULL_SCAN_TTL_SECONDS
             
             return endpoints
             
@@ -123,32 +202,21 @@ class APIEndpointDiscovery:
     
     def _analyze_python_frameworks(self, specific_framework: Optional[str] = None) -> Dict[str, Any]:
         """Analyze Python web frameworks (Flask, FastAPI, Django)."""
-        frameworks_data = {}
-        
-        frameworks_to_check = [specific_framework] if specific_framework else ["flask", "fastapi", "django"]
+        return self._run_framework_analyzers(PYTHON_FRAMEWORK_ANALYZERS, specific_framework)
+    
+    def _run_framework_analyzers(self, analyzers: Dict[str, str],
+                                 specific_framework: Optional[str] = None) -> Dict[str, Any]:
+        """Run every analyzer in the table, or only the one for specific_framework."""
+        frameworks_to_check = [specific_framework] if specific_framework else list(analyzers)
         
-        for framework in frameworks_to_check:
-            if framework == "flask":
-                frameworks_data["flask"] = self._analyze_flask()
-            elif framework == "fastapi":
-                frameworks_data["fastapi"] = self._analyze_fastapi()
-            elif framework == "django":
-                frameworks_data["django"] = self._analyze_django()
-                
-        return frameworks_data
+        return {
+            framework: getattr(self, analyzers[framework])()
+            for framework in frameworks_to_check
+            if framework in analyzers
+        }
     def _analyze_javascript_frameworks(self, specific_framework: Optional[str] = None) -> Dict[str, Any]:
         """Analyze JavaScript web frameworks (Express, Next.js)."""
-        frameworks_data = {}
-        
-        frameworks_to_check = [specific_framework] if specific_framework else ["express", "nextjs"]
-        
-        for framework in frameworks_to_check:
-            if framework == "express":
-                frameworks_data["express"] = self._analyze_express()
-            elif framework == "nextjs":
-                frameworks_data["nextjs"] = self._analyze_nextjs()
-                
-        return frameworks_data
+        return self._run_framework_analyzers(JS_FRAMEWORK_ANALYZERS, specific_framework)
     
     def _analyze_flask(self) -> Dict[str, Any]:
         """Analyze Flask applications for API endpoints."""
@@ -247,10 +315,7 @@ class APIEndpointDiscovery:
         """Fallback regex-based Flask endpoint extraction."""
         endpoints = []
         
-        # Regex patterns for Flask routes
-        route_pattern = r'@(?:app|bp|blueprint)\.route\([\'"]([^\'"]+)[\'"](?:.*?methods\s*=\s*\[([^\]]+)\])?.*?\)'
-        
-        for match in re.finditer(route_pattern, content, re.MULTILINE | re.DOTALL):
+        for match in FLASK_ROUTE_PATTERN.finditer(content):
             path = match.group(1)
             methods_str = match.group(2)
             methods = ["GET"]
@@ -307,17 +372,8 @@ class APIEndpointDiscovery:
         """Extract FastAPI endpoints from file content."""
         endpoints = []
         
-        # Regex patterns for FastAPI routes
-        method_patterns = [
-            (r'@(?:app|router)\.get\([\'"]([^\'"]+)[\'"].*?\)', "GET"),
-            (r'@(?:app|router)\.post\([\'"]([^\'"]+)[\'"].*?\)', "POST"),
-            (r'@(?:app|router)\.put\([\'"]([^\'"]+)[\'"].*?\)', "PUT"),
-            (r'@(?:app|router)\.delete\([\'"]([^\'"]+)[\'"].*?\)', "DELETE"),
-            (r'@(?:app|router)\.patch\([\'"]([^\'"]+)[\'"].*?\)', "PATCH"),
-        ]
-        
-        for pattern, method in method_patterns:
-            for match in re.finditer(pattern, content, re.MULTILINE):
+        for pattern, method in FASTAPI_ROUTE_PATTERNS:
+            for match in pattern.finditer(content):
                 path = match.group(1)
                 endpoints.append({
                     "path": path,
@@ -368,15 +424,8 @@ class APIEndpointDiscovery:
         """Extract Django URL patterns."""
         endpoints = []
         
-        # Regex patterns for Django URL patterns
-        url_patterns = [
-            r'path\([\'"]([^\'"]+)[\'"]',
-            r'url\(r[\'"]([^\'"]+)[\'"]',
-            r're_path\(r[\'"]([^\'"]+)[\'"]'
-        ]
-        
-        for pattern in url_patterns:
-            for match in re.finditer(pattern, content):
+        for pattern in DJANGO_URL_PATTERNS:
+            for match in pattern.finditer(content):
                 path = match.group(1)
                 endpoints.append({
                     "path": path,
@@ -427,17 +476,8 @@ class APIEndpointDiscovery:
         """Extract Express.js endpoints."""
         endpoints = []
         
-        # Regex patterns for Express routes
-        method_patterns = [
-            (r'(?:app|router)\.get\([\'"]([^\'"]+)[\'"]', "GET"),
-            (r'(?:app|router)\.post\([\'"]([^\'"]+)[\'"]', "POST"),
-            (r'(?:app|router)\.put\([\'"]([^\'"]+)[\'"]', "PUT"),
-            (r'(?:app|router)\.delete\([\'"]([^\'"]+)[\'"]', "DELETE"),
-            (r'(?:app|router)\.patch\([\'"]([^\'"]+)[\'"]', "PATCH"),
-        ]
-        
-        for pattern, method in method_patterns:
-            for match in re.finditer(pattern, content):
+        for pattern, method in EXPRESS_ROUTE_PATTERNS:
+            for match in pattern.finditer(content):
                 path = match.group(1)
                 endpoints.append({
                     "path": path,
@@ -567,19 +607,10 @@ class APIEndpointDiscovery:
     
     def _analyze_endpoint_security(self, content: str) -> List[str]:
         """Analyze security patterns in endpoint."""
-        # Check for authentication patterns
-        auth_patterns = [
-            ("authentication", ["@login_required", "authenticate", "jwt", "token", "auth"]),
-            ("authorization", ["@permission_required", "authorize", "role", "permission"]),
-            ("input_validation", ["validate", "sanitize", "escape", "request.form", "request.json"]),
-            ("csrf_protection", ["csrf", "CSRFProtect", "csrf_token"]),
-            ("rate_limiting", ["rate_limit", "throttle", "limit"])
-        ]
-        
         return [
             category
-            for category, patterns in auth_patterns
-            if any(pattern in content.lower() for pattern in patterns)
+            for category, pattern in SECURITY_PATTERNS
+            if pattern.search(content)
         ]
     
     def _analyze_endpoint_dependencies(self, content: str) -> List[str]:
@@ -587,17 +618,10 @@ class APIEndpointDiscovery:
         dependencies = []
         
         # Extract import statements
-        import_patterns = [
-            r'import\s+([^\s;]+)',
-            r'from\s+([^\s]+)\s+import',
-            r'require\([\'"]([^\'"]+)[\'"]',
-            r'import\s+[^from]*from\s+[\'"]([^\'"]+)[\'"]'
-        ]
-        
-        for pattern in import_patterns:
-            dependencies.extend(re.findall(pattern, content))
+        for pattern in IMPORT_PATTERNS:
+            dependencies.extend(pattern.findall(content))
             
-        return list(set(dependencies))[:10]  # Limit to 10 most relevant
+        return list(islice(set(dependencies), 10))  # Limit to 10 most relevant
     
     def _analyze_endpoint_middleware(self, content: str, framework: str) -> List[str]:
         """Analyze middleware usage."""
@@ -5,9 +5,55 @@ Code analysis tools for the Biting Lip MCP server.
 import os
 import ast
 import json
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 
+# Directories that can cause infinite loops or are not relevant to analysis
+IGNORED_DIRS = frozenset({
+    '__pycache__', '.git', 'node_modules', 'cache', 'downloads',
+    '.vscode', '.idea', 'venv', 'env', '.env', 'dist', 'build',
+    '.pytest_cache', '.mypy_cache', '.coverage'
+})
+
+
+# Searches over fewer files than this run in-process; process start-up would cost more than it saves
+PARALLEL_SEARCH_MIN_FILES = 64
+SEARCH_WORKERS = os.cpu_count() or 1
+
+
+@functools.lru_cache(maxsize=1)
+def _get_search_pool() -> ProcessPoolExecutor:
+    """Process pool shared by code searches, started on first use."""
+    # spawn rather than fork: the server process already runs worker threads
+    return ProcessPoolExecutor(max_workers=SEARCH_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+
+
+def _search_file(file_path: str, query: str) -> List[Dict[str, Any]]:
+    """Return the lines of file_path containing the lower-cased query, with context."""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+    except Exception:
+        return []
+    
+    return [
+        {
+            'file': file_path,
+            'line_number': i + 1,
+            'line_content': line.strip(),
+            'context': {
+                'before': lines[max(0, i-2):i],
+                'after': lines[i+1:min(len(lines), i+3)]
+            }
+        }
+        for i, line in enumerate(lines)
+        if query in line.lower()
+    ]
+
 
 class CodeAnalyzer:
     """Analyze code files in the Biting Lip project."""
@@ -90,6 +136,10 @@ class CodeAnalyzer:
                 'file_path': file_path
             }
             
+    def analyze_python_files_batch(self, file_paths: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Analyze several Python files in one call, keyed by the requested path."""
+        return {file_path: self.analyze_python_file(file_path) for file_path in dict.fromkeys(file_paths)}
+            
     def find_python_files(self, directory: Optional[str] = None) -> List[str]:
         """Find all Python files in the project."""
         search_dir = directory or self.project_root
@@ -97,11 +147,7 @@ class CodeAnalyzer:
         
         for root, dirs, files in os.walk(search_dir):
             # Skip common ignore directories that can cause infinite loops or are not relevant
-            dirs[:] = [d for d in dirs if d not in [
-                '__pycache__', '.git', 'node_modules', 'cache', 'downloads',
-                '.vscode', '.idea', 'venv', 'env', '.env', 'dist', 'build',
-                '.pytest_cache', '.mypy_cache', '.coverage'
-            ]]
+            dirs[:] = [d for d in dirs if d not in IGNORED_DIRS]
             
             python_files.extend(
                 [os.path.join(root, file) for file in files if file.endswith('.py')]
@@ -138,41 +184,25 @@ class CodeAnalyzer:
         
     def search_code(self, query: str, file_type: str = 'py') -> List[Dict[str, Any]]:
         """Search for code patterns in the project."""
-        results = []
+        file_paths = []
         
         for root, dirs, files in os.walk(self.project_root):
             # Skip common ignore directories that can cause infinite loops or are not relevant
-            dirs[:] = [d for d in dirs if d not in [
-                '__pycache__', '.git', 'node_modules', 'cache', 'downloads',
-                '.vscode', '.idea', 'venv', 'env', '.env', 'dist', 'build',
-                '.pytest_cache', '.mypy_cache', '.coverage'
-            ]]
+            dirs[:] = [d for d in dirs if d not in IGNORED_DIRS]
             
-            for file in files:
-                if file.endswith(f'.{file_type}'):
-                    file_path = os.path.join(root, file)
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            lines = f.readlines()
-                            
-                        matches = [
-                            {
-                                'file': file_path,
-                                'line_number': i + 1,
-                                'line_content': line.strip(),
-                                'context': {
-                                    'before': lines[max(0, i-2):i],
-                                    'after': lines[i+1:min(len(lines), i+3)]
-                                }
-                            }
-                            for i, line in enumerate(lines)
-                            if query.lower() in line.lower()
-                        ]
-                        results.extend(matches)
-                    except Exception:
-                        continue
-                        
-        return results
+            file_paths.extend(
+                os.path.join(root, file) for file in files if file.endswith(f'.{file_type}')
+            )
+        
+        query = query.lower()
+        if len(file_paths) < PARALLEL_SEARCH_MIN_FILES:
+            matches = map(_search_file, file_paths, repeat(query))
+        else:
+            # Matching is pure CPU work, so large searches are spread across processes
+            chunksize = max(1, len(file_paths) // (4 * SEARCH_WORKERS))
+            matches = _get_search_pool().map(_search_file, file_paths, repeat(query), chunksize=chunksize)
+        
+        return list(chain.from_iterable(matches))
     
     def get_project_summary(self, max_files: int = 20, include_details: bool = False) -> Dict[str, Any]:
         """Get a lightweight project summary to avoid MCP protocol issues."""
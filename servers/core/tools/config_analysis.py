@@ -359,9 +359,10 @@ class ConfigAnalyzer:
                 "item_types": list(set(type(item).__name__ for item in content[:10]))
             }
         else:
+            text = str(content)
             return {
                 "type": type(content).__name__,
-                "value": content if len(str(content)) < 100 else str(content)[:100] + "..."
+                "value": content if len(text) < 100 else text[:100] + "..."
             }
     
     def _analyze_package_json(self, content: Dict[str, Any]) -> Dict[str, Any]:
@@ -5,21 +5,63 @@ This tool analyzes database schemas, relationships, and patterns across differen
 database systems including PostgreSQL, MySQL, SQLite, MongoDB, and others.
 """
 
+import copy
 import json
+import os
 import re
 import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 import logging
 
+from .file_index import INDEX_TTL_SECONDS, get_file_index
+
 logger = logging.getLogger(__name__)
 
+# A full analysis answers later single-type queries until it is this old; it expires
+# with the file index so new models show up as soon as a fresh walk would find them
+CACHE_ENABLED = os.getenv("CACHE_ENABLED", "true").lower() == "true"
+FULL_SCAN_TTL_SECONDS = INDEX_TTL_SECONDS
+
+# Analyzer method for each supported database type, in report order
+SCHEMA_ANALYZERS = {
+    "sqlite": "_analyze_sqlite_databases",
+    "postgresql": "_analyze_postgresql_schemas",
+    "mysql": "_analyze_mysql_schemas",
+    "mongodb": "_analyze_mongodb_schemas",
+    "django_orm": "_analyze_django_models",
+    "sqlalchemy": "_analyze_sqlalchemy_models"
+}
+DATABASE_TYPE_ALIASES = {"postgres": "postgresql"}
+
+# Dialect markers, each compiled into a single alternation so a file is scanned once
+PG_INDICATOR_RE = re.compile(
+    r"SERIAL|BIGSERIAL|UUID|JSONB|ARRAY|pg_dump|CREATE SCHEMA|SET search_path",
+    re.IGNORECASE
+)
+MYSQL_INDICATOR_RE = re.compile(
+    r"AUTO_INCREMENT|ENGINE=InnoDB|ENGINE=MyISAM|CHARSET=utf8|mysqldump"
+)
+TABLE_CONSTRAINT_RE = re.compile(r"PRIMARY KEY|FOREIGN KEY|UNIQUE|CHECK", re.IGNORECASE)
+
 
 class DatabaseSchemaAnalysis:
     """Analyzes database schemas and structures."""
     
     def __init__(self, project_root: str):
         self.project_root = Path(project_root)
+        self.file_index = get_file_index(project_root)
+        self._full_scan: Optional[Dict[str, Any]] = None
+        self._full_scan_expires = 0.0
+        
+    def _cached_schema(self, schema_key: str) -> Optional[Dict[str, Any]]:
+        """Return one database type's results from a recent full analysis, if there is one."""
+        if not CACHE_ENABLED or self._full_scan is None or time.monotonic() >= self._full_scan_expires:
+            return None
+        schema = self._full_scan["schemas"].get(schema_key)
+        return copy.deepcopy(schema) if schema is not None else None
         
     def analyze_schemas(self, database_type: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -36,6 +78,8 @@ class DatabaseSchemaAnalysis:
                 "summary": {
                     "databases_found": 0,
                     "total_tables": 0,
+                    "total_models": 0,
+                    "total_objects": 0,
                     "total_columns": 0,
                     "database_types": [],
                     "files_analyzed": 0
@@ -43,38 +87,34 @@ class DatabaseSchemaAnalysis:
                 "schemas": {},
                 "analysis_metadata": {
                     "project_root": str(self.project_root),
-                    "supported_types": [
-                        "sqlite", "postgresql", "mysql", "mongodb", "django_orm", "sqlalchemy"
-                    ]
+                    "supported_types": list(SCHEMA_ANALYZERS)
                 }
             }
             
             # If database type specified, analyze only that type
             if database_type:
-                if database_type.lower() == "sqlite":
-                    analysis["schemas"]["sqlite"] = self._analyze_sqlite_databases()
-                elif database_type.lower() in ["postgresql", "postgres"]:
-                    analysis["schemas"]["postgresql"] = self._analyze_postgresql_schemas()
-                elif database_type.lower() == "mysql":
-                    analysis["schemas"]["mysql"] = self._analyze_mysql_schemas()
-                elif database_type.lower() == "mongodb":
-                    analysis["schemas"]["mongodb"] = self._analyze_mongodb_schemas()
-                elif database_type.lower() == "django_orm":
-                    analysis["schemas"]["django_orm"] = self._analyze_django_models()
-                elif database_type.lower() == "sqlalchemy":
-                    analysis["schemas"]["sqlalchemy"] = self._analyze_sqlalchemy_models()
+                schema_key = DATABASE_TYPE_ALIASES.get(database_type.lower(), database_type.lower())
+                cached = self._cached_schema(schema_key)
+                if cached is not None:
+                    analysis["schemas"][schema_key] = cached
+                elif schema_key in SCHEMA_ANALYZERS:
+                    analysis["schemas"][schema_key] = getattr(self, SCHEMA_ANALYZERS[schema_key])()
             else:
-                # Analyze all database types
-                analysis["schemas"]["sqlite"] = self._analyze_sqlite_databases()
-                analysis["schemas"]["postgresql"] = self._analyze_postgresql_schemas()
-                analysis["schemas"]["mysql"] = self._analyze_mysql_schemas()
-                analysis["schemas"]["mongodb"] = self._analyze_mongodb_schemas()
-                analysis["schemas"]["django_orm"] = self._analyze_django_models()
-                analysis["schemas"]["sqlalchemy"] = self._analyze_sqlalchemy_models()
+                # Analyze all database types; the scans are independent, so overlap their file I/O
+                with ThreadPoolExecutor(max_workers=len(SCHEMA_ANALYZERS)) as executor:
+                    futures = {
+                        key: executor.submit(getattr(self, method))
+                        for key, method in SCHEMA_ANALYZERS.items()
+                    }
+                    analysis["schemas"].update((key, future.result()) for key, future in futures.items())
             
             # Calculate summary statistics
             self._calculate_summary_stats(analysis)
             
+            if not database_type and CACHE_ENABLED:
+                self._full_scan = copy.deepcopy(analysis)
+                self._full_scan_expires = time.monotonic() + FULL_SCAN_TTL_SECONDS
+            
             return analysis
             
         except Exception as e:
@@ -92,7 +132,7 @@ class DatabaseSchemaAnalysis:
         # Find SQLite database files
         db_patterns = ["*.db", "*.sqlite", "*.sqlite3"]
         for pattern in db_patterns:
-            for db_file in self.project_root.rglob(pattern):
+            for db_file in self.file_index.rglob(pattern):
                 try:
                     db_info = self._analyze_sqlite_file(db_file)
                     if db_info:
@@ -104,7 +144,7 @@ class DatabaseSchemaAnalysis:
         # Find SQL schema files
         sql_patterns = ["*.sql"]
         for pattern in sql_patterns:
-            for sql_file in self.project_root.rglob(pattern):
+            for sql_file in self.file_index.rglob(pattern):
                 try:
                     schema_info = self._analyze_sql_schema_file(sql_file)
                     if schema_info:
@@ -258,7 +298,7 @@ class DatabaseSchemaAnalysis:
             line = line.rstrip(',')
             
             # Check if it's a constraint
-            if any(constraint in line.upper() for constraint in ['PRIMARY KEY', 'FOREIGN KEY', 'UNIQUE', 'CHECK']):
+            if TABLE_CONSTRAINT_RE.search(line):
                 table_info["constraints"].append(line)
             else:
                 # Parse column definition
@@ -320,7 +360,7 @@ class DatabaseSchemaAnalysis:
         ]
         
         for pattern in pg_patterns:
-            for file_path in self.project_root.rglob(pattern):
+            for file_path in self.file_index.rglob(pattern):
                 if self._is_postgresql_file(file_path):
                     schema_info = self._analyze_sql_schema_file(file_path)
                     if schema_info:
@@ -343,7 +383,7 @@ class DatabaseSchemaAnalysis:
         ]
         
         for pattern in mysql_patterns:
-            for file_path in self.project_root.rglob(pattern):
+            for file_path in self.file_index.rglob(pattern):
                 if self._is_mysql_file(file_path):
                     schema_info = self._analyze_sql_schema_file(file_path)
                     if schema_info:
@@ -362,7 +402,7 @@ class DatabaseSchemaAnalysis:
         mongo_patterns = ["*.js", "*.json", "*.ts"]
         
         for pattern in mongo_patterns:
-            for file_path in self.project_root.rglob(pattern):
+            for file_path in self.file_index.rglob(pattern):
                 mongo_schemas = self._extract_mongodb_schemas(file_path)
                 if mongo_schemas:
                     mongo_analysis["schema_files"].append({
@@ -380,7 +420,7 @@ class DatabaseSchemaAnalysis:
         }
         
         # Look for Django models.py files
-        for models_file in self.project_root.rglob("models.py"):
+        for models_file in self.file_index.rglob("models.py"):
             models_info = self._extract_django_models(models_file)
             if models_info:
                 django_analysis["model_files"].append(models_info)
@@ -395,7 +435,7 @@ class DatabaseSchemaAnalysis:
         }
         
         # Look for SQLAlchemy model patterns
-        for py_file in self.project_root.rglob("*.py"):
+        for py_file in self.file_index.rglob("*.py"):
             models_info = self._extract_sqlalchemy_models(py_file)
             if models_info:
                 sqlalchemy_analysis["model_files"].append(models_info)
@@ -406,11 +446,7 @@ class DatabaseSchemaAnalysis:
         """Check if file contains PostgreSQL-specific syntax."""
         try:
             content = file_path.read_text(encoding='utf-8', errors='ignore')
-            pg_indicators = [
-                'SERIAL', 'BIGSERIAL', 'UUID', 'JSONB', 'ARRAY',
-                'pg_dump', 'CREATE SCHEMA', 'SET search_path'
-            ]
-            return any(indicator in content.upper() for indicator in pg_indicators)
+            return PG_INDICATOR_RE.search(content) is not None
         except:
             return False
     
@@ -418,11 +454,7 @@ class DatabaseSchemaAnalysis:
         """Check if file contains MySQL-specific syntax."""
         try:
             content = file_path.read_text(encoding='utf-8', errors='ignore')
-            mysql_indicators = [
-                'AUTO_INCREMENT', 'ENGINE=InnoDB', 'ENGINE=MyISAM',
-                'CHARSET=utf8', 'mysqldump'
-            ]
-            return any(indicator in content for indicator in mysql_indicators)
+            return MYSQL_INDICATOR_RE.search(content) is not None
         except:
             return False
     
@@ -465,8 +497,15 @@ class DatabaseSchemaAnalysis:
                                 if "columns" in table:
                                     summary["total_columns"] += len(table["columns"])
                 
+                if "model_files" in db_data:
+                    for model_file in db_data["model_files"]:
+                        summary["total_models"] += len(model_file.get("models", []))
+                
                 if db_data:  # If there's any data for this database type
                     summary["database_types"].append(db_type)
+        
+        # Tables and ORM models together, so callers need not add them up
+        summary["total_objects"] = summary["total_tables"] + summary["total_models"]
     
     def analyze_specific_table(self, table_name: str, database_type: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -7,6 +7,7 @@ Python packages, system requirements, and inter-module dependencies.
 """
 
 import ast
+import heapq
 import json
 import os
 import re
@@ -492,10 +493,11 @@ class DependencyAnalyzer:
         total_dependencies = sum(len(deps) for deps in dependency_graph.values())
         
         # Find modules with most dependencies
-        most_dependent = sorted(
-            [(module, len(deps)) for module, deps in dependency_graph.items()],
-            key=lambda x: x[1], reverse=True
-        )[:10]
+        most_dependent = heapq.nlargest(
+            10,
+            ((module, len(deps)) for module, deps in dependency_graph.items()),
+            key=lambda x: x[1]
+        )
         
         # Find modules that are most depended upon
         dependency_count = {}
@@ -503,10 +505,7 @@ class DependencyAnalyzer:
             for dep in deps:
                 dependency_count[dep] = dependency_count.get(dep, 0) + 1
         
-        most_depended_upon = sorted(
-            dependency_count.items(),
-            key=lambda x: x[1], reverse=True
-        )[:10]
+        most_depended_upon = heapq.nlargest(10, dependency_count.items(), key=lambda x: x[1])
         
         return {
             "total_modules": total_modules,
@@ -6,6 +6,7 @@ import os
 import json
 import yaml
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import re
@@ -24,17 +25,21 @@ class DockerAnalyzer:
         Returns:
             Dict containing Docker system info, containers, images, and compose files.
         """
-        docker_info = {
-            "system_info": self._get_docker_system_info(),
-            "containers": self._get_docker_containers(),
-            "images": self._get_docker_images(),
-            "compose_files": self._find_compose_files(),
-            "dockerfiles": self._find_dockerfiles(),
-            "networks": self._get_docker_networks(),
-            "volumes": self._get_docker_volumes(),
-            "summary": {}
+        collectors = {
+            "system_info": self._get_docker_system_info,
+            "containers": self._get_docker_containers,
+            "images": self._get_docker_images,
+            "compose_files": self._find_compose_files,
+            "dockerfiles": self._find_dockerfiles,
+            "networks": self._get_docker_networks,
+            "volumes": self._get_docker_volumes
         }
         
+        # The docker CLI calls and file scans are independent, so overlap their waits
+        with ThreadPoolExecutor(max_workers=len(collectors)) as executor:
+            futures = {key: executor.submit(collector) for key, collector in collectors.items()}
+            docker_info = {key: future.result() for key, future in futures.items()}
+        
         # Generate summary
         docker_info["summary"] = {
             "docker_available": docker_info["system_info"].get("available", False),
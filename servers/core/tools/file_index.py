@@ -0,0 +1,85 @@
+"""
+Shared File Index for Biting Lip MCP Server.
+
+Several analyzers look for files by name pattern across the whole project. This
+index walks the tree once and answers every pattern from that listing, instead
+of each analyzer running its own Path.rglob walk per pattern.
+"""
+
+import fnmatch
+import functools
+import os
+import re
+import threading
+import time
+from pathlib import Path, PurePath
+from typing import Callable, Iterator, List, Tuple
+
+# Directories that never hold files the analyzers look for
+PRUNED_DIRS = frozenset({'.git'})
+
+# How long a directory walk is reused before the tree is walked again
+INDEX_TTL_SECONDS = float(os.getenv("FILE_INDEX_TTL_SECONDS", "30"))
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_pattern(pattern: str) -> Tuple[bool, Callable]:
+    """Compile an rglob-style pattern into (matches_full_path, matcher)."""
+    while pattern.startswith("**/"):
+        pattern = pattern[3:]
+    if "/" in pattern:
+        return True, lambda rel_path: PurePath(rel_path).match(pattern)
+    return False, re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+
+
+class FileIndex:
+    """Cached listing of every file under a project root."""
+
+    def __init__(self, root: str, ttl_seconds: float = INDEX_TTL_SECONDS):
+        self.root = Path(root)
+        self.ttl_seconds = ttl_seconds
+        self._files: List[Tuple[str, str, str]] = []
+        self._expires = 0.0
+        self._lock = threading.Lock()
+
+    def _walk(self) -> List[Tuple[str, str, str]]:
+        """Walk the tree, returning (full path, relative path, normalized name) per file."""
+        files = []
+        root = str(self.root)
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d not in PRUNED_DIRS]
+            rel_dir = os.path.relpath(dirpath, root)
+            for name in filenames:
+                rel_path = name if rel_dir == "." else os.path.join(rel_dir, name)
+                files.append((os.path.join(dirpath, name), rel_path, os.path.normcase(name)))
+        return files
+
+    def _entries(self) -> List[Tuple[str, str, str]]:
+        """Return the current listing, walking the tree again once it has expired."""
+        with self._lock:
+            if time.monotonic() >= self._expires:
+                self._files = self._walk()
+                self._expires = time.monotonic() + self.ttl_seconds
+            return self._files
+
+    def rglob(self, pattern: str) -> Iterator[Path]:
+        """Yield indexed files matching a Path.rglob-style pattern."""
+        matches_full_path, matcher = _compile_pattern(pattern)
+        for full_path, rel_path, name in self._entries():
+            if matcher(rel_path if matches_full_path else name):
+                yield Path(full_path)
+
+    def invalidate(self) -> None:
+        """Force the next lookup to walk the tree again."""
+        with self._lock:
+            self._expires = 0.0
+
+
+@functools.lru_cache(maxsize=None)
+def _get_file_index(root: str) -> FileIndex:
+    return FileIndex(root)
+
+
+def get_file_index(root) -> FileIndex:
+    """Return the index shared by every analyzer working under root."""
+    return _get_file_index(str(Path(root)))
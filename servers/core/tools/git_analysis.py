@@ -7,6 +7,7 @@ branch information, commit history, and project status.
 """
 
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
@@ -66,10 +67,16 @@ class GitAnalyzer:
     
     def _get_all_git_info(self) -> Dict[str, Any]:
         """Get comprehensive git repository information."""
-        status = self._get_git_status()
-        branches = self._get_branch_info()
-        commits = self._get_commit_history(limit=10)
-        remote = self._get_remote_info()
+        # Each section shells out to git independently, so run them side by side
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            status_future = executor.submit(self._get_git_status)
+            branches_future = executor.submit(self._get_branch_info)
+            commits_future = executor.submit(self._get_commit_history, 10)
+            remote_future = executor.submit(self._get_remote_info)
+            status = status_future.result()
+            branches = branches_future.result()
+            commits = commits_future.result()
+            remote = remote_future.result()
         
         return {
             "is_git_repo": True,
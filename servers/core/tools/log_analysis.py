@@ -6,32 +6,147 @@ and security events across different log formats and sources.
 """
 
 import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Union
 import logging
 from collections import defaultdict, Counter
 
+from .file_index import get_file_index
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Log files analyzed at the same time within one analyze_logs call
+ANALYSIS_WORKERS = max(1, int(os.getenv("CONCURRENT_ANALYSIS_LIMIT", "5")))
+
+# C-backed JSON decoding for json-format logs when orjson is installed
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Directory names skipped while collecting log files
+EXCLUDED_DIRS = frozenset({
+    'node_modules', '.git', '__pycache__', '.pytest_cache', 'venv', 'env', 
+    '.venv', '.env', 'build', 'dist', '.tox', 'site-packages', '.mypy_cache',
+    '.cache', 'coverage', '.next'
+})
+
+# Severity names grouped the way the counters report them
+ERROR_LEVELS = frozenset({"error", "err", "fatal", "critical"})
+WARNING_LEVELS = frozenset({"warning", "warn"})
+INFO_LEVELS = frozenset({"info", "information"})
+
+# JSON log keys mapped onto entry fields rather than kept as extras
+JSON_ENTRY_KEYS = frozenset({
+    "timestamp", "time", "@timestamp", "level", "severity", "message", "msg", "source", "logger"
+})
+
+# File-name hints for each log type accepted by analyze_logs(log_type=...)
+LOG_TYPE_PATTERNS = {
+    "error": ("error", "err", "exception"),
+    "access": ("access", "request", "http"),
+    "application": ("app", "application", "debug"),
+    "system": ("system", "sys", "syslog")
+}
+
+
+def _python_log_fields(m: "re.Match[str]") -> Dict[str, Any]:
+    """Fields of a Python logging line: time - source - level - message."""
+    return {
+        "timestamp": m.group(1),
+        "source": m.group(2).strip(),
+        "level": m.group(3).strip(),
+        "message": m.group(4).strip()
+    }
+
+
+def _apache_log_fields(m: "re.Match[str]") -> Dict[str, Any]:
+    """Fields of an Apache access line; 4xx/5xx statuses count as errors."""
+    status = int(m.group(6))
+    return {
+        "ip": m.group(1),
+        "timestamp": m.group(2),
+        "method": m.group(3),
+        "url": m.group(4),
+        "protocol": m.group(5),
+        "status": status,
+        "size": m.group(7),
+        "level": "info" if status < 400 else "error"
+    }
+
+
+def _nginx_log_fields(m: "re.Match[str]") -> Dict[str, Any]:
+    """Fields of an nginx error log line."""
+    return {
+        "timestamp": m.group(1),
+        "level": m.group(2),
+        "message": m.group(3)
+    }
+
+
+# Compiled line pattern and field extractor for each structured log format
+LOG_LINE_FORMATS = {
+    "python": (
+        re.compile(r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}(?:,\d{3})?)\s*-\s*([^-]+)\s*-\s*(\w+)\s*-\s*(.+)$'),
+        _python_log_fields
+    ),
+    "apache": (
+        re.compile(r'^(\S+) \S+ \S+ \[([^\]]+)\] "(\S+) (\S+) (\S+)" (\d+) (\S+)'),
+        _apache_log_fields
+    ),
+    "nginx": (
+        re.compile(r'^(\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2}) \[(\w+)\] (.+)'),
+        _nginx_log_fields
+    )
+}
+
+# Format signatures looked for in the first lines of a log file
+APACHE_SIGNATURE = re.compile(r'\d+\.\d+\.\d+\.\d+ - - \[')
+NGINX_SIGNATURE = re.compile(r'^\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2}')
+PYTHON_SIGNATURE = re.compile(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}')
+LEVEL_SIGNATURE = re.compile(r'DEBUG|INFO|WARNING|ERROR|CRITICAL')
+HTTP_METHOD_SIGNATURE = re.compile(r'GET|POST|PUT|DELETE|HEAD|OPTIONS')
+
+# Fields picked out of lines that match no structured format
+TIMESTAMP_PATTERNS = (
+    re.compile(r'(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d{3})?)'),
+    re.compile(r'(\d{2}/\w{3}/\d{4}:\d{2}:\d{2}:\d{2})'),
+    re.compile(r'(\w{3} \d{2} \d{2}:\d{2}:\d{2})')
+)
+LEVEL_PATTERN = re.compile(r'\b(DEBUG|INFO|WARN|WARNING|ERROR|FATAL|CRITICAL|TRACE)\b', re.IGNORECASE)
+
+# Variable parts of error messages replaced when grouping them into patterns
+NUMBER_PATTERN = re.compile(r'\d+')
+HASH_PATTERN = re.compile(r'[a-f0-9]{8,}')
+IP_PATTERN = re.compile(r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b')
+
+RESPONSE_TIME_PATTERNS = (
+    re.compile(r'(\d+(?:\.\d+)?)ms'),
+    re.compile(r'(\d+(?:\.\d+)?)s'),
+    re.compile(r'time=(\d+(?:\.\d+)?)'),
+    re.compile(r'duration=(\d+(?:\.\d+)?)')
+)
+
 
 class LogAnalysis:
     """Analyzes application logs and patterns."""
     
     def __init__(self, project_root: str):
         self.project_root = Path(project_root)
+        self.file_index = get_file_index(project_root)
         
     def _get_filtered_files(self, pattern: str):
         """Get files matching pattern excluding common irrelevant directories."""
-        excluded_dirs = {
-            'node_modules', '.git', '__pycache__', '.pytest_cache', 'venv', 'env', 
-            '.venv', '.env', 'build', 'dist', '.tox', 'site-packages', '.mypy_cache',
-            '.cache', 'coverage', '.next'
-        }
-        
-        for file_path in self.project_root.rglob(pattern):
-            if all(excluded_dir not in file_path.parts for excluded_dir in excluded_dirs):
+        for file_path in self.file_index.rglob(pattern):
+            if EXCLUDED_DIRS.isdisjoint(file_path.parts):
                 yield file_path
         
     def analyze_logs(self, log_type: Optional[str] = None, time_range: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
@@ -70,12 +185,18 @@ class LogAnalysis:
                 }
             }
             
-            # Find and analyze log files
+            # Find and analyze log files; per-file work is independent, so overlap the reads
             log_files = self._find_log_files()
             
-            for log_file in log_files:
+            with ThreadPoolExecutor(max_workers=ANALYSIS_WORKERS) as executor:
+                log_results = list(executor.map(
+                    lambda log_file: self._analyze_log_file(log_file, log_type, time_range),
+                    log_files
+                ))
+            
+            for log_file, log_data in zip(log_files, log_results):
                 try:
-                    if log_data := self._analyze_log_file(log_file, log_type, time_range):
+                    if log_data:
                         file_key = str(log_file.relative_to(self.project_root))
                         analysis["logs"][file_key] = log_data
                         
@@ -134,15 +255,21 @@ class LogAnalysis:
         
         return list(set(log_files))  # Remove duplicates
     
-    def _sample_log_file(self, log_file: Path, max_lines: int = 1000) -> List[str]:
+    def _stream_log_lines(self, log_file: Path) -> Iterator[str]:
+        """Yield a log file's lines lazily so parsing can stop once it has enough entries."""
+        with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
+            for line in f:
+                yield line.rstrip('\r\n')
+    
+    def _sample_log_file(self, log_file: Path, max_lines: int = 1000) -> Iterable[str]:
         """Sample a large log file to analyze a portion of it."""
         try:
             # Get file size
             file_size = log_file.stat().st_size
             
-            # For small files, just read everything
+            # For small files, stream everything
             if file_size < 1 * 1024 * 1024:  # 1MB
-                return log_file.read_text(encoding='utf-8', errors='ignore').splitlines()
+                return self._stream_log_lines(log_file)
                 
             # For large files, sample from beginning, middle and end
             lines = []
@@ -216,17 +343,23 @@ class LogAnalysis:
             # Parse log entries
             entries = self._parse_log_entries(log_file, log_format, time_range)
             
-            # Analyze entries
+            # Analyze entries, gathering what the pattern and time-range passes need on the way
+            error_messages = []
+            timestamps = []
             for entry in entries:
                 log_data["entry_count"] += 1
                 
+                if (timestamp := entry.get("timestamp")):
+                    timestamps.append(timestamp)
+                
                 # Count by severity
                 severity = entry.get("level", "unknown").lower()
-                if severity in ["error", "err", "fatal", "critical"]:
+                if severity in ERROR_LEVELS:
                     log_data["error_count"] += 1
-                elif severity in ["warning", "warn"]:
+                    error_messages.append(entry.get("message", ""))
+                elif severity in WARNING_LEVELS:
                     log_data["warning_count"] += 1
-                elif severity in ["info", "information"]:
+                elif severity in INFO_LEVELS:
                     log_data["info_count"] += 1
                 
                 # Collect entry for detailed analysis
@@ -234,9 +367,9 @@ class LogAnalysis:
                     log_data["entries"].append(entry)
             
             # Analyze patterns and metrics
-            self._analyze_error_patterns(entries, log_data)
+            self._analyze_error_patterns(error_messages, log_data)
             self._analyze_performance_metrics(entries, log_data)
-            self._calculate_entry_time_range(entries, log_data)
+            self._calculate_entry_time_range(timestamps, log_data)
             
             return log_data
             
@@ -256,17 +389,17 @@ class LogAnalysis:
             # Check for common log formats
             if any('combined' in line.lower() or 'common' in line.lower() for line in sample_lines):
                 return "apache"
-            elif re.search(r'\d+\.\d+\.\d+\.\d+ - - \[', content):
+            elif APACHE_SIGNATURE.search(content):
                 return "apache"
-            elif re.search(r'^\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2}', content):
+            elif NGINX_SIGNATURE.search(content):
                 return "nginx"
-            elif re.search(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}', content):
+            elif PYTHON_SIGNATURE.search(content):
                 return "python"
             elif content.strip().startswith('{') and content.strip().endswith('}'):
                 return "json"            
-            elif re.search(r'DEBUG|INFO|WARNING|ERROR|CRITICAL', content):
+            elif LEVEL_SIGNATURE.search(content):
                 return "python"
-            elif re.search(r'GET|POST|PUT|DELETE|HEAD|OPTIONS', content):
+            elif HTTP_METHOD_SIGNATURE.search(content):
                 return "access"
             else:
                 return "generic"
@@ -278,15 +411,8 @@ class LogAnalysis:
         """Check if log file matches the specified type."""
         file_name = log_file.name.lower()
         
-        type_patterns = {
-            "error": ["error", "err", "exception"],
-            "access": ["access", "request", "http"],
-            "application": ["app", "application", "debug"],
-            "system": ["system", "sys", "syslog"]
-        }
-        
-        if log_type.lower() in type_patterns:
-            patterns = type_patterns[log_type.lower()]
+        patterns = LOG_TYPE_PATTERNS.get(log_type.lower())
+        if patterns is not None:
             return any(pattern in file_name for pattern in patterns)
         
         return True  # If unknown type, include all
@@ -334,68 +460,27 @@ class LogAnalysis:
         try:
             if log_format == "json":
                 if (data := self._try_parse_json(line)):
-                    entry = entry | {
-                        "timestamp": data.get("timestamp") or data.get("time") or data.get("@timestamp"),
-                        "level": data.get("level") or data.get("severity"),
-                        "message": data.get("message") or data.get("msg"),
-                        "source": data.get("source") or data.get("logger"),
-                        "extra": {k: v for k, v in data.items()
-                                  if k not in ["timestamp", "time", "@timestamp", "level", "severity", "message", "msg", "source", "logger"]}
-                    }
+                    get = data.get
+                    entry["timestamp"] = get("timestamp") or get("time") or get("@timestamp")
+                    entry["level"] = get("level") or get("severity")
+                    entry["message"] = get("message") or get("msg")
+                    entry["source"] = get("source") or get("logger")
+                    entry["extra"] = {k: v for k, v in data.items() if k not in JSON_ENTRY_KEYS}
                     return entry
 
-            patterns = {
-                "python": (
-                    r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}(?:,\d{3})?)\s*-\s*([^-]+)\s*-\s*(\w+)\s*-\s*(.+)$',
-                    lambda m: {
-                        "timestamp": m.group(1),
-                        "source": m.group(2).strip(),
-                        "level": m.group(3).strip(),
-                        "message": m.group(4).strip()
-                    }
-                ),
-                "apache": (
-                    r'^(\S+) \S+ \S+ \[([^\]]+)\] "(\S+) (\S+) (\S+)" (\d+) (\S+)',
-                    lambda m: {
-                        "ip": m.group(1),
-                        "timestamp": m.group(2),
-                        "method": m.group(3),
-                        "url": m.group(4),
-                        "protocol": m.group(5),
-                        "status": int(m.group(6)),
-                        "size": m.group(7),
-                        "level": "info" if int(m.group(6)) < 400 else "error"
-                    }
-                ),
-                "nginx": (
-                    r'^(\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2}) \[(\w+)\] (.+)',
-                    lambda m: {
-                        "timestamp": m.group(1),
-                        "level": m.group(2),
-                        "message": m.group(3)
-                    }
-                )
-            }
-
-            if log_format in patterns:
-                pattern, updater = patterns[log_format]
-                if (match := re.match(pattern, line)):
-                    entry.update(updater(match))
+            if log_format in LOG_LINE_FORMATS:
+                pattern, extract_fields = LOG_LINE_FORMATS[log_format]
+                if (match := pattern.match(line)):
+                    entry.update(extract_fields(match))
                     return entry
 
             # Generic parsing - look for common patterns
-            timestamp_patterns = [
-                r'(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d{3})?)',
-                r'(\d{2}/\w{3}/\d{4}:\d{2}:\d{2}:\d{2})',
-                r'(\w{3} \d{2} \d{2}:\d{2}:\d{2})'
-            ]
-            for pattern in timestamp_patterns:
-                if (match := re.search(pattern, line)):
+            for pattern in TIMESTAMP_PATTERNS:
+                if (match := pattern.search(line)):
                     entry["timestamp"] = match.group(1)
                     break
 
-            level_pattern = r'\b(DEBUG|INFO|WARN|WARNING|ERROR|FATAL|CRITICAL|TRACE)\b'
-            if (level_match := re.search(level_pattern, line, re.IGNORECASE)):
+            if (level_match := LEVEL_PATTERN.search(line)):
                 entry["level"] = level_match.group(1).upper()
 
             return entry
@@ -405,11 +490,12 @@ class LogAnalysis:
             return entry  # Return basic entry even if parsing fails
 
     def _try_parse_json(self, line: str) -> Optional[dict]:
-        """Try to parse a line as JSON, suppressing errors."""
-        from contextlib import suppress
-        with suppress(Exception):
-            return json.loads(line)
-        return None
+        """Try to parse a line as a JSON object, suppressing errors."""
+        try:
+            data = _json_loads(line)
+        except ValueError:
+            return None
+        return data if isinstance(data, dict) else None
     
     def _entry_in_time_range(self, entry: Dict[str, Any], time_range: Dict[str, str]) -> bool:
         """Check if log entry falls within specified time range."""
@@ -428,23 +514,17 @@ class LogAnalysis:
         except Exception:
             return True  # Include entries if time parsing fails
     
-    def _analyze_error_patterns(self, entries: List[Dict[str, Any]], log_data: Dict[str, Any]) -> None:
-        """Analyze error patterns in log entries."""
-        error_messages = [
-            entry.get("message", "")
-            for entry in entries
-            if entry.get("level", "").lower() in ["error", "err", "fatal", "critical"]
-        ]
-        
+    def _analyze_error_patterns(self, error_messages: List[str], log_data: Dict[str, Any]) -> None:
+        """Analyze error patterns in the messages of error-level log entries."""
         # Find common error patterns
         pattern_counts = Counter()
         
         for message in error_messages:
             # Extract patterns (simplified - would use more sophisticated pattern recognition)
             # Remove specific values like IDs, timestamps, etc.
-            pattern = re.sub(r'\d+', 'N', message)
-            pattern = re.sub(r'[a-f0-9]{8,}', 'HASH', pattern)
-            pattern = re.sub(r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b', 'IP', pattern)
+            pattern = NUMBER_PATTERN.sub('N', message)
+            pattern = HASH_PATTERN.sub('HASH', pattern)
+            pattern = IP_PATTERN.sub('IP', pattern)
             
             pattern_counts[pattern] += 1
         
@@ -464,15 +544,8 @@ class LogAnalysis:
             message = entry.get("message", "")
             
             # Look for response time patterns
-            time_patterns = [
-                r'(\d+(?:\.\d+)?)ms',
-                r'(\d+(?:\.\d+)?)s',
-                r'time=(\d+(?:\.\d+)?)',
-                r'duration=(\d+(?:\.\d+)?)'
-            ]
-            
-            for pattern in time_patterns:
-                if (match := re.search(pattern, message)):
+            for pattern in RESPONSE_TIME_PATTERNS:
+                if (match := pattern.search(message)):
                     try:
                         time_value = float(match[1])
                         response_times.append(time_value)
@@ -496,10 +569,8 @@ class LogAnalysis:
         if status_codes:
             log_data["status_code_distribution"] = dict(status_codes.most_common(10))
     
-    def _calculate_entry_time_range(self, entries: List[Dict[str, Any]], log_data: Dict[str, Any]) -> None:
-        """Calculate time range of log entries."""
-        timestamps = [ts for entry in entries if (ts := entry.get("timestamp"))]
-        
+    def _calculate_entry_time_range(self, timestamps: List[str], log_data: Dict[str, Any]) -> None:
+        """Calculate time range from the timestamps of log entries."""
         if timestamps:
             log_data["time_range"] = {
                 "start": min(timestamps),
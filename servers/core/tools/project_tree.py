@@ -6,7 +6,7 @@ Provides functionality to visualize project directory structures.
 import os
 import fnmatch
 from contextlib import suppress
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 
 class ProjectTreeGenerator:
@@ -48,11 +48,11 @@ class ProjectTreeGenerator:
                             patterns.append(line.rstrip('/'))
         return patterns
         
-    def _build_tree(self, path: str, indent_prefix: str = '', 
-                   is_last_item: bool = True, current_depth: int = 0) -> str:
-        """Build tree structure recursively."""
+    def _iter_tree(self, path: str, indent_prefix: str = '', 
+                   is_last_item: bool = True, current_depth: int = 0) -> Iterator[str]:
+        """Yield the tree lines below path, recursing depth-first."""
         if self.max_depth and current_depth >= self.max_depth:
-            return ""
+            return
             
         # Load .gitignore patterns
         gitignore_patterns = self._load_gitignore_patterns(path)
@@ -61,9 +61,8 @@ class ProjectTreeGenerator:
             items = sorted(os.listdir(path), 
                           key=lambda x: (not os.path.isdir(os.path.join(path, x)), x.lower()))
         except OSError as e:
-            return f"Error accessing {path}: {e}\n"
-            
-        tree_output = ""
+            yield f"Error accessing {path}: {e}\n"
+            return
         
         for i, item_name in enumerate(items):
             item_path = os.path.join(path, item_name)
@@ -90,29 +89,29 @@ class ProjectTreeGenerator:
             elif os.path.isfile(item_path) and item_name.lower().endswith(self.runnable_exts):
                 marker = " [executable]"
                 
-            tree_output += f"{line_prefix}{item_name}{marker}\n"
+            yield f"{line_prefix}{item_name}{marker}\n"
             
             # Recurse into directories
             if os.path.isdir(item_path):
-                tree_output += self._build_tree(item_path, child_indent_prefix, 
-                                              is_last, current_depth + 1)
-                
-        return tree_output
+                yield from self._iter_tree(item_path, child_indent_prefix, 
+                                           is_last, current_depth + 1)
+    
+    def iter_lines(self) -> Iterator[str]:
+        """Yield the project tree line by line, without building the whole text."""
+        # Start with root directory name
+        root_name = os.path.basename(self.root_path) or self.root_path
+        yield f"{root_name}\n"
+        
+        # Generate tree structure
+        yield from self._iter_tree(self.root_path)
         
     def generate(self) -> str:
         """Generate the complete project tree."""
         if not os.path.exists(self.root_path):
             return f"Error: Path '{self.root_path}' does not exist."
             
-        # Start with root directory name
-        root_name = os.path.basename(self.root_path) or self.root_path
-        tree_output = f"{root_name}\n"
-        
-        # Generate tree structure
-        tree_output += self._build_tree(self.root_path)
-        
-        return tree_output
-
+        # One join instead of concatenating every subtree into its parent's string
+        return "".join(self.iter_lines())
 
 def generate_project_tree(root_path: str, ignore_patterns: Optional[List[str]] = None,
                          max_depth: Optional[int] = None) -> str:
@@ -0,0 +1,361 @@
+"""
+Shared stdio transport for the Biting Lip MCP servers.
+
+Message framing, response batching, argument validation and the request loop are
+the same for every server. Each server.py supplies its tool catalog and a server
+object with handle_initialize and handle_call_tool, then hands both to serve().
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    fastjsonschema = None
+    FASTJSONSCHEMA_AVAILABLE = False
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    uvloop = None
+    UVLOOP_AVAILABLE = False
+
+logger = logging.getLogger("biting_lip.mcp")
+
+# Just acknowledge the initialized notification (sent under either name)
+NOOP_NOTIFICATIONS = frozenset({"initialized", "notifications/initialized"})
+
+# Requests handled at once before the server stops reading stdin
+MAX_CONCURRENT_REQUESTS = 32
+
+# Threads shared by every blocking tool call (and the fallback stdin reader)
+BLOCKING_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Every response starts the same way, so only the id and the payload are encoded per call
+JSONRPC_PREFIX = b'{"jsonrpc":"2.0","id":'
+
+# Encoded response lines waiting for the stdout writer task, and how many it writes at once
+_outgoing: "asyncio.Queue[bytes]" = asyncio.Queue()
+MAX_WRITE_BATCH = 64
+
+# Set once the client frames requests with Content-Length headers instead of newlines
+_content_length_framing = False
+
+# Longest JSON-RPC line accepted from stdin (tool arguments can carry whole diffs or files)
+MAX_MESSAGE_BYTES = 64 * 1024 * 1024
+
+
+# Tool results go out compact; MCP_PRETTY=true indents them for reading raw protocol traffic
+PRETTY_RESULTS = os.getenv("MCP_PRETTY", "false").lower() == "true"
+
+
+def result_text(data: Any) -> str:
+    """Serialize a tool result for its text content block, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if PRETTY_RESULTS else 0)
+        return orjson.dumps(data, default=str, option=option).decode()
+    if PRETTY_RESULTS:
+        return json.dumps(data, indent=2, default=str)
+    return json.dumps(data, separators=(",", ":"), default=str)
+
+
+def loads_message(line: bytes) -> Dict[str, Any]:
+    """Parse one JSON-RPC message read from stdin."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def encode_json(data: Any) -> bytes:
+    """Encode data as compact UTF-8 JSON."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+PONG_JSON = encode_json({"status": "pong"})
+
+
+def _write_response(request_id: Any, member: bytes, payload_json: bytes) -> None:
+    """Queue one response built from the shared prefix, the encoded id and the encoded payload."""
+    _outgoing.put_nowait(b"".join((JSONRPC_PREFIX, encode_json(request_id), member, payload_json, b"}")))
+
+
+def _frame(message: bytes) -> bytes:
+    """Frame a response the same way the client frames its requests."""
+    if _content_length_framing:
+        return b"Content-Length: %d\r\n\r\n%s" % (len(message), message)
+    return message + b"\n"
+
+
+async def write_responses() -> None:
+    """Write queued responses to stdout, joining whatever is waiting into one write and flush."""
+    stdout = sys.stdout.buffer
+    get, get_nowait, empty = _outgoing.get, _outgoing.get_nowait, _outgoing.empty
+    while True:
+        batch = [await get()]
+        while len(batch) < MAX_WRITE_BATCH and not empty():
+            batch.append(get_nowait())
+        try:
+            stdout.write(b"".join(map(_frame, batch)))
+            stdout.flush()
+        except OSError as e:
+            # The client has gone away; keep draining so shutdown does not wait forever
+            logger.error("Failed to write responses: %s", e)
+        finally:
+            for _ in batch:
+                _outgoing.task_done()
+
+
+def write_encoded_result(request_id: Any, result_json: bytes) -> None:
+    """Queue a JSON-RPC success response whose result is already encoded JSON."""
+    _write_response(request_id, b',"result":', result_json)
+
+
+def write_error(request_id: Any, code: int, message: str) -> None:
+    """Queue a JSON-RPC error response."""
+    _write_response(request_id, b',"error":', encode_json({"code": code, "message": message}))
+
+
+class FramingError(ValueError):
+    """Raised when a Content-Length header gives a length the server cannot read."""
+
+
+async def read_message(reader: asyncio.StreamReader) -> bytes:
+    """Read one JSON-RPC message from stdin, or b"" at end of input.
+    
+    Messages are newline-delimited unless the client sends LSP-style Content-Length
+    headers, in which case the body is read in one piece and replies are framed the same way.
+    Raises FramingError, after consuming the headers, for a length that is not a number or
+    is over MAX_MESSAGE_BYTES; an oversized body is discarded so the next frame still lines up.
+    """
+    global _content_length_framing
+    line = await reader.readline()
+    if line[:15].lower() != b"content-length:":
+        return line
+    # Skip any other headers up to the blank line that ends them
+    while (await reader.readline()).strip():
+        pass
+    _content_length_framing = True
+    try:
+        length = int(line[15:])
+    except ValueError:
+        raise FramingError(f"invalid Content-Length header: {line.strip()[:64].decode(errors='replace')}") from None
+    if length < 0:
+        raise FramingError(f"invalid Content-Length header: {length}")
+    if length > MAX_MESSAGE_BYTES:
+        remaining = length
+        while remaining:
+            chunk = await reader.read(min(remaining, 1 << 16))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+        raise FramingError(f"message of {length} bytes is over the {MAX_MESSAGE_BYTES} byte limit")
+    return await reader.readexactly(length)
+
+
+async def open_stdin_reader() -> Optional[asyncio.StreamReader]:
+    """Attach stdin to the event loop, or return None where the loop cannot watch it.
+    
+    Pipes work everywhere; redirected files and some Windows consoles do not.
+    """
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=MAX_MESSAGE_BYTES)
+    try:
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    except (NotImplementedError, OSError, ValueError):
+        return None
+    return reader
+
+
+class UnknownToolError(KeyError):
+    """Raised when a tool call names a tool this server does not provide."""
+
+
+class InvalidArgumentsError(ValueError):
+    """Raised when tool arguments do not match the tool's input schema."""
+
+
+def compile_argument_validator(schema: Optional[Dict[str, Any]]) -> Callable[[Dict[str, Any]], None]:
+    """Return a validator for a tool's input schema.
+    
+    Uses fastjsonschema when installed; otherwise only required arguments are checked.
+    """
+    if schema is None:
+        return lambda arguments: None
+    
+    if FASTJSONSCHEMA_AVAILABLE:
+        compiled = fastjsonschema.compile(schema)
+        
+        def validate(arguments: Dict[str, Any]) -> None:
+            try:
+                compiled(arguments)
+            except fastjsonschema.JsonSchemaException as e:
+                raise InvalidArgumentsError(str(e)) from e
+        return validate
+    
+    required = tuple(schema.get("required", ()))
+    # Tools that take one of several arguments list each alternative under anyOf
+    alternatives = tuple(tuple(option.get("required", ())) for option in schema.get("anyOf", ()))
+    
+    def validate(arguments: Dict[str, Any]) -> None:
+        missing = [key for key in required if key not in arguments]
+        if missing:
+            raise InvalidArgumentsError(f"missing required argument(s): {', '.join(missing)}")
+        if alternatives and not any(all(key in arguments for key in option) for option in alternatives):
+            expected = " or ".join(", ".join(option) for option in alternatives)
+            raise InvalidArgumentsError(f"missing required argument(s): {expected}")
+    return validate
+
+
+MethodHandler = Callable[[Dict[str, Any]], Awaitable[bytes]]
+
+
+def method_handlers(server: Any, tools_list: Dict[str, Any]) -> Dict[str, MethodHandler]:
+    """Map each JSON-RPC method to a handler returning its encoded result."""
+    # tools/list never changes, so its result is encoded once and spliced into each response
+    tools_list_json = encode_json(tools_list)
+    
+    async def tools_call(params: Dict[str, Any]) -> bytes:
+        return encode_json(await server.handle_call_tool(params.get("name"), params.get("arguments", {})))
+    
+    async def ping(params: Dict[str, Any]) -> bytes:
+        return PONG_JSON
+    
+    async def tools_list_handler(params: Dict[str, Any]) -> bytes:
+        return tools_list_json
+    
+    async def initialize(params: Dict[str, Any]) -> bytes:
+        return encode_json(await server.handle_initialize(params))
+    
+    return {
+        "tools/call": tools_call,
+        "ping": ping,
+        "tools/list": tools_list_handler,
+        "initialize": initialize
+    }
+
+
+async def handle_request(handlers: Dict[str, MethodHandler], method: Any, params: Dict[str, Any], request_id: Any) -> None:
+    """Handle one JSON-RPC message and write its response, if it expects one."""
+    handler = handlers.get(method) if isinstance(method, str) else None
+    if handler is None:
+        logger.warning("Unknown method: %s", method)
+        if request_id is not None:
+            write_error(request_id, -32601, f"Method not found: {method}")
+        return
+    
+    try:
+        result_json = await handler(params)
+        
+        # Send successful response (only for requests with id)
+        if request_id is not None:
+            write_encoded_result(request_id, result_json)
+    
+    except Exception as e:
+        logger.error("Error handling method %s: %s", method, e)
+        # Send error response (only for requests with id)
+        if request_id is not None:
+            write_error(request_id, -32603, str(e))
+
+
+async def serve(server: Any, tools_list: Dict[str, Any], blocking_workers: int = BLOCKING_WORKERS) -> None:
+    """Answer JSON-RPC requests from stdin until end of input."""
+    handlers = method_handlers(server, tools_list)
+    
+    # Read stdin on the event loop itself; fall back to a blocking read in a thread
+    reader = await open_stdin_reader()
+    loop = asyncio.get_running_loop()
+    # asyncio.to_thread runs on the default executor; size it for I/O-bound tool work
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=blocking_workers, thread_name_prefix="mcp-blocking"))
+    inflight = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    pending = set()
+    writer = asyncio.create_task(write_responses())
+    
+    # Bound once so the per-message path below uses locals instead of global/attribute lookups
+    create_task = asyncio.create_task
+    acquire_slot = inflight.acquire
+    release_slot = inflight.release
+    track = pending.add
+    untrack = pending.discard
+    loads = loads_message
+    log_debug = logger.debug
+    
+    while True:
+        try:
+            # Read a message from stdin
+            if reader is not None:
+                line = await read_message(reader)
+            else:
+                line = await loop.run_in_executor(None, sys.stdin.buffer.readline)
+            if not line:
+                break
+            
+            line = line.strip()
+            if not line:
+                continue
+            
+            # Parse the JSON-RPC message
+            try:
+                request = loads(line)
+            except json.JSONDecodeError as e:
+                logger.error("JSON decode error: %s for line: %s", e, line.decode(errors='replace'))
+                continue
+            
+            method = request.get("method")
+            params = request.get("params", {})
+            request_id = request.get("id")
+            
+            log_debug("Received method: %s", method)
+            
+            # Notifications that need no work and no reply are dropped before a task is started
+            if isinstance(method, str) and method in NOOP_NOTIFICATIONS:
+                continue
+            
+            # Handle requests concurrently so a slow tool call does not hold up the ones behind it
+            await acquire_slot()
+            task = create_task(handle_request(handlers, method, params, request_id))
+            track(task)
+            task.add_done_callback(untrack)
+            task.add_done_callback(lambda _: release_slot())
+        
+        except FramingError as e:
+            # The frame's id was never read, so the error goes out with a null id
+            logger.error("Framing error: %s", e)
+            write_error(None, -32600, str(e))
+        except Exception as e:
+            logger.error("Server error: %s", e)
+    
+    # Let requests still in flight at end of input finish and send their responses
+    if pending:
+        await asyncio.gather(*pending)
+    await _outgoing.join()
+    writer.cancel()
+
+
+def run(main: Awaitable[None]) -> None:
+    """Run a server's main coroutine to completion."""
+    # uvloop is a faster drop-in event loop where it is installed (it does not support Windows)
+    if hasattr(asyncio, "Runner"):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop if UVLOOP_AVAILABLE else None) as runner:
+            runner.run(main)
+        return
+    # asyncio.Runner is new in Python 3.11; older versions pick uvloop through the loop policy
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    asyncio.run(main)
@@ -9,21 +9,99 @@ management to enable true continuity in AI-human collaboration.
 
 import asyncio
 import json
+import logging
+import os
 import sys
-from pathlib import Path
-from typing import Any, Dict
+import time
+from functools import cache, cached_property
+from typing import Any, Callable, Dict
 
-# Add the current directory to the path for tool imports
-script_dir = Path(__file__).parent
-sys.path.insert(0, str(script_dir))
+try:
+    from .tool_catalog import TOOLS
+except ImportError:
+    from tool_catalog import TOOLS  # type: ignore
 
-# Import memory tools
-from tools.memory_mcp_tool import MemoryMCPTool  # type: ignore
+try:
+    from ..mcp_stdio import (InvalidArgumentsError, UnknownToolError, compile_argument_validator,
+                             result_text, run, serve)
+except ImportError:
+    # Run as a script: the shared transport sits one directory up, beside every server
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from mcp_stdio import (InvalidArgumentsError, UnknownToolError, compile_argument_validator,  # type: ignore
+                           result_text, run, serve)
 
+logger = logging.getLogger("biting_lip.memory")
 
+# Directory holding this server's tools package; it joins sys.path on the first tool import
+script_dir = os.path.dirname(os.path.abspath(__file__))
+_TOOLS_PATH_SET = False
+
+
+def _ensure_tools_on_path() -> None:
+    """Put this server's directory on sys.path so its tools package can be imported."""
+    global _TOOLS_PATH_SET
+    if not _TOOLS_PATH_SET:
+        if script_dir not in sys.path:
+            sys.path.insert(0, script_dir)
+        _TOOLS_PATH_SET = True
+
+# Read-only results reused for a short while (TTL in seconds); any other tool call may
+# change what they report, so it drops every cached result once it finishes. Memory
+# summaries, recalls and insights are already cached by the memory system itself.
+CACHE_ENABLED = os.getenv("CACHE_ENABLED", "true").lower() == "true"
+TOOL_CACHE_TTL_SECONDS = {
+    "get_project_context": 60.0,
+}
+
+# Threads shared by every blocking tool call (and the fallback stdin reader). Each memory
+# tool call holds a database connection, and the pool raises rather than waits once all
+# of them are out, so no more calls run at once than the pool has connections
+# (POOL_MAX_CONNECTIONS in tools/memory/database.py)
+DB_POOL_MAX_CONNECTIONS = 20
+BLOCKING_WORKERS = min(DB_POOL_MAX_CONNECTIONS, (os.cpu_count() or 1) * 4)
+
+
+@cache
 def get_project_root() -> str:
     """Get the Biting Lip project root directory (5 levels up from this file)."""
-    return str(Path(__file__).parent.parent.parent.parent.parent)
+    root = script_dir
+    for _ in range(4):
+        root = os.path.dirname(root)
+    return root
+
+
+# Tool catalog returned by tools/list; it is constant, so it is built once at import
+TOOLS_LIST = {"tools": TOOLS}
+
+# Tools served by the MemoryMCPTool method of the same name
+MEMORY_TOOL_METHODS = frozenset({
+    "store_memory",
+    "recall_memories",
+    "recall_memories_weighted",
+    "store_persona_memory",
+    "get_current_persona",
+    "generate_self_reflection",
+    "apply_forgetting_curve",
+    "get_persona_evolution_summary",
+    "reflect_on_interaction",
+    "get_memory_summary",
+    "get_emotional_insights",
+    "update_memory",
+    "cleanup_expired_memories",
+    "get_project_context",
+    "batch_write",
+    "get_dashboard",
+})
+
+
+# Input schema per tool, used to reject bad arguments before any work starts
+TOOL_SCHEMAS = {tool["name"]: tool["inputSchema"] for tool in TOOLS_LIST["tools"]}
+
+
+@cache
+def get_argument_validator(name: str) -> Callable[[Dict[str, Any]], None]:
+    """Return the argument validator for a tool, compiled on first use."""
+    return compile_argument_validator(TOOL_SCHEMAS.get(name))
 
 
 class MemoryMCPServer:
@@ -33,12 +111,30 @@ class MemoryMCPServer:
         self.name = "memory"
         self.version = "1.0.0"
         self.project_root = get_project_root()
+        self._result_cache: Dict[tuple, tuple] = {}
+        self._cache_generation = 0
         
-        # Initialize memory system
-        self.memory_tool = MemoryMCPTool(self.project_root)
+    
+    @cached_property
+    def memory_tool(self):
+        """Memory system tool, imported and connected on first use."""
+        _ensure_tools_on_path()
+        from tools.memory_mcp_tool import MemoryMCPTool  # type: ignore
+        return MemoryMCPTool(self.project_root)
+    
+    @cached_property
+    def _tool_methods(self) -> Dict[str, Callable[..., Any]]:
+        """Bound MemoryMCPTool method per tool name, resolved once instead of per call."""
+        memory_tool = self.memory_tool
+        return {name: getattr(memory_tool, name) for name in MEMORY_TOOL_METHODS}
     
     async def handle_initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle initialization request."""
+        return self._initialize_result
+    
+    @cached_property
+    def _initialize_result(self) -> Dict[str, Any]:
+        """Capabilities answered to initialize; they are fixed for the server's lifetime."""
         return {
             "protocolVersion": "2024-11-05",
             "capabilities": {
@@ -53,191 +149,32 @@ class MemoryMCPServer:
     
     async def handle_list_tools(self) -> Dict[str, Any]:
         """List all memory-related tools."""
-        return {
-            "tools": [
-                {
-                    "name": "store_memory",
-                    "description": "Store a new memory for later recall across conversations",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "memory_type": {"type": "string", "description": "Type of memory (e.g., 'code_insight', 'user_preference', 'problem_solution')"},
-                            "content": {"description": "Memory content (text or structured data)"},
-                            "title": {"type": "string", "description": "Optional short title for the memory"},
-                            "importance": {"type": "number", "minimum": 0, "maximum": 1, "description": "Importance score (0.0 to 1.0)"},
-                            "emotional_context": {"type": "object", "description": "Emotional context data"},
-                            "tags": {"type": "array", "items": {"type": "string"}, "description": "List of tags for categorization"},
-                            "expires_in_days": {"type": "integer", "description": "Auto-delete after this many days"}
-                        },
-                        "required": ["memory_type", "content"]
-                    }
-                },
-                {
-                    "name": "recall_memories",
-                    "description": "Recall relevant memories based on query and filters",
-                    "inputSchema": {
-                        "type": "object",                        "properties": {
-                            "query": {"type": "string", "description": "Text query for semantic search"},
-                            "memory_type": {"type": "string", "description": "Filter by memory type"},
-                            "project_id": {"type": "string", "description": "Filter by project (defaults to current)"},
-                            "limit": {"type": "integer", "minimum": 1, "maximum": 100, "description": "Maximum number of memories to return"},
-                            "include_other_projects": {"type": "boolean", "description": "Include memories from other projects"}
-                        },
-                        "required": []
-                    }
-                },
-                {
-                    "name": "recall_memories_weighted",
-                    "description": "Enhanced recall with weighted scoring based on importance, recency, and relevance",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "query": {"type": "string", "description": "Text query for semantic search"},
-                            "memory_type": {"type": "string", "description": "Filter by memory type"},
-                            "project_id": {"type": "string", "description": "Filter by project (defaults to current)"},
-                            "importance_threshold": {"type": "number", "minimum": 0, "maximum": 1, "description": "Minimum importance score"},
-                            "limit": {"type": "integer", "minimum": 1, "maximum": 100, "description": "Maximum number of memories to return"},
-                            "include_other_projects": {"type": "boolean", "description": "Include memories from other projects"},
-                            "importance_weight": {"type": "number", "minimum": 0, "maximum": 1, "description": "Weight for importance score"},
-                            "recency_weight": {"type": "number", "minimum": 0, "maximum": 1, "description": "Weight for recency score"},
-                            "relevance_weight": {"type": "number", "minimum": 0, "maximum": 1, "description": "Weight for relevance score"}
-                        },
-                        "required": []
-                    }
-                },
-                {
-                    "name": "store_persona_memory",
-                    "description": "Store or update AI persona characteristics for identity evolution",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "persona_type": {"type": "string", "description": "Type of persona attribute (e.g., 'preference', 'skill', 'personality_trait')"},
-                            "attribute_name": {"type": "string", "description": "Name of the attribute (e.g., 'coding_style', 'communication_preference')"},
-                            "current_value": {"description": "Current value of the attribute"},
-                            "confidence_score": {"type": "number", "minimum": 0, "maximum": 1, "description": "Confidence in this attribute (0.0 to 1.0)"},
-                            "ai_instance_id": {"type": "string", "description": "Specific AI instance identifier"}
-                        },
-                        "required": ["persona_type", "attribute_name", "current_value"]
-                    }
-                },
-                {
-                    "name": "get_current_persona",
-                    "description": "Retrieve current AI persona characteristics organized by type",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "persona_type": {"type": "string", "description": "Filter by specific persona type"},
-                            "min_confidence": {"type": "number", "minimum": 0, "maximum": 1, "description": "Minimum confidence threshold"},
-                            "ai_instance_id": {"type": "string", "description": "Specific AI instance identifier"}
-                        },
-                        "required": []
-                    }
-                },
-                {
-                    "name": "generate_self_reflection",
-                    "description": "Generate self-reflection on recent interactions for continuous improvement",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "reflection_trigger": {"type": "string", "description": "What triggered this reflection"},
-                            "situation_summary": {"type": "string", "description": "Summary of the situation being reflected upon"},
-                            "what_went_well": {"type": "string", "description": "What went well in the interaction"},
-                            "what_could_improve": {"type": "string", "description": "What could be improved"},
-                            "lessons_learned": {"type": "string", "description": "Key lessons learned"},
-                            "reflection_scope": {"type": "string", "description": "Scope of reflection ('session', 'interaction', 'task')"}
-                        },
-                        "required": ["reflection_trigger", "situation_summary"]
-                    }
-                },
-                {
-                    "name": "apply_forgetting_curve",
-                    "description": "Apply forgetting curve algorithm to decay old or unused memories",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "days_threshold": {"type": "integer", "description": "Age threshold in days"},
-                            "access_threshold": {"type": "integer", "description": "Minimum access count threshold"},
-                            "dry_run": {"type": "boolean", "description": "Just return what would be affected"}
-                        },
-                        "required": []
-                    }
-                },
-                {
-                    "name": "get_persona_evolution_summary",
-                    "description": "Get summary of how the AI persona has evolved over time",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "days_back": {"type": "integer", "minimum": 1, "maximum": 365, "description": "Number of days to analyze"},
-                            "persona_type": {"type": "string", "description": "Filter by specific persona type"}
-                        },
-                        "required": []
-                    }
-                },
-                {
-                    "name": "get_project_context",
-                    "description": "Get context about the current project and memory system state",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                }
-            ]
-        }
+        return TOOLS_LIST
     
     async def handle_call_tool(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Handle tool execution requests."""
         try:
-            # Memory System Tools
-            if name == "store_memory":
-                result = self.memory_tool.store_memory(**arguments)
-            elif name == "recall_memories":
-                result = self.memory_tool.recall_memories(**arguments)
-            elif name == "recall_memories_weighted":
-                result = self.memory_tool.recall_memories_weighted(**arguments)
-            elif name == "store_persona_memory":
-                result = self.memory_tool.store_persona_memory(**arguments)
-            elif name == "get_current_persona":
-                result = self.memory_tool.get_current_persona(**arguments)
-            elif name == "generate_self_reflection":
-                result = self.memory_tool.generate_self_reflection(**arguments)
-            elif name == "apply_forgetting_curve":
-                result = self.memory_tool.apply_forgetting_curve(**arguments)
-            elif name == "get_persona_evolution_summary":
-                result = self.memory_tool.get_persona_evolution_summary(**arguments)
-            elif name == "reflect_on_interaction":
-                result = self.memory_tool.reflect_on_interaction(**arguments)
-            elif name == "get_memory_summary":
-                result = self.memory_tool.get_memory_summary(**arguments)
-            elif name == "get_emotional_insights":
-                result = self.memory_tool.get_emotional_insights(**arguments)
-            elif name == "update_memory":
-                result = self.memory_tool.update_memory(**arguments)
-            elif name == "cleanup_expired_memories":
-                result = self.memory_tool.cleanup_expired_memories(**arguments)
-            elif name == "get_project_context":
-                result = self.memory_tool.get_project_context(**arguments)
-            else:
-                return {
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": f"Error: Unknown tool '{name}'"
-                        }
-                    ],
-                    "isError": True
-                }
-            
+            result = await self.call_tool_raw(name, arguments)
+        except UnknownToolError:
+            return {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"Error: Unknown tool '{name}'"
+                    }
+                ],
+                "isError": True
+            }
+        except InvalidArgumentsError as e:
             return {
                 "content": [
                     {
                         "type": "text",
-                        "text": json.dumps(result, indent=2, default=str)
+                        "text": f"Error: Invalid arguments for '{name}': {e}"
                     }
-                ]
+                ],
+                "isError": True
             }
-            
         except Exception as e:
             return {
                 "content": [
@@ -248,105 +185,74 @@ class MemoryMCPServer:
                 ],
                 "isError": True
             }
+        
+        return {
+            "content": [
+                {
+                    "type": "text",
+                    "text": result_text(result)
+                }
+            ]
+        }
+    
+    async def call_tool_raw(self, name: str, arguments: Dict[str, Any]) -> Any:
+        """Run a tool and return its Python result without the MCP text envelope.
+        
+        In-process callers use this to skip serializing the result only to parse it again.
+        Raises UnknownToolError for unknown tool names and InvalidArgumentsError for bad arguments.
+        """
+        if not isinstance(name, str):
+            raise UnknownToolError(name)
+        # Names arrive as fresh strings off the wire; interned, they match the table keys by identity
+        name = sys.intern(name)
+        if name not in MEMORY_TOOL_METHODS:
+            raise UnknownToolError(name)
+        get_argument_validator(name)(arguments)
+        
+        # Every memory tool maps onto the MemoryMCPTool method of the same name; the
+        # database and embedding work is blocking, so it runs off the event loop
+        method = self._tool_methods[name]
+        ttl = TOOL_CACHE_TTL_SECONDS.get(name) if CACHE_ENABLED else None
+        if ttl is None:
+            try:
+                return await asyncio.to_thread(method, **arguments)
+            finally:
+                # Dropped only after the call has finished, together with any cached
+                # read that was still running while it wrote
+                self._cache_generation += 1
+                self._result_cache.clear()
+        
+        key = (name, json.dumps(arguments, sort_keys=True, default=str))
+        cached = self._result_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        
+        generation = self._cache_generation
+        result = await asyncio.to_thread(method, **arguments)
+        if generation == self._cache_generation:
+            self._result_cache[key] = (time.monotonic() + ttl, result)
+        return result
+
+
 async def main():
     """Main MCP server loop."""
     server = MemoryMCPServer()
     
-    # Send initial capabilities to stderr for debugging
-    sys.stderr.write("Memory MCP Server Starting (8 memory tools)...\n")
-    sys.stderr.flush()
+    logging.basicConfig(
+        stream=sys.stderr,
+        level=os.getenv("MEMORY_LOG_LEVEL", "INFO").upper(),
+        format="%(message)s"
+    )
+    logger.info("Memory MCP Server Starting (8 memory tools)...")
     
-    while True:
-        try:
-            # Read a line from stdin
-            line = await asyncio.get_event_loop().run_in_executor(None, sys.stdin.readline)
-            if not line:
-                break
-            
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Parse the JSON-RPC message
-            try:
-                request = json.loads(line)
-            except json.JSONDecodeError as e:
-                sys.stderr.write(f"JSON decode error: {e} for line: {line}\n")
-                sys.stderr.flush()
-                continue
-            
-            method = request.get("method")
-            params = request.get("params", {})
-            request_id = request.get("id")
-            
-            sys.stderr.write(f"Received method: {method}\n")
-            sys.stderr.flush()
-            
-            # Handle the request
-            try:
-                if method == "initialize":
-                    result = await server.handle_initialize(params)
-                elif method == "initialized":
-                    # Just acknowledge the initialized notification
-                    continue
-                elif method == "tools/list":
-                    result = await server.handle_list_tools()
-                elif method == "tools/call":
-                    tool_name = params.get("name")
-                    arguments = params.get("arguments", {})
-                    result = await server.handle_call_tool(tool_name, arguments)
-                elif method == "ping":
-                    result = {"status": "pong"}
-                elif method == "notifications/initialized":
-                    # Handle notification
-                    continue
-                else:
-                    # Unknown method
-                    sys.stderr.write(f"Unknown method: {method}\n")
-                    sys.stderr.flush()
-                    if request_id is not None:
-                        error_response = {
-                            "jsonrpc": "2.0",
-                            "id": request_id,
-                            "error": {
-                                "code": -32601,
-                                "message": f"Method not found: {method}"
-                            }
-                        }
-                        print(json.dumps(error_response))
-                        sys.stdout.flush()
-                    continue
-                
-                # Send successful response (only for requests with id)
-                if request_id is not None:
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "result": result
-                    }
-                    print(json.dumps(response))
-                    sys.stdout.flush()
-                
-            except Exception as e:
-                sys.stderr.write(f"Error handling method {method}: {e}\n")
-                sys.stderr.flush()
-                # Send error response (only for requests with id)
-                if request_id is not None:
-                    error_response = {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "error": {
-                            "code": -32603,
-                            "message": str(e)
-                        }
-                    }
-                    print(json.dumps(error_response))
-                    sys.stdout.flush()
-                
-        except Exception as e:
-            sys.stderr.write(f"Server error: {e}\n")
-            sys.stderr.flush()
+    await serve(server, TOOLS_LIST, blocking_workers=BLOCKING_WORKERS)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if "--list-tools" in sys.argv[1:]:
+        # Print the catalog without starting the event loop or loading any tool
+        for number, tool in enumerate(TOOLS, 1):
+            print(f"{number:2d}. {tool['name']}\n    {tool['description']}\n")
+        sys.exit(0)
+    
+    run(main())
@@ -51,6 +51,13 @@ def parse_arguments():
     return parser.parse_args()
 
 
+def print_banner(lines, width=60):
+    """Print a framed message block to stdout in a single write."""
+    rule = "=" * width
+    sys.stdout.write("\n".join(["", rule, *lines, rule]) + "\n")
+    sys.stdout.flush()
+
+
 def check_postgresql_version():
     """Check if PostgreSQL version is installed and compatible."""
     logger.info("Checking PostgreSQL installation...")
@@ -532,24 +539,24 @@ def main():
     # Step 1: Check PostgreSQL installation
     if not check_postgresql_version():
         logger.error("❌ PostgreSQL check failed - please install PostgreSQL >= 12")
-        print("\n" + "="*60)
-        print("SETUP FAILED - PostgreSQL INSTALLATION REQUIRED")
-        print("1. Download PostgreSQL from: https://www.postgresql.org/download/")
-        print("2. Install PostgreSQL (version 12 or higher)")
-        print("3. Ensure the PostgreSQL service is running")
-        print("4. Run setup.py again")
-        print("="*60)
+        print_banner([
+            "SETUP FAILED - PostgreSQL INSTALLATION REQUIRED",
+            "1. Download PostgreSQL from: https://www.postgresql.org/download/",
+            "2. Install PostgreSQL (version 12 or higher)",
+            "3. Ensure the PostgreSQL service is running",
+            "4. Run setup.py again",
+        ])
         return False
     
     # Step 2: Install Python dependencies (if not skipped)
     if not args.skip_python_deps:
         if not install_python_dependencies():
             logger.error("❌ Python dependencies installation failed")
-            print("\n" + "="*60)
-            print("SETUP FAILED - PYTHON DEPENDENCIES INSTALLATION FAILED")
-            print("Try installing dependencies manually:")
-            print("pip install -r requirements.txt")
-            print("="*60)
+            print_banner([
+                "SETUP FAILED - PYTHON DEPENDENCIES INSTALLATION FAILED",
+                "Try installing dependencies manually:",
+                "pip install -r requirements.txt",
+            ])
             return False
     else:
         logger.info("Skipping Python dependencies installation (--skip-python-deps flag used)")
@@ -565,14 +572,14 @@ def main():
     # Step 5: Setup database and tables
     if not setup_database(config):
         logger.error("❌ Database setup failed")
-        print("\n" + "="*60)
-        print("SETUP FAILED - DATABASE CONFIGURATION ISSUES")
-        print("Please check:")
-        print("1. PostgreSQL is running and accessible")
-        print("2. Credentials in config/memory.env are correct")
-        print("3. Database user has sufficient privileges")
-        print("4. See detailed error messages above for more information")
-        print("="*60)
+        print_banner([
+            "SETUP FAILED - DATABASE CONFIGURATION ISSUES",
+            "Please check:",
+            "1. PostgreSQL is running and accessible",
+            "2. Credentials in config/memory.env are correct",
+            "3. Database user has sufficient privileges",
+            "4. See detailed error messages above for more information",
+        ])
         return False
     
     setup_success = True
@@ -591,33 +598,33 @@ def main():
         logger.info("🎉 Memory MCP Server setup completed successfully!")
         
         # Display detailed success message with next steps
-        print("\n" + "="*78)
-        print("MEMORY MCP SERVER SETUP COMPLETE")
-        print("="*78)
-        print("The Memory MCP Server has been successfully configured and is ready to use.")
-        print("\nNext Steps:")
-        print("1. Verify database credentials in:")
-        print(f"   {CONFIG_FILE}")
-        print("\n2. Start the Memory MCP Server:")
-        print("   cd servers/memory")
-        print("   python server.py")
-        print("\n3. For enhanced semantic search performance:")
-        print("   - Install sentence-transformers: pip install sentence-transformers>=2.0.0")
-        print("   - Install pgvector extension: https://github.com/pgvector/pgvector")
-        print("\n4. For more information and advanced configuration:")
-        print(f"   See the detailed setup guide: {parent_dir}/SETUP_GUIDE.md")
-        print("="*78)
+        print_banner([
+            "MEMORY MCP SERVER SETUP COMPLETE",
+            "=" * 78,
+            "The Memory MCP Server has been successfully configured and is ready to use.",
+            "\nNext Steps:",
+            "1. Verify database credentials in:",
+            f"   {CONFIG_FILE}",
+            "\n2. Start the Memory MCP Server:",
+            "   cd servers/memory",
+            "   python server.py",
+            "\n3. For enhanced semantic search performance:",
+            "   - Install sentence-transformers: pip install sentence-transformers>=2.0.0",
+            "   - Install pgvector extension: https://github.com/pgvector/pgvector",
+            "\n4. For more information and advanced configuration:",
+            f"   See the detailed setup guide: {parent_dir}/SETUP_GUIDE.md",
+        ], width=78)
     else:
         logger.warning("⚠️ Memory MCP Server setup completed with warnings.")
-        print("\n" + "="*60)
-        print("SETUP COMPLETED WITH WARNINGS")
-        print("Some components may not function correctly.")
-        print("Review the warnings above and check:")
-        print("1. Database configuration in config/memory.env")
-        print("2. PostgreSQL extensions (pgvector)")
-        print("3. Python dependencies (sentence-transformers)")
-        print(f"4. See the detailed setup guide: {parent_dir}/SETUP_GUIDE.md")
-        print("="*60)
+        print_banner([
+            "SETUP COMPLETED WITH WARNINGS",
+            "Some components may not function correctly.",
+            "Review the warnings above and check:",
+            "1. Database configuration in config/memory.env",
+            "2. PostgreSQL extensions (pgvector)",
+            "3. Python dependencies (sentence-transformers)",
+            f"4. See the detailed setup guide: {parent_dir}/SETUP_GUIDE.md",
+        ])
     
     return True
 
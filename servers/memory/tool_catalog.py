@@ -0,0 +1,171 @@
+"""
+Tool catalog for the Memory MCP server.
+
+Pure data: the name, description and input schema of every tool, importable
+without loading the server or any of its tools.
+"""
+
+TOOLS = [
+    {
+        "name": "store_memory",
+        "description": "Store a new memory for later recall across conversations",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "memory_type": {"type": "string", "description": "Type of memory (e.g., 'code_insight', 'user_preference', 'problem_solution')"},
+                "content": {"description": "Memory content (text or structured data)"},
+                "title": {"type": "string", "description": "Optional short title for the memory"},
+                "importance": {"type": "number", "minimum": 0, "maximum": 1, "description": "Importance score (0.0 to 1.0)"},
+                "emotional_context": {"type": "object", "description": "Emotional context data"},
+                "tags": {"type": "array", "items": {"type": "string"}, "description": "List of tags for categorization"},
+                "expires_in_days": {"type": "integer", "description": "Auto-delete after this many days"}
+            },
+            "required": ["memory_type", "content"]
+        }
+    },
+    {
+        "name": "recall_memories",
+        "description": "Recall relevant memories based on query and filters",
+        "inputSchema": {
+            "type": "object",                        "properties": {
+                "query": {"type": "string", "description": "Text query for semantic search"},
+                "memory_type": {"type": "string", "description": "Filter by memory type"},
+                "project_id": {"type": "string", "description": "Filter by project (defaults to current)"},
+                "limit": {"type": "integer", "minimum": 1, "maximum": 100, "description": "Maximum number of memories to return"},
+                "include_other_projects": {"type": "boolean", "description": "Include memories from other projects"}
+            },
+            "required": []
+        }
+    },
+    {
+        "name": "recall_memories_weighted",
+        "description": "Enhanced recall with weighted scoring based on importance, recency, and relevance",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Text query for semantic search"},
+                "memory_type": {"type": "string", "description": "Filter by memory type"},
+                "project_id": {"type": "string", "description": "Filter by project (defaults to current)"},
+                "importance_threshold": {"type": "number", "minimum": 0, "maximum": 1, "description": "Minimum importance score"},
+                "limit": {"type": "integer", "minimum": 1, "maximum": 100, "description": "Maximum number of memories to return"},
+                "include_other_projects": {"type": "boolean", "description": "Include memories from other projects"},
+                "importance_weight": {"type": "number", "minimum": 0, "maximum": 1, "description": "Weight for importance score"},
+                "recency_weight": {"type": "number", "minimum": 0, "maximum": 1, "description": "Weight for recency score"},
+                "relevance_weight": {"type": "number", "minimum": 0, "maximum": 1, "description": "Weight for relevance score"}
+            },
+            "required": []
+        }
+    },
+    {
+        "name": "store_persona_memory",
+        "description": "Store or update AI persona characteristics for identity evolution",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "persona_type": {"type": "string", "description": "Type of persona attribute (e.g., 'preference', 'skill', 'personality_trait')"},
+                "attribute_name": {"type": "string", "description": "Name of the attribute (e.g., 'coding_style', 'communication_preference')"},
+                "current_value": {"description": "Current value of the attribute"},
+                "confidence_score": {"type": "number", "minimum": 0, "maximum": 1, "description": "Confidence in this attribute (0.0 to 1.0)"},
+                "ai_instance_id": {"type": "string", "description": "Specific AI instance identifier"}
+            },
+            "required": ["persona_type", "attribute_name", "current_value"]
+        }
+    },
+    {
+        "name": "get_current_persona",
+        "description": "Retrieve current AI persona characteristics organized by type",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "persona_type": {"type": "string", "description": "Filter by specific persona type"},
+                "min_confidence": {"type": "number", "minimum": 0, "maximum": 1, "description": "Minimum confidence threshold"},
+                "ai_instance_id": {"type": "string", "description": "Specific AI instance identifier"}
+            },
+            "required": []
+        }
+    },
+    {
+        "name": "generate_self_reflection",
+        "description": "Generate self-reflection on recent interactions for continuous improvement",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "reflection_trigger": {"type": "string", "description": "What triggered this reflection"},
+                "situation_summary": {"type": "string", "description": "Summary of the situation being reflected upon"},
+                "what_went_well": {"type": "string", "description": "What went well in the interaction"},
+                "what_could_improve": {"type": "string", "description": "What could be improved"},
+                "lessons_learned": {"type": "string", "description": "Key lessons learned"},
+                "reflection_scope": {"type": "string", "description": "Scope of reflection ('session', 'interaction', 'task')"}
+            },
+            "required": ["reflection_trigger", "situation_summary"]
+        }
+    },
+    {
+        "name": "apply_forgetting_curve",
+        "description": "Apply forgetting curve algorithm to decay old or unused memories",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "days_threshold": {"type": "integer", "description": "Age threshold in days"},
+                "access_threshold": {"type": "integer", "description": "Minimum access count threshold"},
+                "dry_run": {"type": "boolean", "description": "Just return what would be affected"}
+            },
+            "required": []
+        }
+    },
+    {
+        "name": "get_persona_evolution_summary",
+        "description": "Get summary of how the AI persona has evolved over time",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "days_back": {"type": "integer", "minimum": 1, "maximum": 365, "description": "Number of days to analyze"},
+                "persona_type": {"type": "string", "description": "Filter by specific persona type"}
+            },
+            "required": []
+        }
+    },
+    {
+        "name": "batch_write",
+        "description": "Store several memories and emotional reflections in a single database transaction",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "ops": {
+                    "type": "array",
+                    "minItems": 1,
+                    "description": "Writes to apply together; each names its operation in 'op' and carries that tool's arguments",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "op": {"type": "string", "enum": ["store_memory", "reflect_on_interaction"], "description": "Operation to apply"}
+                        },
+                        "required": ["op"]
+                    }
+                }
+            },
+            "required": ["ops"]
+        }
+    },
+    {
+        "name": "get_dashboard",
+        "description": "Get recent memories, memory counts and mood statistics in a single query",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "limit": {"type": "integer", "minimum": 1, "maximum": 100, "description": "Number of recent memories to include"},
+                "days_back": {"type": "integer", "minimum": 1, "description": "Days of emotional reflections to summarize"}
+            },
+            "required": []
+        }
+    },
+    {
+        "name": "get_project_context",
+        "description": "Get context about the current project and memory system state",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    }
+]
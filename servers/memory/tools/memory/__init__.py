@@ -6,7 +6,7 @@ emotional context tracking, and enhanced capabilities for persona evolution and
 self-reflection.
 """
 
-from .main import MemorySystem
+from .main import MemorySystem, get_memory_system
 from .core import MemorySystemBase, EmbeddingVector
 from .database import DatabaseManager
 from .embeddings import EmbeddingManager  
@@ -14,6 +14,7 @@ from .enhanced import EnhancedMemoryCapabilities
 
 __all__ = [
     'MemorySystem',
+    'get_memory_system',
     'MemorySystemBase', 
     'EmbeddingVector',
     'DatabaseManager',
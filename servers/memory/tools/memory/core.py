@@ -3,9 +3,11 @@
 memory System memory - Base classes and configuration
 """
 import os
+import json
 import logging
 import hashlib
 import contextlib
+import functools
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
@@ -39,9 +41,33 @@ except ImportError:
     np = None
     NUMPY_AVAILABLE = False
 
+# Fast JSON serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def dumps_json(data: Any) -> str:
+    """Serialize data for a JSONB column, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data)
+
+
+# The server's config file, resolved once relative to this module
+CONFIG_ENV_FILE = Path(__file__).resolve().parent.parent.parent / "config" / "memory.env"
+
+# Every memory component loads the config file on construction; only the first one needs to
+_ENV_LOADED = False
+
 
 class EmbeddingVector:
     """Wrapper class for embedding vectors that need to be converted to pgvector format."""
+    __slots__ = ("vector",)
+    
     def __init__(self, vector):
         if np and isinstance(vector, np.ndarray):
             self.vector = vector.tolist()
@@ -66,6 +92,12 @@ if POSTGRES_AVAILABLE and psycopg2 is not None:
     psycopg2.extensions.register_adapter(EmbeddingVector, _adapt_embedding_vector)
 
 
+@functools.lru_cache(maxsize=None)
+def _load_sentence_transformer(model_name: str) -> Any:
+    """Load a sentence-transformers model once per process."""
+    return SentenceTransformer(model_name)
+
+
 class MemorySystemBase:
     """Base class for memory system with memory configuration and utilities."""
     
@@ -79,10 +111,8 @@ class MemorySystemBase:
         self.current_project_id = self._detect_project_id()
         self.session_id = self._generate_session_id()
         
-        # Embedding configuration
-        self.embedding_model = None
-        self.embedding_dim = 384  # Default for all-MiniLM-L6-v2
-        self._initialize_embedding_model(embedding_model)
+        # Embedding configuration (the model itself is loaded on first use)
+        self.embedding_model_name = embedding_model
         
         # Database configuration
         try:
@@ -95,18 +125,27 @@ class MemorySystemBase:
             self.connection_pool = None
             self.fallback_storage: Dict[int, Dict[str, Any]] = {}
     
-    def _initialize_embedding_model(self, embedding_model: str) -> None:
-        """Initialize the embedding model."""
+    @functools.cached_property
+    def embedding_model(self) -> Optional[Any]:
+        """Sentence-transformers model, loaded on first use and shared across managers."""
         if EMBEDDING_AVAILABLE and SentenceTransformer:
             try:
-                self.embedding_model = SentenceTransformer(embedding_model)
-                self.embedding_dim = self.embedding_model.get_sentence_embedding_dimension()
-                self.logger.info(f"Loaded embedding model: {embedding_model} (dim: {self.embedding_dim})")
+                model = _load_sentence_transformer(self.embedding_model_name)
+                self.logger.info(f"Loaded embedding model: {self.embedding_model_name} "
+                                 f"(dim: {model.get_sentence_embedding_dimension()})")
+                return model
             except Exception as e:
                 self.logger.warning(f"Failed to load embedding model: {e}")
-                self.embedding_model = None
-        else:
-            self.logger.warning("Semantic search disabled - install sentence-transformers for full functionality")
+                return None
+        self.logger.warning("Semantic search disabled - install sentence-transformers for full functionality")
+        return None
+    
+    @functools.cached_property
+    def embedding_dim(self) -> int:
+        """Dimension of the vectors produced by the embedding model."""
+        if self.embedding_model is not None:
+            return self.embedding_model.get_sentence_embedding_dimension()
+        return 384  # Default for all-MiniLM-L6-v2
     
     def _load_db_config(self) -> Dict[str, str]:
         """Load PostgreSQL configuration from environment or config file."""
@@ -132,13 +171,14 @@ class MemorySystemBase:
             'password': password,
         }
     def _load_env_file(self) -> None:
-        """Load environment variables from config file."""
+        """Load environment variables from config file (once per process)."""
+        global _ENV_LOADED
+        if _ENV_LOADED:
+            return
+        _ENV_LOADED = True
+        
         try:
-            # Find the config file relative to this file
-            current_file = Path(__file__).resolve()
-            
-            # Look in the server's config directory first (new location)
-            env_file = current_file.parent.parent.parent / "config" / "memory.env"
+            env_file = CONFIG_ENV_FILE
 
             if env_file.exists():
                 self.logger.info(f"Loading config from {env_file}")
@@ -177,7 +217,7 @@ class MemorySystemBase:
     
     def _safe_json(self, data: Any) -> Any:
         """Safely convert data to JSON format for database storage."""
-        return Json(data) if (POSTGRES_AVAILABLE and Json) else data
+        return Json(data, dumps=dumps_json) if (POSTGRES_AVAILABLE and Json) else data
     
     def __del__(self) -> None:
         """Clean up database connections."""
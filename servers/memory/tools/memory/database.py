@@ -2,8 +2,14 @@
 """
 Memory System Database Manager - Database operations and schema management
 """
+import os
+import re
+import json
+import hashlib
 import logging
+import itertools
 import contextlib
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Union
 from datetime import datetime
 
@@ -19,12 +25,37 @@ except ImportError:
 
 from .core import MemorySystemBase, EmbeddingVector
 
+# Default build parameters for each supported pgvector index type
+VECTOR_INDEX_DEFAULTS = {
+    "hnsw": {"m": 16, "ef_construction": 64},
+    "ivfflat": {"lists": 100},
+    "diskann": {},
+}
+
+# Most connections the pool opens; the memory server runs at most this many blocking calls at once
+POOL_MAX_CONNECTIONS = 20
+
+# Matches psycopg2 placeholders so they can be rewritten for server-side PREPARE
+_PLACEHOLDER_PATTERN = re.compile(r"%%|%s")
+
+
+def _to_server_placeholders(sql: str) -> str:
+    """Rewrite psycopg2 %s placeholders into PostgreSQL $n parameters."""
+    counter = itertools.count(1)
+    return _PLACEHOLDER_PATTERN.sub(
+        lambda match: "%" if match.group() == "%%" else f"${next(counter)}", sql)
+
 
 class DatabaseManager(MemorySystemBase):
     """Handles all database operations for the memory system."""
+
+    # Prepared statements kept per connection before the least recently used is deallocated
+    STATEMENT_CACHE_SIZE = 500
     
     def __init__(self, project_root: Optional[str] = None, embedding_model: str = "all-MiniLM-L6-v2"):
         super().__init__(project_root, embedding_model)
+        # id(conn) -> (backend pid, OrderedDict of prepared statement names)
+        self._statement_caches: Dict[int, tuple] = {}
         self._initialize_database()
 
     def _initialize_database(self) -> None:
@@ -38,29 +69,78 @@ class DatabaseManager(MemorySystemBase):
             return
 
         try:
+            # Session options; hnsw.ef_search bounds how many ANN candidates a search can return
+            ef_search = int(os.getenv('HNSW_EF_SEARCH', '100'))
+            
             # Create connection pool
-            self.connection_pool = psycopg2.pool.SimpleConnectionPool(
-                1, 20,  # min/max connections
+            self.connection_pool = psycopg2.pool.ThreadedConnectionPool(
+                1, POOL_MAX_CONNECTIONS,  # min/max connections
                 host=self.db_config['host'],
                 port=self.db_config['port'],
                 database=self.db_config['database'],
                 user=self.db_config['user'],
-                password=self.db_config['password']
+                password=self.db_config['password'],
+                options=f"-c hnsw.ef_search={ef_search}"
             )
             
             # Test connection and create tables
-            with self.connection_pool.getconn() as conn:
+            with self.connection() as conn:
                 with conn.cursor() as cur:
                     cur.execute("SELECT 1;")  # Test connection
-                self.connection_pool.putconn(conn)
             
             self._create_tables()
+            self._create_vector_index()
             self.logger.info(f"Connected to PostgreSQL database: {self.db_config['database']}")
             
         except Exception as e:
             self.logger.error(f"Failed to initialize database: {e}")
             self.connection_pool = None
 
+    @contextlib.contextmanager
+    def connection(self):
+        """Borrow a pooled connection, always handing it back to the pool."""
+        conn = self.connection_pool.getconn()
+        try:
+            with conn:
+                yield conn
+        finally:
+            if conn.closed:
+                self._statement_caches.pop(id(conn), None)
+            self.connection_pool.putconn(conn)
+
+    def _prepare_statement(self, conn, cur, sql: str) -> str:
+        """Return the server-side statement name for sql, preparing it once per connection."""
+        backend_pid = conn.get_backend_pid()
+        cached = self._statement_caches.get(id(conn))
+        if cached is None or cached[0] != backend_pid:
+            cached = (backend_pid, OrderedDict())
+            self._statement_caches[id(conn)] = cached
+        statements = cached[1]
+
+        name = "stmt_" + hashlib.blake2b(sql.encode(), digest_size=16).hexdigest()
+        if name in statements:
+            statements.move_to_end(name)
+            return name
+
+        cur.execute(f"PREPARE {name} AS {_to_server_placeholders(sql.strip().rstrip(';'))}", None)
+        statements[name] = None
+        if len(statements) > self.STATEMENT_CACHE_SIZE:
+            evicted, _ = statements.popitem(last=False)
+            cur.execute(f"DEALLOCATE {evicted}", None)
+        return name
+
+    def _execute(self, conn, cur, sql: str, params: Optional[tuple], prepared: bool) -> None:
+        """Run sql on cur, going through the prepared statement cache when requested."""
+        if not prepared:
+            cur.execute(sql, params or ())
+            return
+
+        name = self._prepare_statement(conn, cur, sql)
+        if params:
+            cur.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+        else:
+            cur.execute(f"EXECUTE {name}", None)
+
     def _create_tables(self) -> None:
         """Create necessary database tables."""
         if not self.connection_pool:
@@ -158,48 +238,92 @@ class DatabaseManager(MemorySystemBase):
         """
         
         try:
-            with self.connection_pool.getconn() as conn:
+            with self.connection() as conn:
                 with conn.cursor() as cur:
                     cur.execute(create_sql)
                 conn.commit()
-                self.connection_pool.putconn(conn)
         except Exception as e:
             self.logger.error(f"Failed to create tables: {e}")
 
-    def execute_query(self, sql: str, params: Optional[tuple] = None, fetch: bool = True) -> Optional[List[Dict[str, Any]]]:
+    def _create_vector_index(self) -> None:
+        """Create the approximate nearest neighbour index used by semantic recall."""
+        index_type = os.getenv('VECTOR_INDEX_TYPE', 'hnsw').split('#', 1)[0].strip().lower()
+        if index_type not in VECTOR_INDEX_DEFAULTS:
+            self.logger.warning(f"Unsupported VECTOR_INDEX_TYPE '{index_type}', skipping vector index")
+            return
+
+        try:
+            # Inline comments are allowed after the JSON value in memory.env
+            raw_params = os.getenv('VECTOR_INDEX_PARAMS', '').split('#', 1)[0].strip()
+            index_params = json.loads(raw_params) if raw_params else VECTOR_INDEX_DEFAULTS[index_type]
+            with_clause = ", ".join(f"{key} = {int(value)}" for key, value in index_params.items())
+            index_sql = (
+                f"CREATE INDEX IF NOT EXISTS idx_memories_embedding_{index_type} "
+                f"ON memories USING {index_type} (embedding vector_cosine_ops)"
+                + (f" WITH ({with_clause})" if with_clause else "")
+            )
+            
+            # Kept apart from _create_tables so an older pgvector cannot block schema setup
+            with self.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(index_sql)
+                conn.commit()
+        except Exception as e:
+            self.logger.warning(f"Vector index ({index_type}) not created, semantic recall will scan: {e}")
+
+    def execute_query(self, sql: str, params: Optional[tuple] = None, fetch: bool = True,
+                      prepared: bool = False) -> Optional[List[Dict[str, Any]]]:
         """Execute a database query safely."""
         if not self.connection_pool:
             return None
 
         try:
-            with self.connection_pool.getconn() as conn:
+            with self.connection() as conn:
                 with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                    cur.execute(sql, params or ())
+                    self._execute(conn, cur, sql, params, prepared)
                     results = cur.fetchall() if fetch else None
                 conn.commit()
-                self.connection_pool.putconn(conn)
             return [dict(row) for row in results] if results else []
         except Exception as e:
             self.logger.error(f"Database query failed: {e}")
             return None
 
-    def execute_insert(self, sql: str, params: Optional[tuple] = None) -> Optional[Dict[str, Any]]:
+    def execute_insert(self, sql: str, params: Optional[tuple] = None,
+                       prepared: bool = False) -> Optional[Dict[str, Any]]:
         """Execute an INSERT query and return the inserted row."""
         if not self.connection_pool:
             return None
 
         try:
-            with self.connection_pool.getconn() as conn:
+            with self.connection() as conn:
                 with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                    cur.execute(sql, params or ())
+                    self._execute(conn, cur, sql, params, prepared)
                     result = cur.fetchone()
                 conn.commit()
-                self.connection_pool.putconn(conn)
             return dict(result) if result else None
         except Exception as e:
             self.logger.error(f"Database insert failed: {e}")
             return None
 
+    def execute_transaction(self, statements: List[tuple], prepared: bool = True) -> Optional[List[Optional[Dict[str, Any]]]]:
+        """Execute (sql, params) pairs in one transaction, returning the first row of each."""
+        if not self.connection_pool:
+            return None
+
+        try:
+            results = []
+            with self.connection() as conn:
+                with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                    for sql, params in statements:
+                        self._execute(conn, cur, sql, params, prepared)
+                        row = cur.fetchone() if cur.description else None
+                        results.append(dict(row) if row else None)
+                conn.commit()
+            return results
+        except Exception as e:
+            self.logger.error(f"Database transaction failed: {e}")
+            return None
+
     def get_memory_by_id(self, memory_id: int) -> Optional[Dict[str, Any]]:
         """Retrieve a specific memory by ID."""
         sql = "SELECT * FROM memories WHERE id = %s"
@@ -224,12 +348,11 @@ class DatabaseManager(MemorySystemBase):
 
         try:
             sql = "DELETE FROM memories WHERE expires_at <= CURRENT_TIMESTAMP"
-            with self.connection_pool.getconn() as conn:
+            with self.connection() as conn:
                 with conn.cursor() as cur:
                     cur.execute(sql)
                     deleted_count = cur.rowcount
                 conn.commit()
-                self.connection_pool.putconn(conn)
             return deleted_count
         except Exception as e:
             self.logger.error(f"Failed to cleanup expired memories: {e}")
@@ -246,12 +369,11 @@ class DatabaseManager(MemorySystemBase):
             VALUES (%s, %s, %s)
             """
             
-            with self.connection_pool.getconn() as conn:
+            with self.connection() as conn:
                 with conn.cursor() as cur:
                     for memory_id in memory_ids:
                         cur.execute(insert_sql, (memory_id, access_context, relevance_score))
                 conn.commit()
-                self.connection_pool.putconn(conn)
                 
         except Exception as e:
             self.logger.debug(f"Failed to log memory access: {e}")  # Non-critical, use debug level
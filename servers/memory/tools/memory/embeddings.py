@@ -24,6 +24,10 @@ from .core import MemorySystemBase, EmbeddingVector
 
 class EmbeddingManager(MemorySystemBase):
     """Handles embedding generation and semantic search operations."""
+
+    # Nearest neighbours fetched through the vector index per requested result before re-ranking
+    CANDIDATE_MULTIPLIER = 4
+    MIN_CANDIDATES = 40
     
     def __init__(self, project_root: Optional[str] = None, embedding_model: str = "all-MiniLM-L6-v2"):
         super().__init__(project_root, embedding_model)
@@ -92,21 +96,35 @@ class EmbeddingManager(MemorySystemBase):
     def build_semantic_search_query(self, where_conditions: List[str], params: List[Any], 
                                    query_embedding: List[float], limit: int) -> tuple[str, List[Any]]:
         """Build SQL query for semantic search with embedding similarity."""
+        # Ordering candidates by raw distance lets pgvector answer from its ANN index;
+        # the importance-weighted relevance is then applied to that short list only.
         search_sql = f"""
+        WITH candidates AS (
+            SELECT 
+                id, project_id, session_id, memory_type, title,
+                content, importance_score, emotional_context, tags,
+                created_at, updated_at,
+                embedding <=> %s AS distance
+            FROM memories
+            WHERE {' AND '.join(where_conditions)}
+              AND embedding IS NOT NULL
+            ORDER BY distance
+            LIMIT %s
+        )
         SELECT 
             id, project_id, session_id, memory_type, title,
             content, importance_score, emotional_context, tags,
             created_at, updated_at,
-            (1 - (embedding <=> %s)) * importance_score AS relevance_score
-        FROM memories
-        WHERE {' AND '.join(where_conditions)}
-          AND embedding IS NOT NULL
+            (1 - distance) * importance_score AS relevance_score
+        FROM candidates
         ORDER BY relevance_score DESC, created_at DESC
         LIMIT %s;
         """
         
-        # CRITICAL: Parameters must match SQL order: embedding (in SELECT), base WHERE params, limit
-        execution_params = [EmbeddingVector(query_embedding)] + params + [limit]
+        candidate_limit = max(limit * self.CANDIDATE_MULTIPLIER, self.MIN_CANDIDATES)
+        
+        # CRITICAL: Parameters must match SQL order: embedding (in SELECT), base WHERE params, candidate limit, limit
+        execution_params = [EmbeddingVector(query_embedding)] + params + [candidate_limit, limit]
         
         return search_sql, execution_params
 
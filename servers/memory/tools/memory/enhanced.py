@@ -3,6 +3,7 @@
 Memory System Enhanced Capabilities - Persona evolution, self-reflection, and forgetting curve
 """
 import logging
+import operator
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Union
 
@@ -17,6 +18,15 @@ except ImportError:
 
 from .core import MemorySystemBase
 
+# Pulls the persona columns out of a result row in one call
+PERSONA_ROW_FIELDS = operator.itemgetter('persona_type', 'attribute_name', 'current_value', 'confidence_score')
+
+
+def _truncate(value: Any, limit: int = 100) -> str:
+    """Render value as text, cut to limit characters plus an ellipsis when longer."""
+    text = str(value)
+    return text[:limit] + "..." if len(text) > limit else text
+
 
 class EnhancedMemoryCapabilities(MemorySystemBase):
     """Handles enhanced AI memory capabilities like persona evolution, self-reflection, and forgetting curve."""
@@ -49,7 +59,7 @@ class EnhancedMemoryCapabilities(MemorySystemBase):
             WHERE ai_instance_id = %s AND persona_type = %s AND attribute_name = %s;
             """
             
-            with database_manager.connection_pool.getconn() as conn:
+            with database_manager.connection() as conn:
                 with conn.cursor(cursor_factory=RealDictCursor) as cur:
                     cur.execute(check_sql, (ai_instance_id, persona_type, attribute_name))
                     
@@ -98,7 +108,6 @@ class EnhancedMemoryCapabilities(MemorySystemBase):
                         action = "created"
                 
                 conn.commit()
-                database_manager.connection_pool.putconn(conn)
             
             self.logger.info(f"Persona memory {action}: {persona_type}.{attribute_name} = {current_value}")
             
@@ -144,11 +153,10 @@ class EnhancedMemoryCapabilities(MemorySystemBase):
             ORDER BY persona_type, confidence_score DESC;
             """
             
-            with database_manager.connection_pool.getconn() as conn:
+            with database_manager.connection() as conn:
                 with conn.cursor(cursor_factory=RealDictCursor) as cur:
                     cur.execute(persona_sql, params)
                     results = cur.fetchall()
-                database_manager.connection_pool.putconn(conn)
             
             # Organize by persona type
             persona = {
@@ -160,12 +168,12 @@ class EnhancedMemoryCapabilities(MemorySystemBase):
                 "ai_instance_id": ai_instance_id
             }
             
-            for row in results:
-                category = row['persona_type'] + 's'  # pluralize
+            for p_type, attr_name, value, confidence in map(PERSONA_ROW_FIELDS, results):
+                category = p_type + 's'  # pluralize
                 if category in persona:
-                    persona[category][row['attribute_name']] = {
-                        "value": row['current_value'],
-                        "confidence": row['confidence_score']
+                    persona[category][attr_name] = {
+                        "value": value,
+                        "confidence": confidence
                     }
             
             return persona
@@ -187,11 +195,10 @@ class EnhancedMemoryCapabilities(MemorySystemBase):
         try:
             evolution_sql, params = self._get_persona_evolution_sql_and_params(days_back, persona_type)
             
-            with database_manager.connection_pool.getconn() as conn:
+            with database_manager.connection() as conn:
                 with conn.cursor(cursor_factory=RealDictCursor) as cur:
                     cur.execute(evolution_sql, params)
                     results = cur.fetchall()
-                database_manager.connection_pool.putconn(conn)
             
             # Analyze evolution patterns
             evolution_summary = {
@@ -311,7 +318,7 @@ class EnhancedMemoryCapabilities(MemorySystemBase):
             RETURNING id, created_at;
             """
             
-            with database_manager.connection_pool.getconn() as conn:
+            with database_manager.connection() as conn:
                 with conn.cursor(cursor_factory=RealDictCursor) as cur:
                     cur.execute(insert_sql, (
                         self.session_id,
@@ -325,7 +332,6 @@ class EnhancedMemoryCapabilities(MemorySystemBase):
                     ))
                     result = cur.fetchone()
                 conn.commit()
-                database_manager.connection_pool.putconn(conn)
             
             self.logger.info(f"Self-reflection stored: {reflection_trigger} - {situation_summary[:50]}...")
             
@@ -370,11 +376,10 @@ class EnhancedMemoryCapabilities(MemorySystemBase):
             ORDER BY m.importance_score ASC, m.created_at ASC;
             """
             
-            with database_manager.connection_pool.getconn() as conn:
+            with database_manager.connection() as conn:
                 with conn.cursor(cursor_factory=RealDictCursor) as cur:
                     cur.execute(decay_candidates_sql, (f"{days_threshold} days", access_threshold))
                     candidates = cur.fetchall()
-                database_manager.connection_pool.putconn(conn)
             
             if not candidates:
                 return {
@@ -412,7 +417,7 @@ class EnhancedMemoryCapabilities(MemorySystemBase):
             
             # Apply changes if not dry run
             if not dry_run and affected_memories:
-                with database_manager.connection_pool.getconn() as conn:
+                with database_manager.connection() as conn:
                     with conn.cursor() as cur:
                         for memory in affected_memories:
                             cur.execute(
@@ -420,7 +425,6 @@ class EnhancedMemoryCapabilities(MemorySystemBase):
                                 (memory['new_importance'], memory['id'])
                             )
                     conn.commit()
-                    database_manager.connection_pool.putconn(conn)
                 
                 self.logger.info(f"Applied forgetting curve to {len(affected_memories)} memories")
             
@@ -454,7 +458,7 @@ class EnhancedMemoryCapabilities(MemorySystemBase):
             return
         
         try:
-            with database_manager.connection_pool.getconn() as conn:
+            with database_manager.connection() as conn:
                 with conn.cursor() as cur:
                     for memory_id in memory_ids:
                         # Insert or update access log
@@ -469,12 +473,33 @@ class EnhancedMemoryCapabilities(MemorySystemBase):
                             relevance_score = %s;
                         """, (memory_id, access_context, relevance_score, access_context, relevance_score))
                 conn.commit()
-                database_manager.connection_pool.putconn(conn)
                 
         except Exception as e:
             self.logger.warning(f"Failed to log memory access: {e}")
 
     # ========== EMOTIONAL INTELLIGENCE ==========
+
+    REFLECTION_INSERT_SQL = """
+    INSERT INTO emotional_reflections (
+        session_id, project_id, reflection_type, content, mood_score
+    ) VALUES (%s, %s, %s, %s, %s)
+    RETURNING id, created_at;
+    """
+
+    def reflection_params(
+        self,
+        reflection_type: str,
+        content: Dict[str, Any],
+        mood_score: Optional[float] = None
+    ) -> tuple:
+        """Build the parameter tuple for REFLECTION_INSERT_SQL."""
+        return (
+            self.session_id,
+            self.current_project_id,
+            reflection_type,
+            self._safe_json(content),
+            mood_score
+        )
     
     def reflect_on_interaction(
         self,
@@ -488,25 +513,12 @@ class EnhancedMemoryCapabilities(MemorySystemBase):
             return {"success": False, "error": "PostgreSQL not available"}
         
         try:
-            insert_sql = """
-            INSERT INTO emotional_reflections (
-                session_id, project_id, reflection_type, content, mood_score
-            ) VALUES (%s, %s, %s, %s, %s)
-            RETURNING id, created_at;
-            """
-            
-            with database_manager.connection_pool.getconn() as conn:
+            with database_manager.connection() as conn:
                 with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                    cur.execute(insert_sql, (
-                        self.session_id,
-                        self.current_project_id,
-                        reflection_type,
-                        self._safe_json(content),
-                        mood_score
-                    ))
+                    cur.execute(self.REFLECTION_INSERT_SQL,
+                                self.reflection_params(reflection_type, content, mood_score))
                     result = cur.fetchone()
                 conn.commit()
-                database_manager.connection_pool.putconn(conn)
             
             self.logger.info(f"Stored emotional reflection: {reflection_type}")
             
@@ -542,11 +554,10 @@ class EnhancedMemoryCapabilities(MemorySystemBase):
             ORDER BY created_at DESC;
             """
             
-            with database_manager.connection_pool.getconn() as conn:
+            with database_manager.connection() as conn:
                 with conn.cursor(cursor_factory=RealDictCursor) as cur:
                     cur.execute(insights_sql, (self.current_project_id, f"{days_back} days"))
                     reflections = cur.fetchall()
-                database_manager.connection_pool.putconn(conn)
             
             if not reflections:
                 return {"insights": "No emotional reflections found for this period"}
@@ -576,7 +587,7 @@ class EnhancedMemoryCapabilities(MemorySystemBase):
                         "type": r['reflection_type'],
                         "mood": r['mood_score'],
                         "date": r['created_at'].isoformat(),
-                        "content_summary": str(r['content'])[:100] + "..." if len(str(r['content'])) > 100 else str(r['content'])
+                        "content_summary": _truncate(r['content'])
                     }
                     for r in reflections[:5]
                 ]
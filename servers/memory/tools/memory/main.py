@@ -2,24 +2,41 @@
 """
 Memory System Main Orchestrator
 """
+import os
+import copy
 import json
+import time
 import logging
+import functools
+import threading
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Union
 from datetime import datetime, timedelta
 
 try:
-    from .core import MemorySystemBase
+    from .core import MemorySystemBase, EmbeddingVector, dumps_json
     from .database import DatabaseManager
     from .embeddings import EmbeddingManager  
     from .enhanced import EnhancedMemoryCapabilities
 except ImportError:
     # Fallback for direct execution
-    from core import MemorySystemBase
+    from core import MemorySystemBase, EmbeddingVector, dumps_json
     from database import DatabaseManager
     from embeddings import EmbeddingManager  
     from enhanced import EnhancedMemoryCapabilities
 
 
+def invalidates_read_cache(method):
+    """Drop the read cache once a write method has finished, so reads that overlapped it are not kept."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._invalidate_read_cache()
+    return wrapper
+
+
 class MemorySystem(MemorySystemBase):
     """Main memory system orchestrator."""
     
@@ -33,7 +50,87 @@ class MemorySystem(MemorySystemBase):
         
         # Session management
         self.session_id = self._generate_session_id()
+        
+        # Read-through cache for repeated recall/summary/insight lookups
+        self._read_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._read_cache_ttl = float(os.getenv('MEMORY_READ_CACHE_TTL_SECONDS', '30'))
+        self._read_cache_lock = threading.Lock()
+        self._read_locks: Dict[tuple, threading.Lock] = {}
+        self._read_generation = 0
+
+    READ_CACHE_SIZE = 256
+
+    def _cached_read(self, key: tuple, compute):
+        """Serve a read from the TTL cache, computing it once per key on a miss."""
+        if self._read_cache_ttl <= 0:
+            return compute()
+        
+        with self._read_cache_lock:
+            key_lock = self._read_locks.setdefault(key, threading.Lock())
+        
+        # The per-key lock keeps concurrent callers from all hitting Postgres for the same read
+        try:
+            with key_lock:
+                with self._read_cache_lock:
+                    cached = self._read_cache.get(key)
+                    if cached and cached[0] > time.monotonic():
+                        self._read_cache.move_to_end(key)
+                        return copy.deepcopy(cached[1])
+                    generation = self._read_generation
+                
+                value = compute()
+                if isinstance(value, dict) and "error" in value:
+                    return value
+                
+                with self._read_cache_lock:
+                    # A write that committed while this read ran makes its result stale
+                    if generation == self._read_generation:
+                        self._read_cache[key] = (time.monotonic() + self._read_cache_ttl, value)
+                        self._read_cache.move_to_end(key)
+                        while len(self._read_cache) > self.READ_CACHE_SIZE:
+                            self._read_cache.popitem(last=False)
+                return copy.deepcopy(value)
+        finally:
+            with self._read_cache_lock:
+                if self._read_locks.get(key) is key_lock:
+                    del self._read_locks[key]
+
+    def _invalidate_read_cache(self) -> None:
+        """Drop cached reads and any read still running against pre-write data."""
+        with self._read_cache_lock:
+            self._read_generation += 1
+            self._read_cache.clear()
+
+    MEMORY_INSERT_SQL = """INSERT INTO memories (project_id, session_id, memory_type, title, content,
+                   importance_score, emotional_context, tags, embedding, expires_at) 
+                   VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s) RETURNING id;"""
+
+    def memory_params(self, memory_type: str, content: Union[str, Dict[str, Any]], 
+                      title: Optional[str] = None, importance: float = 0.5,
+                      emotional_context: Optional[Dict[str, Any]] = None,
+                      tags: Optional[List[str]] = None,
+                      expires_in_days: Optional[int] = None) -> tuple:
+        """Build the parameter tuple for MEMORY_INSERT_SQL, generating the embedding."""
+        # Prepare data
+        content_json = content if isinstance(content, dict) else {"text": content}
+        emotional_context = emotional_context or {}
+        tags = tags or []
+        expires_at = None
+        if expires_in_days:
+            expires_at = datetime.now() + timedelta(days=expires_in_days)
+        
+        # Generate embedding
+        content_text = self.embedding_manager.prepare_content_for_embedding(content_json)
+        if title:
+            content_text = f"{title}: {content_text}"
+        embedding = self.embedding_manager.generate_embedding(content_text)
+        
+        # Serialize JSON objects for storage
+        return (self.current_project_id, self.session_id, memory_type, title,
+                dumps_json(content_json), importance, dumps_json(emotional_context), 
+                tags, EmbeddingVector(embedding) if embedding else None, expires_at)
 
+    @invalidates_read_cache
     def store_memory(self, memory_type: str, content: Union[str, Dict[str, Any]], 
                      title: Optional[str] = None, importance: float = 0.5,
                      emotional_context: Optional[Dict[str, Any]] = None,
@@ -44,33 +141,14 @@ class MemorySystem(MemorySystemBase):
             return {"success": False, "error": "Database not available"}
         
         try:
-            # Prepare data
-            content_json = content if isinstance(content, dict) else {"text": content}
-            emotional_context = emotional_context or {}
-            tags = tags or []
-            expires_at = None
-            if expires_in_days:
-                expires_at = datetime.now() + timedelta(days=expires_in_days)
-            
-            # Generate embedding
-            content_text = self.embedding_manager.prepare_content_for_embedding(content_json)
-            if title:
-                content_text = f"{title}: {content_text}"
-            embedding = self.embedding_manager.generate_embedding(content_text)
-            
-            # Store in database (serialize JSON objects)
+            params = self.memory_params(memory_type, content, title, importance,
+                                        emotional_context, tags, expires_in_days)
             memory_id = self.database_manager.execute_insert(
-                """INSERT INTO memories (project_id, session_id, memory_type, title, content,
-                   importance_score, emotional_context, tags, embedding, expires_at) 
-                   VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s) RETURNING id;""",
-                (self.current_project_id, self.session_id, memory_type, title,
-                 json.dumps(content_json), importance, json.dumps(emotional_context), 
-                 tags, embedding, expires_at)
-            )
+                self.MEMORY_INSERT_SQL, params, prepared=True)
             
             if memory_id:
                 self.logger.info(f"Stored memory {memory_id}")
-                return {"success": True, "memory_id": memory_id, "has_embedding": embedding is not None}
+                return {"success": True, "memory_id": memory_id, "has_embedding": params[8] is not None}
             else:
                 return {"success": False, "error": "Failed to store memory"}
                 
@@ -78,12 +156,73 @@ class MemorySystem(MemorySystemBase):
             self.logger.error(f"Error storing memory: {e}")
             return {"success": False, "error": str(e)}
 
+    @invalidates_read_cache
+    def batch_write(self, ops: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Apply several memory writes in a single transaction.
+
+        Each op is a dict with an "op" key ("store_memory" or "reflect_on_interaction")
+        plus the keyword arguments that method would take.
+        """
+        if not self.database_manager.connection_pool:
+            return {"success": False, "error": "Database not available"}
+        
+        writers = {
+            "store_memory": (self.MEMORY_INSERT_SQL, self.memory_params),
+            "reflect_on_interaction": (self.enhanced_capabilities.REFLECTION_INSERT_SQL,
+                                       self.enhanced_capabilities.reflection_params),
+        }
+        
+        try:
+            names = []
+            statements = []
+            for op in ops:
+                arguments = dict(op)
+                name = arguments.pop("op", None)
+                if name not in writers:
+                    return {"success": False, "error": f"Unsupported batch operation: {name}"}
+                sql, build_params = writers[name]
+                names.append(name)
+                statements.append((sql, build_params(**arguments)))
+            
+            rows = self.database_manager.execute_transaction(statements)
+            if rows is None:
+                return {"success": False, "error": "Batch write failed"}
+            
+            return {
+                "success": True,
+                "results": [{"op": name, "id": row["id"] if row else None}
+                            for name, row in zip(names, rows)]
+            }
+            
+        except Exception as e:
+            self.logger.error(f"Error in batch write: {e}")
+            return {"success": False, "error": str(e)}
+
     def recall_memories(self, query: Optional[str] = None, memory_type: Optional[str] = None,
                         limit: int = 10, project_id: Optional[str] = None, 
                         include_other_projects: bool = False) -> List[Dict[str, Any]]:
         """Recall memories with optional semantic search."""
+        access_context, results = self._cached_read(
+            ("recall_memories", query, memory_type, limit, project_id, include_other_projects),
+            lambda: self._recall_memories(query, memory_type, limit, project_id, include_other_projects))
+        
+        # Log every recall, cached or not, so the forgetting curve sees how often memories are used
+        if results:
+            self.enhanced_capabilities.log_memory_access(
+                [memory['id'] for memory in results], access_context,
+                database_manager=self.database_manager)
+        return results
+
+    def _recall_memories(self, query: Optional[str], memory_type: Optional[str],
+                         limit: int, project_id: Optional[str],
+                         include_other_projects: bool) -> tuple:
+        """Run the recall query against the database.
+
+        Returns the access context to log alongside the recalled memories.
+        """
         if not self.database_manager.connection_pool:
-            return []
+            return "recall", []
         
         try:
             # Build WHERE conditions
@@ -110,12 +249,10 @@ class MemorySystem(MemorySystemBase):
                 if query_embedding:
                     search_sql, execution_params = self.embedding_manager.build_semantic_search_query(
                         where_conditions, params, query_embedding, limit)
-                    results = self.database_manager.execute_query(search_sql, tuple(execution_params))
+                    results = self.database_manager.execute_query(
+                        search_sql, tuple(execution_params), prepared=True)
                     if results:
-                        memory_ids = [memory['id'] for memory in results]
-                        self.enhanced_capabilities.log_memory_access(
-                            memory_ids, "semantic_search", database_manager=self.database_manager)
-                        return results
+                        return "semantic_search", results
             
             # Fallback to text search or simple query            if query:
                 search_sql, execution_params = self.embedding_manager.build_text_search_query(
@@ -128,17 +265,13 @@ class MemorySystem(MemorySystemBase):
                                 ORDER BY created_at DESC LIMIT %s;"""
                 execution_params = params + [limit]
             
-            results = self.database_manager.execute_query(search_sql, tuple(execution_params))
+            results = self.database_manager.execute_query(
+                search_sql, tuple(execution_params), prepared=True)
             
-            if results:
-                memory_ids = [memory['id'] for memory in results]
-                self.enhanced_capabilities.log_memory_access(
-                    memory_ids, "recall", database_manager=self.database_manager)
-            
-            return results or []            
+            return "recall", results or []            
         except Exception as e:
             self.logger.error(f"Error recalling memories: {e}")
-            return []
+            return "recall", []
 
     def recall_memories_weighted(self, **kwargs) -> List[Dict[str, Any]]:
         """Enhanced recall with weighted scoring."""
@@ -178,6 +311,7 @@ class MemorySystem(MemorySystemBase):
             self.logger.error(f"Error in weighted recall: {e}")
             return []
     
+    @invalidates_read_cache
     def update_memory(self, memory_id: int, **kwargs) -> Dict[str, Any]:
         """Update an existing memory."""
         if not self.database_manager.connection_pool:
@@ -192,7 +326,7 @@ class MemorySystem(MemorySystemBase):
                 content = kwargs['content']
                 content_json = content if isinstance(content, dict) else {"text": content}
                 update_fields.append("content = %s")
-                params.append(json.dumps(content_json))
+                params.append(dumps_json(content_json))
                 
                 # Regenerate embedding if content changed
                 if self.embedding_manager.embedding_model:
@@ -214,7 +348,7 @@ class MemorySystem(MemorySystemBase):
             
             if 'emotional_context' in kwargs:
                 update_fields.append("emotional_context = %s")
-                params.append(json.dumps(kwargs['emotional_context']))
+                params.append(dumps_json(kwargs['emotional_context']))
             
             if 'add_tags' in kwargs:
                 # Get current tags and merge
@@ -258,6 +392,7 @@ class MemorySystem(MemorySystemBase):
             database_manager=self.database_manager, **kwargs
         )
     
+    @invalidates_read_cache
     def apply_forgetting_curve(self, **kwargs) -> Dict[str, Any]:
         """Apply forgetting curve - delegate to enhanced capabilities."""
         return self.enhanced_capabilities.apply_forgetting_curve(
@@ -270,6 +405,7 @@ class MemorySystem(MemorySystemBase):
             database_manager=self.database_manager, **kwargs
         )
     
+    @invalidates_read_cache
     def reflect_on_interaction(self, **kwargs) -> Dict[str, Any]:
         """Reflect on interaction - delegate to enhanced capabilities."""
         return self.enhanced_capabilities.reflect_on_interaction(
@@ -278,12 +414,18 @@ class MemorySystem(MemorySystemBase):
     
     def get_emotional_insights(self, days_back: int = 30) -> Dict[str, Any]:
         """Get emotional insights - delegate to enhanced capabilities."""
-        return self.enhanced_capabilities.get_emotional_insights(
-            days_back, database_manager=self.database_manager
-        )
+        return self._cached_read(
+            ("get_emotional_insights", days_back),
+            lambda: self.enhanced_capabilities.get_emotional_insights(
+                days_back, database_manager=self.database_manager
+            ))
     
     def get_memory_summary(self) -> Dict[str, Any]:
         """Get memory summary from database."""
+        return self._cached_read(("get_memory_summary",), self._get_memory_summary)
+    
+    def _get_memory_summary(self) -> Dict[str, Any]:
+        """Build the memory summary from database statistics."""
         if not self.database_manager.connection_pool:
             return {"total_memories": 0, "error": "Database not available"}
         
@@ -299,6 +441,65 @@ class MemorySystem(MemorySystemBase):
             self.logger.error(f"Error getting memory summary: {e}")
             return {"total_memories": 0, "error": str(e)}
     
+    DASHBOARD_SQL = """
+    WITH recent AS (
+        SELECT id, memory_type, title, content, importance_score, tags, created_at
+        FROM memories
+        WHERE project_id = %s
+          AND (expires_at IS NULL OR expires_at > CURRENT_TIMESTAMP)
+        ORDER BY created_at DESC
+        LIMIT %s
+    ),
+    summary AS (
+        SELECT COALESCE(SUM(type_count), 0) AS total_memories,
+               COALESCE(jsonb_object_agg(memory_type, type_count), '{}'::jsonb) AS by_type
+        FROM (
+            SELECT memory_type, COUNT(*) AS type_count
+            FROM memories
+            WHERE project_id = %s
+            GROUP BY memory_type
+        ) AS type_counts
+    ),
+    emotional AS (
+        SELECT COUNT(*) AS total_reflections,
+               AVG(mood_score) AS average_mood,
+               MIN(mood_score) AS min_mood,
+               MAX(mood_score) AS max_mood
+        FROM emotional_reflections
+        WHERE project_id = %s
+          AND created_at >= CURRENT_TIMESTAMP - make_interval(days => %s)
+    )
+    SELECT
+        (SELECT COALESCE(jsonb_agg(to_jsonb(recent) ORDER BY created_at DESC), '[]'::jsonb) FROM recent) AS recent,
+        (SELECT to_jsonb(summary) FROM summary) AS summary,
+        (SELECT to_jsonb(emotional) FROM emotional) AS emotional;
+    """
+
+    def get_dashboard(self, limit: int = 20, days_back: int = 30) -> Dict[str, Any]:
+        """Get recent memories, memory counts and mood statistics in one round trip."""
+        return self._cached_read(("get_dashboard", limit, days_back),
+                                 lambda: self._get_dashboard(limit, days_back))
+
+    def _get_dashboard(self, limit: int, days_back: int) -> Dict[str, Any]:
+        """Run the aggregated dashboard query."""
+        if not self.database_manager.connection_pool:
+            return {"error": "Database not available"}
+        
+        project_id = self.current_project_id
+        rows = self.database_manager.execute_query(
+            self.DASHBOARD_SQL, (project_id, limit, project_id, project_id, days_back), prepared=True)
+        if not rows:
+            return {"error": "Failed to load dashboard"}
+        
+        dashboard = rows[0]
+        return {
+            "project_id": project_id,
+            "recent_memories": dashboard["recent"],
+            "summary": dashboard["summary"],
+            "emotional": {"period_days": days_back, **(dashboard["emotional"] or {})}
+        }
+    
+    @invalidates_read_cache
     def cleanup_expired_memories(self, **kwargs) -> Dict[str, Any]:
         """Cleanup expired memories - delegate to database manager."""
         try:
@@ -307,6 +508,7 @@ class MemorySystem(MemorySystemBase):
         except Exception as e:
             return {"success": False, "error": str(e)}
     
+    @invalidates_read_cache
     def update_embeddings_for_existing_memories(self, **kwargs) -> Dict[str, Any]:
         """Update embeddings for existing memories."""
         if not self.database_manager.connection_pool or not self.embedding_manager.embedding_model:
@@ -354,4 +556,11 @@ class MemorySystem(MemorySystemBase):
             return {"success": False, "error": str(e)}    # Properties for MCP tool compatibility - removed project_root property since it's already an attribute    @property 
     def connection_pool(self):
         """Get database connection pool."""
-        return getattr(self.database_manager, 'connection_pool', None)
\ No newline at end of file
+        return getattr(self.database_manager, 'connection_pool', None)
+
+
+@functools.lru_cache(maxsize=1)
+def get_memory_system(project_root: Optional[str] = None,
+                      embedding_model: str = "all-MiniLM-L6-v2") -> MemorySystem:
+    """Return a shared MemorySystem so repeated callers reuse one warm connection pool."""
+    return MemorySystem(project_root, embedding_model)
@@ -7,13 +7,14 @@ allowing AI assistants to store, recall, and reflect on memories across conversa
 """
 
 import os
+import asyncio
 from typing import Any, Dict, List, Optional
 
 try:
-    from .memory import MemorySystem
+    from .memory import get_memory_system
 except ImportError:
     # Fallback for direct execution
-    from memory import MemorySystem
+    from memory import get_memory_system
 
 
 class MemoryMCPTool:
@@ -21,7 +22,7 @@ class MemoryMCPTool:
     
     def __init__(self, project_root: str):
         self.project_root = project_root
-        self.memory_system = MemorySystem(project_root)
+        self.memory_system = get_memory_system(project_root)
     
     def store_memory(self, **kwargs) -> Dict[str, Any]:
         """
@@ -214,6 +215,22 @@ class MemoryMCPTool:
         except Exception as e:
             return {"success": False, "error": f"Failed to store reflection: {e}"}
     
+    def batch_write(self, ops: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Store memories and reflections together in a single transaction.
+
+        Args:
+            ops (list): Dicts with an "op" key ('store_memory' or 'reflect_on_interaction')
+                plus that operation's arguments
+
+        Returns:
+            Dictionary with the new row ID for each operation
+        """
+        try:
+            return self.memory_system.batch_write(ops)
+        except Exception as e:
+            return {"success": False, "error": f"Failed to write batch: {e}"}
+
     def get_emotional_insights(self, days_back: int = 30) -> Dict[str, Any]:
         """
         Get emotional insights and patterns from recent interactions.
@@ -244,6 +261,22 @@ class MemoryMCPTool:
         except Exception as e:
             return {"error": f"Failed to get memory summary: {e}"}
     
+    def get_dashboard(self, limit: int = 20, days_back: int = 30) -> Dict[str, Any]:
+        """
+        Get recent memories, memory counts and emotional statistics in a single query.
+        
+        Args:
+            limit (int): Number of recent memories to include, default 20
+            days_back (int): Number of days of reflections to summarize, default 30
+        
+        Returns:
+            Dictionary with recent memories, summary counts and mood statistics
+        """
+        try:
+            return self.memory_system.get_dashboard(limit, days_back)
+        except Exception as e:
+            return {"error": f"Failed to get dashboard: {e}"}
+    
     def cleanup_expired_memories(self) -> Dict[str, Any]:
         """
         Remove expired memories from the database.
@@ -306,69 +339,78 @@ def create_memory_tools(project_root: str) -> Dict[str, Any]:
     
     async def _store_memory(**kwargs):
         """Store a new memory."""
-        return memory_tool.store_memory(**kwargs)
+        return await asyncio.to_thread(memory_tool.store_memory, **kwargs)
     
     async def _recall_memories(**kwargs):
         """Recall relevant memories."""
-        return memory_tool.recall_memories(**kwargs)
+        return await asyncio.to_thread(memory_tool.recall_memories, **kwargs)
+    
+    async def _batch_write(**kwargs):
+        """Apply several memory writes in one transaction."""
+        return await asyncio.to_thread(memory_tool.batch_write, **kwargs)
     
     async def _update_memory(**kwargs):
         """Update an existing memory."""
-        return memory_tool.update_memory(**kwargs)
+        return await asyncio.to_thread(memory_tool.update_memory, **kwargs)
     
     async def _reflect_on_interaction(**kwargs):
         """Store an emotional reflection."""
-        return memory_tool.reflect_on_interaction(**kwargs)
+        return await asyncio.to_thread(memory_tool.reflect_on_interaction, **kwargs)
     
     async def _get_emotional_insights(**kwargs):
         """Get emotional insights."""
-        return memory_tool.get_emotional_insights(**kwargs)
+        return await asyncio.to_thread(memory_tool.get_emotional_insights, **kwargs)
     
     async def _get_memory_summary(**kwargs):
         """Get memory summary."""
-        return memory_tool.get_memory_summary(**kwargs)
+        return await asyncio.to_thread(memory_tool.get_memory_summary, **kwargs)
+    
+    async def _get_dashboard(**kwargs):
+        """Get combined memory dashboard."""
+        return await asyncio.to_thread(memory_tool.get_dashboard, **kwargs)
     
     async def _cleanup_expired_memories(**kwargs):
         """Cleanup expired memories."""
-        return memory_tool.cleanup_expired_memories(**kwargs)
+        return await asyncio.to_thread(memory_tool.cleanup_expired_memories, **kwargs)
     
     async def _get_project_context(**kwargs):
         """Get project context."""
-        return memory_tool.get_project_context(**kwargs)
+        return await asyncio.to_thread(memory_tool.get_project_context, **kwargs)
     
     async def _recall_memories_weighted(**kwargs):
         """Enhanced recall with weighted scoring."""
-        return memory_tool.recall_memories_weighted(**kwargs)
+        return await asyncio.to_thread(memory_tool.recall_memories_weighted, **kwargs)
     
     async def _store_persona_memory(**kwargs):
         """Store AI persona characteristics."""
-        return memory_tool.store_persona_memory(**kwargs)
+        return await asyncio.to_thread(memory_tool.store_persona_memory, **kwargs)
     
     async def _get_current_persona(**kwargs):
         """Get current AI persona."""
-        return memory_tool.get_current_persona(**kwargs)
+        return await asyncio.to_thread(memory_tool.get_current_persona, **kwargs)
     
     async def _generate_self_reflection(**kwargs):
         """Generate self-reflection."""
-        return memory_tool.generate_self_reflection(**kwargs)
+        return await asyncio.to_thread(memory_tool.generate_self_reflection, **kwargs)
     
     async def _apply_forgetting_curve(**kwargs):
         """Apply forgetting curve algorithm."""
-        return memory_tool.apply_forgetting_curve(**kwargs)
+        return await asyncio.to_thread(memory_tool.apply_forgetting_curve, **kwargs)
     
     async def _get_persona_evolution_summary(**kwargs):
         """Get persona evolution summary."""
-        return memory_tool.get_persona_evolution_summary(**kwargs)
+        return await asyncio.to_thread(memory_tool.get_persona_evolution_summary, **kwargs)
     
     async def _update_embeddings_for_existing_memories(**kwargs):
         """Update embeddings for existing memories."""
-        return memory_tool.update_embeddings_for_existing_memories(**kwargs)
+        return await asyncio.to_thread(memory_tool.update_embeddings_for_existing_memories, **kwargs)
     
     return {
         "store_memory": _store_memory,
         "recall_memories": _recall_memories,
         "recall_memories_weighted": _recall_memories_weighted,
         "update_memory": _update_memory,
+        "batch_write": _batch_write,
         "store_persona_memory": _store_persona_memory,
         "get_current_persona": _get_current_persona,
         "generate_self_reflection": _generate_self_reflection,
@@ -377,6 +419,7 @@ def create_memory_tools(project_root: str) -> Dict[str, Any]:
         "reflect_on_interaction": _reflect_on_interaction,
         "get_emotional_insights": _get_emotional_insights,
         "get_memory_summary": _get_memory_summary,
+        "get_dashboard": _get_dashboard,
         "cleanup_expired_memories": _cleanup_expired_memories,
         "get_project_context": _get_project_context,
         "update_embeddings_for_existing_memories": _update_embeddings_for_existing_memories,
@@ -0,0 +1,161 @@
+"""
+Result cache for the AI development tools.
+
+Editors re-run these tools on files that have not changed, and every call costs a
+full model round trip. Results are keyed by a SHA-256 of the tool name, its rule
+version, its arguments and the bytes of every file it reads, so editing a file
+is enough to miss the cache. Entries are saved under the worker's .mcp_cache
+directory, a few seconds after the last new result, so a restarted server can
+still reuse them.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from contextlib import suppress
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger("biting_lip.worker")
+
+# How long a model result is reused while its inputs stay the same
+RESULT_TTL_SECONDS = float(os.getenv("AI_RESULT_CACHE_TTL_SECONDS", "3600"))
+MAX_ENTRIES = 512
+# New results arriving within this window are written to disk together
+SAVE_DELAY_SECONDS = 5.0
+
+# Bump a tool's version whenever its prompt or model settings change, so its old results stop matching
+RULE_VERSIONS = {
+    "optimize_code": 1,
+    "smart_refactor": 1,
+    "generate_tests": 1,
+    "write_docs": 1,
+    "review_code": 2,
+}
+
+
+def _is_entry(entry: Any) -> bool:
+    """Return True for a saved [expires, result] pair with a numeric expiry."""
+    return (
+        isinstance(entry, list)
+        and len(entry) == 2
+        and isinstance(entry[0], (int, float))
+        and not isinstance(entry[0], bool)
+    )
+
+
+class AIResultCache:
+    """Content-addressed cache of AI tool results, persisted as JSON."""
+
+    def __init__(self, project_root: str, cache_dir: str, ttl_seconds: float = RESULT_TTL_SECONDS):
+        self.project_root = project_root
+        self.ttl_seconds = ttl_seconds
+        self.path = os.path.join(cache_dir, "ai_results.json")
+        self._entries: Dict[str, Tuple[float, Any]] = self._load()
+        self._lock = asyncio.Lock()
+        self._save_task: Optional["asyncio.Task[None]"] = None
+
+    def _load(self) -> Dict[str, Tuple[float, Any]]:
+        """Read the saved entries that have not expired yet."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        # A truncated or hand-edited file must not break every tool call, so anything unexpected starts empty
+        if not isinstance(saved, dict) or not all(_is_entry(entry) for entry in saved.values()):
+            logger.warning(f"Ignoring malformed AI result cache at {self.path}")
+            return {}
+        now = time.time()
+        return {key: (expires, result) for key, (expires, result) in saved.items() if expires > now}
+
+    def _save(self, entries: Dict[str, Tuple[float, Any]]) -> None:
+        """Write entries to disk, replacing the old file in one step."""
+        try:
+            cache_dir = os.path.dirname(self.path)
+            os.makedirs(cache_dir, exist_ok=True)
+            # Each writer gets its own temporary file, so servers sharing the directory never interleave
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=cache_dir, prefix="ai_results.", suffix=".tmp", delete=False
+            ) as f:
+                tmp_path = f.name
+                json.dump(entries, f, default=str)
+            try:
+                os.replace(tmp_path, self.path)
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Could not save AI result cache: {e}")
+
+    def _read_input(self, path: str) -> bytes:
+        """Return the bytes of a file a tool reads, or a marker when it does not exist."""
+        for candidate in (path, os.path.join(self.project_root, path)):
+            try:
+                with open(candidate, "rb") as f:
+                    return f.read()
+            except OSError:
+                continue
+        return b"\0missing"
+
+    def key(self, tool: str, arguments: Dict[str, Any]) -> Optional[str]:
+        """Return the cache key for a call, or None when its inputs cannot be hashed.
+
+        Reads every input file, so call it off the event loop.
+        """
+        if tool == "review_code" and arguments.get("diff_content") is None and not arguments.get("file_paths"):
+            # Without a diff or files the review reads the live git diff, which is not hashed here
+            return None
+        digest = hashlib.sha256(f"{tool}:{RULE_VERSIONS.get(tool, 0)}\n".encode())
+        digest.update(json.dumps(arguments, sort_keys=True, default=str).encode())
+        paths = list(arguments.get("file_paths") or ())
+        if arguments.get("file_path"):
+            paths.append(arguments["file_path"])
+        for path in paths:
+            digest.update(b"\0")
+            digest.update(self._read_input(path))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached result for key, or None when it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.time():
+            del self._entries[key]
+            return None
+        return entry[1]
+
+    async def put(self, key: str, result: Any) -> None:
+        """Store a result and schedule a save, so a burst of results costs one write."""
+        self._entries[key] = (time.time() + self.ttl_seconds, result)
+        if len(self._entries) > MAX_ENTRIES:
+            oldest = min(self._entries, key=lambda k: self._entries[k][0])
+            del self._entries[oldest]
+        if self._save_task is None:
+            self._save_task = asyncio.create_task(self._save_later())
+
+    async def _save_later(self) -> None:
+        """Wait out the save delay, then write the entries as they are by then."""
+        await asyncio.sleep(SAVE_DELAY_SECONDS)
+        await self._write()
+
+    async def _write(self) -> None:
+        """Write the current entries off the event loop, one write at a time."""
+        # Results stored from here on schedule a fresh save
+        self._save_task = None
+        async with self._lock:
+            await asyncio.to_thread(self._save, dict(self._entries))
+
+    async def flush(self) -> None:
+        """Write a pending save now, for a server that is shutting down."""
+        task = self._save_task
+        if task is None:
+            return
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+        await self._write()
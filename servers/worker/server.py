@@ -7,26 +7,73 @@ test generation, documentation writing, and code review using local Ollama LLMs.
 """
 
 import asyncio
-import json
+import logging
+import os
 import sys
-from pathlib import Path
-from typing import Any, Dict
+from functools import cache, cached_property
+from typing import Any, Callable, Dict
 
-# Add the current directory to the path for tool imports
-script_dir = Path(__file__).parent
-sys.path.insert(0, str(script_dir))
+try:
+    from .tool_catalog import TOOLS
+except ImportError:
+    from tool_catalog import TOOLS  # type: ignore
 
-# Import AI development tools
-from tools.ai_code_optimizer import AICodeOptimizer  # type: ignore
-from tools.ai_smart_refactorer import AISmartRefactorer  # type: ignore
-from tools.ai_test_generator import AITestGenerator  # type: ignore
-from tools.ai_documentation_writer import AIDocumentationWriter  # type: ignore
-from tools.ai_code_review_assistant import AICodeReviewAssistant  # type: ignore
+try:
+    from .ai_result_cache import AIResultCache
+except ImportError:
+    from ai_result_cache import AIResultCache  # type: ignore
 
+try:
+    from ..mcp_stdio import (InvalidArgumentsError, UnknownToolError, compile_argument_validator,
+                             result_text, run, serve)
+except ImportError:
+    # Run as a script: the shared transport sits one directory up, beside every server
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from mcp_stdio import (InvalidArgumentsError, UnknownToolError, compile_argument_validator,  # type: ignore
+                           result_text, run, serve)
 
+logger = logging.getLogger("biting_lip.worker")
+
+# Directory holding this server's tools package; it joins sys.path on the first tool import
+script_dir = os.path.dirname(os.path.abspath(__file__))
+_TOOLS_PATH_SET = False
+
+
+def _ensure_tools_on_path() -> None:
+    """Put this server's directory on sys.path so its tools package can be imported."""
+    global _TOOLS_PATH_SET
+    if not _TOOLS_PATH_SET:
+        if script_dir not in sys.path:
+            sys.path.insert(0, script_dir)
+        _TOOLS_PATH_SET = True
+
+# Model results are reused while the files and arguments behind them stay the same
+CACHE_ENABLED = os.getenv("CACHE_ENABLED", "true").lower() == "true"
+
+# Model calls one multi-file tool call keeps in flight at once, to stay within what Ollama serves well
+MAX_PARALLEL_FILES = 8
+
+
+@cache
 def get_project_root() -> str:
     """Get the Biting Lip project root directory (5 levels up from this file)."""
-    return str(Path(__file__).parent.parent.parent.parent.parent)
+    root = script_dir
+    for _ in range(4):
+        root = os.path.dirname(root)
+    return root
+
+
+# Tool catalog returned by tools/list; it is constant, so it is built once at import
+TOOLS_LIST = {"tools": TOOLS}
+
+# Input schema per tool, used to reject bad arguments before any work starts
+TOOL_SCHEMAS = {tool["name"]: tool["inputSchema"] for tool in TOOLS_LIST["tools"]}
+
+
+@cache
+def get_argument_validator(name: str) -> Callable[[Dict[str, Any]], None]:
+    """Return the argument validator for a tool, compiled on first use."""
+    return compile_argument_validator(TOOL_SCHEMAS.get(name))
 
 
 class AIDevelopmentMCPServer:
@@ -36,16 +83,65 @@ class AIDevelopmentMCPServer:
         self.name = "worker"
         self.version = "1.0.0"
         self.project_root = get_project_root()
+        # Tool name -> handler, so a call is one dict lookup instead of a name comparison chain
+        self._handlers = {
+            "optimize_code": self._h_optimize_code,
+            "smart_refactor": self._h_smart_refactor,
+            "generate_tests": self._h_generate_tests,
+            "write_docs": self._h_write_docs,
+            "review_code": self._h_review_code
+        }
         
-        # Initialize AI development tools
-        self.ai_code_optimizer = AICodeOptimizer(self.project_root)
-        self.ai_smart_refactorer = AISmartRefactorer(self.project_root)
-        self.ai_test_generator = AITestGenerator()
-        self.ai_documentation_writer = AIDocumentationWriter()
-        self.ai_code_review_assistant = AICodeReviewAssistant()
+    
+    @cached_property
+    def result_cache(self) -> AIResultCache:
+        """Content-hash cache of model results, loaded from disk on first use."""
+        # Kept beside the server, where the repository's .gitignore already covers .mcp_cache
+        return AIResultCache(self.project_root, os.path.join(script_dir, ".mcp_cache"))
+    
+    # AI development tools are imported and created on first use
+    @cached_property
+    def ai_code_optimizer(self):
+        """AI code optimizer."""
+        _ensure_tools_on_path()
+        from tools.ai_code_optimizer import AICodeOptimizer  # type: ignore
+        return AICodeOptimizer(self.project_root)
+    
+    @cached_property
+    def ai_smart_refactorer(self):
+        """AI smart refactorer."""
+        _ensure_tools_on_path()
+        from tools.ai_smart_refactorer import AISmartRefactorer  # type: ignore
+        return AISmartRefactorer(self.project_root)
+    
+    @cached_property
+    def ai_test_generator(self):
+        """AI test generator."""
+        _ensure_tools_on_path()
+        from tools.ai_test_generator import AITestGenerator  # type: ignore
+        return AITestGenerator()
+    
+    @cached_property
+    def ai_documentation_writer(self):
+        """AI documentation writer."""
+        _ensure_tools_on_path()
+        from tools.ai_documentation_writer import AIDocumentationWriter  # type: ignore
+        return AIDocumentationWriter()
+    
+    @cached_property
+    def ai_code_review_assistant(self):
+        """AI code review assistant."""
+        _ensure_tools_on_path()
+        from tools.ai_code_review_assistant import AICodeReviewAssistant  # type: ignore
+        return AICodeReviewAssistant()
     
     async def handle_initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle initialization request."""
+        return self._initialize_result
+    
+    @cached_property
+    def _initialize_result(self) -> Dict[str, Any]:
+        """Capabilities answered to initialize; they are fixed for the server's lifetime."""
         return {
             "protocolVersion": "2024-11-05",
             "capabilities": {
@@ -60,138 +156,32 @@ class AIDevelopmentMCPServer:
     
     async def handle_list_tools(self) -> Dict[str, Any]:
         """List all AI development tools."""
-        return {
-            "tools": [
-                {
-                    "name": "optimize_code",
-                    "description": "AI-powered code optimization using local Ollama LLMs, integrates with VS Code problems panel and Sourcery suggestions",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "file_path": {"type": "string", "description": "Path to the file to optimize"},
-                            "problems": {"type": "array", "items": {"type": "string"}, "description": "List of problems from VS Code diagnostics (optional)"}
-                        },
-                        "required": ["file_path"]
-                    }
-                },
-                {
-                    "name": "smart_refactor",
-                    "description": "AI-powered intelligent code refactoring suggestions using local Ollama LLMs",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "file_path": {"type": "string", "description": "Path to the file to refactor"},
-                            "target_scope": {"type": "string", "enum": ["function", "class", "method", "file"], "description": "Scope of refactoring"},
-                            "target_name": {"type": "string", "description": "Name of the specific function/class/method to refactor (optional)"}
-                        },
-                        "required": ["file_path"]
-                    }
-                },
-                {
-                    "name": "generate_tests",
-                    "description": "AI-powered test generation using local Ollama LLMs",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "file_path": {"type": "string", "description": "Path to the Python file to generate tests for"},
-                            "test_types": {"type": "array", "items": {"type": "string", "enum": ["unit", "integration", "edge", "error"]}, "description": "Types of tests to generate"},
-                            "coverage_target": {"type": "number", "description": "Target coverage percentage (0.0-1.0)"},
-                            "include_mocks": {"type": "boolean", "description": "Whether to include mock suggestions"},
-                            "include_fixtures": {"type": "boolean", "description": "Whether to generate pytest fixtures"}
-                        },
-                        "required": ["file_path"]
-                    }
-                },
-                {
-                    "name": "write_docs",
-                    "description": "AI-powered documentation generation using local Ollama LLMs",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "file_path": {"type": "string", "description": "Path to the Python file to document"},
-                            "doc_types": {"type": "array", "items": {"type": "string", "enum": ["docstrings", "readme", "api", "tutorial"]}, "description": "Types of documentation to generate"},
-                            "style": {"type": "string", "enum": ["google", "numpy", "sphinx"], "description": "Docstring style"},
-                            "include_examples": {"type": "boolean", "description": "Whether to include code examples"},
-                            "include_type_hints": {"type": "boolean", "description": "Whether to include type hint documentation"}
-                        },
-                        "required": ["file_path"]
-                    }
-                },
-                {
-                    "name": "review_code",
-                    "description": "AI-powered code review using local Ollama LLMs, analyzes git diffs and provides comprehensive feedback",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "file_paths": {"type": "array", "items": {"type": "string"}, "description": "Specific files to review (if not using git diff)"},
-                            "diff_content": {"type": "string", "description": "Git diff content to review (optional, will get from git if not provided)"},
-                            "review_types": {"type": "array", "items": {"type": "string", "enum": ["quality", "security", "style", "performance"]}, "description": "Types of review to perform"},
-                            "severity_threshold": {"type": "string", "enum": ["low", "medium", "high", "critical"], "description": "Minimum severity level to report"}                        },
-                        "required": []
-                    }
-                }
-            ]
-        }
+        return TOOLS_LIST
     
     async def handle_call_tool(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Handle tool execution requests."""
         try:
-            # AI Development Tools
-            if name == "optimize_code":
-                file_path = arguments["file_path"]
-                problems = arguments.get("problems", [])
-                result = self.ai_code_optimizer.optimize_code(file_path, problems)
-            elif name == "smart_refactor":
-                file_path = arguments["file_path"]
-                target_scope = arguments.get("target_scope", "file")
-                target_name = arguments.get("target_name")
-                result = self.ai_smart_refactorer.analyze_refactoring_opportunities(file_path, target_scope)
-            elif name == "generate_tests":
-                file_path = arguments["file_path"]
-                test_types = arguments.get("test_types", ["unit"])
-                coverage_target = arguments.get("coverage_target", 0.8)
-                include_fixtures = arguments.get("include_fixtures", True)
-                include_mocks = arguments.get("include_mocks", True)
-                result = await self.ai_test_generator.generate_tests(
-                    file_path, test_types, coverage_target, include_fixtures, include_mocks
-                )
-            elif name == "write_docs":
-                file_path = arguments["file_path"]
-                doc_types = arguments.get("doc_types", ["docstrings"])
-                style = arguments.get("style", "google")
-                include_examples = arguments.get("include_examples", True)
-                include_type_hints = arguments.get("include_type_hints", True)
-                result = await self.ai_documentation_writer.write_docs(
-                    file_path, doc_types, style, include_examples, include_type_hints
-                )
-            elif name == "review_code":
-                diff_content = arguments.get("diff_content")
-                file_paths = arguments.get("file_paths", [])
-                review_types = arguments.get("review_types", ["quality", "security", "style"])
-                severity_threshold = arguments.get("severity_threshold", "medium")
-                result = await self.ai_code_review_assistant.review_code(
-                    diff_content, file_paths, review_types, severity_threshold
-                )
-            else:
-                return {
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": f"Error: Unknown tool '{name}'"
-                        }
-                    ],
-                    "isError": True
-                }
-            
+            result = await self.call_tool_raw(name, arguments)
+        except UnknownToolError:
             return {
                 "content": [
                     {
                         "type": "text",
-                        "text": json.dumps(result, indent=2, default=str)
+                        "text": f"Error: Unknown tool '{name}'"
                     }
-                ]
+                ],
+                "isError": True
+            }
+        except InvalidArgumentsError as e:
+            return {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"Error: Invalid arguments for '{name}': {e}"
+                    }
+                ],
+                "isError": True
             }
-            
         except Exception as e:
             return {
                 "content": [
@@ -202,105 +192,123 @@ class AIDevelopmentMCPServer:
                 ],
                 "isError": True
             }
+        
+        return {
+            "content": [
+                {
+                    "type": "text",
+                    "text": result_text(result)
+                }
+            ]
+        }
+    
+    async def call_tool_raw(self, name: str, arguments: Dict[str, Any]) -> Any:
+        """Run a tool and return its Python result without the MCP text envelope.
+        
+        In-process callers use this to skip serializing the result only to parse it again.
+        Raises UnknownToolError for unknown tool names and InvalidArgumentsError for bad arguments.
+        """
+        if not isinstance(name, str):
+            raise UnknownToolError(name)
+        # Names arrive as fresh strings off the wire; interned, they match the table keys by identity
+        name = sys.intern(name)
+        handler = self._handlers.get(name)
+        if handler is None:
+            raise UnknownToolError(name)
+        get_argument_validator(name)(arguments)
+        if not CACHE_ENABLED:
+            return await handler(arguments)
+        
+        cache = self.result_cache
+        # Hashing reads the input files, so it stays off the event loop
+        key = await asyncio.to_thread(cache.key, name, arguments)
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+        
+        result = await handler(arguments)
+        # Failures (Ollama down, file missing) are worth retrying, so only successes are kept
+        if key is not None and not (isinstance(result, dict) and "error" in result):
+            await cache.put(key, result)
+        return result
+    
+    # AI Development Tools (the synchronous ones block on Ollama, so they run off the event loop)
+    async def _h_optimize_code(self, arguments: Dict[str, Any]) -> Any:
+        file_path = arguments["file_path"]
+        problems = arguments.get("problems", [])
+        return await asyncio.to_thread(self.ai_code_optimizer.optimize_code, file_path, problems)
+    
+    async def _h_smart_refactor(self, arguments: Dict[str, Any]) -> Any:
+        file_path = arguments["file_path"]
+        target_scope = arguments.get("target_scope", "file")
+        return await asyncio.to_thread(
+            self.ai_smart_refactorer.analyze_refactoring_opportunities, file_path, target_scope
+        )
+    
+    async def _h_generate_tests(self, arguments: Dict[str, Any]) -> Any:
+        test_types = arguments.get("test_types", ["unit"])
+        coverage_target = arguments.get("coverage_target", 0.8)
+        include_fixtures = arguments.get("include_fixtures", True)
+        include_mocks = arguments.get("include_mocks", True)
+        file_paths = arguments.get("file_paths")
+        if file_paths is not None:
+            # Each file is its own model round trip, so they overlap instead of queueing
+            limit = asyncio.Semaphore(MAX_PARALLEL_FILES)
+            
+            async def generate(path: str) -> Any:
+                async with limit:
+                    return await self.ai_test_generator.generate_tests(
+                        path, test_types, coverage_target, include_fixtures, include_mocks
+                    )
+            
+            results = await asyncio.gather(*(generate(path) for path in file_paths))
+            return dict(zip(file_paths, results))
+        return await self.ai_test_generator.generate_tests(
+            arguments["file_path"], test_types, coverage_target, include_fixtures, include_mocks
+        )
+    
+    async def _h_write_docs(self, arguments: Dict[str, Any]) -> Any:
+        file_path = arguments["file_path"]
+        doc_types = arguments.get("doc_types", ["docstrings"])
+        style = arguments.get("style", "google")
+        include_examples = arguments.get("include_examples", True)
+        include_type_hints = arguments.get("include_type_hints", True)
+        return await self.ai_documentation_writer.write_docs(
+            file_path, doc_types, style, include_examples, include_type_hints
+        )
+    
+    async def _h_review_code(self, arguments: Dict[str, Any]) -> Any:
+        diff_content = arguments.get("diff_content")
+        file_paths = arguments.get("file_paths", [])
+        review_types = arguments.get("review_types", ["quality", "security", "style"])
+        severity_threshold = arguments.get("severity_threshold", "medium")
+        return await self.ai_code_review_assistant.review_code(
+            diff_content, file_paths, review_types, severity_threshold
+        )
+
 async def main():
     """Main MCP server loop."""
     server = AIDevelopmentMCPServer()
     
-    # Send initial capabilities to stderr for debugging
-    sys.stderr.write("AI Development MCP Server Starting (5 AI tools)...\n")
-    sys.stderr.flush()
+    logging.basicConfig(
+        stream=sys.stderr,
+        level=os.getenv("AI_DEV_LOG_LEVEL", "INFO").upper(),
+        format="%(message)s"
+    )
+    logger.info("AI Development MCP Server Starting (5 AI tools)...")
     
-    while True:
-        try:
-            # Read a line from stdin
-            line = await asyncio.get_event_loop().run_in_executor(None, sys.stdin.readline)
-            if not line:
-                break
-            
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Parse the JSON-RPC message
-            try:
-                request = json.loads(line)
-            except json.JSONDecodeError as e:
-                sys.stderr.write(f"JSON decode error: {e} for line: {line}\n")
-                sys.stderr.flush()
-                continue
-            
-            method = request.get("method")
-            params = request.get("params", {})
-            request_id = request.get("id")
-            
-            sys.stderr.write(f"Received method: {method}\n")
-            sys.stderr.flush()
-            
-            # Handle the request
-            try:
-                if method == "initialize":
-                    result = await server.handle_initialize(params)
-                elif method == "initialized":
-                    # Just acknowledge the initialized notification
-                    continue
-                elif method == "tools/list":
-                    result = await server.handle_list_tools()
-                elif method == "tools/call":
-                    tool_name = params.get("name")
-                    arguments = params.get("arguments", {})
-                    result = await server.handle_call_tool(tool_name, arguments)
-                elif method == "ping":
-                    result = {"status": "pong"}
-                elif method == "notifications/initialized":
-                    # Handle notification
-                    continue
-                else:
-                    # Unknown method
-                    sys.stderr.write(f"Unknown method: {method}\n")
-                    sys.stderr.flush()
-                    if request_id is not None:
-                        error_response = {
-                            "jsonrpc": "2.0",
-                            "id": request_id,
-                            "error": {
-                                "code": -32601,
-                                "message": f"Method not found: {method}"
-                            }
-                        }
-                        print(json.dumps(error_response))
-                        sys.stdout.flush()
-                    continue
-                
-                # Send successful response (only for requests with id)
-                if request_id is not None:
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "result": result
-                    }
-                    print(json.dumps(response))
-                    sys.stdout.flush()
-                
-            except Exception as e:
-                sys.stderr.write(f"Error handling method {method}: {e}\n")
-                sys.stderr.flush()
-                # Send error response (only for requests with id)
-                if request_id is not None:
-                    error_response = {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "error": {
-                            "code": -32603,
-                            "message": str(e)
-                        }
-                    }
-                    print(json.dumps(error_response))
-                    sys.stdout.flush()
-                
-        except Exception as e:
-            sys.stderr.write(f"Server error: {e}\n")
-            sys.stderr.flush()
+    await serve(server, TOOLS_LIST)
+    if "result_cache" in server.__dict__:
+        # Results from the last few seconds are still waiting for their delayed save
+        await server.result_cache.flush()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if "--list-tools" in sys.argv[1:]:
+        # Print the catalog without starting the event loop or loading any tool
+        for number, tool in enumerate(TOOLS, 1):
+            print(f"{number:2d}. {tool['name']}\n    {tool['description']}\n")
+        sys.exit(0)
+    
+    run(main())
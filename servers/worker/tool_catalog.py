@@ -0,0 +1,79 @@
+"""
+Tool catalog for the AI Development MCP server.
+
+Pure data: the name, description and input schema of every tool, importable
+without loading the server or any of its tools.
+"""
+
+TOOLS = [
+    {
+        "name": "optimize_code",
+        "description": "AI-powered code optimization using local Ollama LLMs, integrates with VS Code problems panel and Sourcery suggestions",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "file_path": {"type": "string", "description": "Path to the file to optimize"},
+                "problems": {"type": "array", "items": {"type": "string"}, "description": "List of problems from VS Code diagnostics (optional)"}
+            },
+            "required": ["file_path"]
+        }
+    },
+    {
+        "name": "smart_refactor",
+        "description": "AI-powered intelligent code refactoring suggestions using local Ollama LLMs",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "file_path": {"type": "string", "description": "Path to the file to refactor"},
+                "target_scope": {"type": "string", "enum": ["function", "class", "method", "file"], "description": "Scope of refactoring"},
+                "target_name": {"type": "string", "description": "Name of the specific function/class/method to refactor (optional)"}
+            },
+            "required": ["file_path"]
+        }
+    },
+    {
+        "name": "generate_tests",
+        "description": "AI-powered test generation using local Ollama LLMs",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "file_path": {"type": "string", "description": "Path to the Python file to generate tests for"},
+                "file_paths": {"type": "array", "items": {"type": "string"}, "description": "Generate tests for several files in one call instead of file_path (optional); results are keyed by path"},
+                "test_types": {"type": "array", "items": {"type": "string", "enum": ["unit", "integration", "edge", "error"]}, "description": "Types of tests to generate"},
+                "coverage_target": {"type": "number", "description": "Target coverage percentage (0.0-1.0)"},
+                "include_mocks": {"type": "boolean", "description": "Whether to include mock suggestions"},
+                "include_fixtures": {"type": "boolean", "description": "Whether to generate pytest fixtures"}
+            },
+            "required": [],
+            "anyOf": [{"required": ["file_path"]}, {"required": ["file_paths"]}]
+        }
+    },
+    {
+        "name": "write_docs",
+        "description": "AI-powered documentation generation using local Ollama LLMs",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "file_path": {"type": "string", "description": "Path to the Python file to document"},
+                "doc_types": {"type": "array", "items": {"type": "string", "enum": ["docstrings", "readme", "api", "tutorial"]}, "description": "Types of documentation to generate"},
+                "style": {"type": "string", "enum": ["google", "numpy", "sphinx"], "description": "Docstring style"},
+                "include_examples": {"type": "boolean", "description": "Whether to include code examples"},
+                "include_type_hints": {"type": "boolean", "description": "Whether to include type hint documentation"}
+            },
+            "required": ["file_path"]
+        }
+    },
+    {
+        "name": "review_code",
+        "description": "AI-powered code review using local Ollama LLMs, analyzes git diffs and provides comprehensive feedback",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "file_paths": {"type": "array", "items": {"type": "string"}, "description": "Specific files to review (if not using git diff)"},
+                "diff_content": {"type": "string", "description": "Git diff content to review (optional, will get from git if not provided)"},
+                "review_types": {"type": "array", "items": {"type": "string", "enum": ["quality", "security", "style", "performance"]}, "description": "Types of review to perform"},
+                "severity_threshold": {"type": "string", "enum": ["low", "medium", "high", "critical"], "description": "Minimum severity level to report"}                        },
+            "required": []
+        }
+    }
+]
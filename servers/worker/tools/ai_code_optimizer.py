@@ -12,6 +12,8 @@ import subprocess
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+from .ollama_client import get_session, is_ollama_available
+
 
 class AICodeOptimizer:
     """Optimizes code using local Ollama LLMs based on VS Code diagnostics."""
@@ -143,7 +145,7 @@ class AICodeOptimizer:
         try:
             prompt = self._create_optimization_prompt(code, problem, file_path)
             
-            response = requests.post(
+            response = get_session().post(
                 f"{self.ollama_url}/api/generate",
                 json={
                     "model": self.default_model,
@@ -193,7 +195,7 @@ Provide specific, actionable suggestions with line numbers where possible.
 Focus on the most impactful improvements.
 """
             
-            response = requests.post(
+            response = get_session().post(
                 f"{self.ollama_url}/api/generate",
                 json={
                     "model": self.default_model,
@@ -258,16 +260,12 @@ Be concise and practical.
     
     def _check_ollama_available(self) -> bool:
         """Check if Ollama is running and accessible."""
-        try:
-            response = requests.get(f"{self.ollama_url}/api/tags", timeout=5)
-            return response.status_code == 200
-        except requests.RequestException:
-            return False
+        return is_ollama_available(self.ollama_url)
     
     def list_available_models(self) -> Dict[str, Any]:
         """List available models in Ollama."""
         try:
-            response = requests.get(f"{self.ollama_url}/api/tags", timeout=10)
+            response = get_session().get(f"{self.ollama_url}/api/tags", timeout=10)
             if response.status_code == 200:
                 models = response.json().get("models", [])
                 return {
@@ -16,19 +16,112 @@ Features:
 """
 
 import ast
+import asyncio
 import json
 import logging
-import os
 import re
 import subprocess
-import requests
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+from .ollama_client import get_session
 
 logger = logging.getLogger(__name__)
 
 
+# Files read at once when reviewing several files
+MAX_READ_WORKERS = 16
+
+# The review answer is a bounded JSON object, so generation is capped and kept near-deterministic
+REVIEW_GENERATION_OPTIONS = {"num_predict": 1024, "temperature": 0.1, "top_p": 0.9}
+
+# Diff line marker -> change type recorded for the line
+DIFF_LINE_TYPES = {"+": "added", "-": "removed", " ": "context"}
+
+# Rank of each issue severity, used against the review's severity threshold
+SEVERITY_ORDER = {"low": 0, "medium": 1, "high": 2, "critical": 3}
+
+# Vendored, installed or bundled code the line-level reviews leave alone
+SKIPPED_FILE_PATTERN = re.compile(r"(?:^|/)(?:vendor|node_modules|site-packages)/|\.(?:min|bundle)\.")
+
+# Line patterns checked by the security and performance reviews, compiled once at import
+_SECURITY_PATTERN_SOURCES = {
+    "sql_injection": [
+        r"execute\s*\(\s*[\"'].*%.*[\"']",
+        r"\.format\s*\(",
+        r"f[\"'].*\{.*\}.*[\"'].*execute"
+    ],
+    "hardcoded_secrets": [
+        r"password\s*=\s*[\"'][^\"']+[\"']",
+        r"api_key\s*=\s*[\"'][^\"']+[\"']",
+        r"secret\s*=\s*[\"'][^\"']+[\"']",
+        r"token\s*=\s*[\"'][^\"']+[\"']"
+    ],
+    "unsafe_deserialize": [
+        r"pickle\.loads?",
+        r"eval\s*\(",
+        r"exec\s*\("
+    ],
+    "path_traversal": [
+        r"open\s*\(\s*.*\+",
+        r"\.\./"
+    ]
+}
+
+_PERFORMANCE_PATTERN_SOURCES = {
+    "inefficient_loop": [
+        r"for.*in.*range\(len\(",
+        r"while.*len\("
+    ],
+    "repeated_computation": [
+        r"for.*in.*:.*\..*\(",
+        r"while.*:.*\..*\("
+    ],
+    "memory_inefficient": [
+        r"\[\].*for.*in",  # List comprehension that could be generator
+        r"\.append\(.*for.*in"  # Append in loop
+    ]
+}
+
+SECURITY_PATTERNS = {
+    kind: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+    for kind, patterns in _SECURITY_PATTERN_SOURCES.items()
+}
+PERFORMANCE_PATTERNS = {
+    kind: [re.compile(pattern) for pattern in patterns]
+    for kind, patterns in _PERFORMANCE_PATTERN_SOURCES.items()
+}
+UPPERCASE_IMPORT_PATTERN = re.compile(r'^\s*import\s+([A-Z])')
+
+# Each review's patterns fused into one alternation: a line matching none of them (most
+# lines) costs a single search, and only the rest are checked pattern by pattern
+SECURITY_SCREEN = re.compile(
+    "|".join(f"(?:{pattern})" for patterns in _SECURITY_PATTERN_SOURCES.values() for pattern in patterns),
+    re.IGNORECASE
+)
+PERFORMANCE_SCREEN = re.compile(
+    "|".join(f"(?:{pattern})" for patterns in _PERFORMANCE_PATTERN_SOURCES.values() for pattern in patterns)
+)
+
+
+def loads_json(data: Union[str, bytes]) -> Any:
+    """Parse JSON text or bytes (model answers, Ollama replies), using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class AICodeReviewAssistant:
     """AI-powered code review assistant using local Ollama LLMs."""
     
@@ -64,38 +157,43 @@ class AICodeReviewAssistant:
             
             # Get diff content if not provided
             if diff_content is None and file_paths is None:
-                diff_content = self._get_git_diff()
-            elif file_paths:
-                diff_content = self._create_file_diff(file_paths)
-            
-            if not diff_content:
-                return {"error": "No changes found to review"}
-            
-            # Parse diff and extract changes
-            changes = self._parse_diff(diff_content)
-            
-            # Analyze changes for different review aspects
-            review_results = {}
-            
-            if "quality" in review_types:
-                review_results["quality"] = await self._review_code_quality(changes)
-            
-            if "security" in review_types:
-                review_results["security"] = await self._review_security(changes)
-            
-            if "style" in review_types:
-                review_results["style"] = await self._review_code_style(changes)
+                # Reading and parsing a large diff takes a while, so it runs off the event loop
+                changes = await asyncio.to_thread(self._git_diff_changes)
+                if changes is None:
+                    return {"error": "No changes found to review"}
+            else:
+                if file_paths:
+                    # File reads wait on disk, so they run off the event loop
+                    diff_content = await asyncio.to_thread(self._create_file_diff, file_paths)
+                
+                if not diff_content:
+                    return {"error": "No changes found to review"}
+                
+                # Parse diff and extract changes
+                changes = self._parse_diff(diff_content)
+            
+            # Analyze changes for different review aspects; they are independent, so the
+            # local checks run while the model call for the quality review is in flight
+            reviewers = {
+                "quality": self._review_code_quality,
+                "security": self._review_security,
+                "style": self._review_code_style,
+                "performance": self._review_performance
+            }
+            selected = [review_type for review_type in reviewers if review_type in review_types]
+            results = await asyncio.gather(*(reviewers[review_type](changes) for review_type in selected))
+            review_results = dict(zip(selected, results))
             
-            if "performance" in review_types:
-                review_results["performance"] = await self._review_performance(changes)
+            # Group every reported issue by severity once for the assessment and the action plan
+            issues_by_severity = self._bucket_issues(review_results)
             
             # Generate overall assessment
             overall_assessment = self._generate_overall_assessment(
-                review_results, severity_threshold
+                review_results, issues_by_severity, severity_threshold
             )
             
             # Create action plan
-            action_plan = self._create_action_plan(review_results, severity_threshold)
+            action_plan = self._create_action_plan(issues_by_severity)
             
             return {
                 "success": True,
@@ -115,81 +213,129 @@ class AICodeReviewAssistant:
             logger.error(f"Error during code review: {e}")
             return {"error": f"Code review failed: {str(e)}"}
     
-    def _get_git_diff(self) -> str:
-        """Get git diff for staged/unstaged changes."""
+    def _start_git_diff(self, *args: str) -> subprocess.Popen:
+        """Start a git diff whose output is read line by line as it is produced."""
+        return subprocess.Popen(
+            ["git", "diff", *args],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
+        )
+    
+    def _iter_git_diff(self) -> Iterator[str]:
+        """Yield the lines of the git diff for staged/unstaged changes."""
         try:
-            # Try to get staged changes first
-            result = subprocess.run(
-                ["git", "diff", "--cached"],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            
-            if result.stdout.strip():
-                return result.stdout
-            
-            # If no staged changes, get unstaged changes
-            result = subprocess.run(
-                ["git", "diff"],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            
-            return result.stdout
-            
+            # Both diffs start together, so falling back to unstaged changes (the usual case)
+            # costs no extra git run on top of the staged one
+            staged = self._start_git_diff("--cached")
+            unstaged = self._start_git_diff()
         except Exception as e:
             logger.error(f"Failed to get git diff: {e}")
-            return ""
+            return
+        
+        try:
+            # Staged changes take precedence; their lines are held back only until one shows
+            # that something is staged, otherwise the unstaged changes are reviewed
+            held = []
+            for line in staged.stdout:
+                held.append(line)
+                if line.strip():
+                    for staged_line in chain(held, staged.stdout):
+                        yield staged_line.rstrip("\n")
+                    return
+            for line in unstaged.stdout:
+                yield line.rstrip("\n")
+        finally:
+            # The unread diff may be blocked on a full pipe; stop it rather than wait for it
+            for process in (staged, unstaged):
+                process.kill()
+                process.stdout.close()
+                process.wait()
+    
+    def _git_diff_changes(self) -> Optional[List[Dict[str, Any]]]:
+        """Parse the git diff as git writes it, or return None when nothing has changed."""
+        # The diff is parsed line by line instead of being held in memory whole
+        diff_lines = self._iter_git_diff()
+        first_line = next(diff_lines, None)
+        if first_line is None:
+            return None
+        return self._parse_diff_lines(chain((first_line,), diff_lines))
+    
+    def _read_source(self, file_path: str) -> Optional[str]:
+        """Read a file to review, or return None when it is missing or unreadable."""
+        try:
+            return Path(file_path).read_text(encoding='utf-8')
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Failed to read file {file_path}: {e}")
+            return None
     
     def _create_file_diff(self, file_paths: List[str]) -> str:
         """Create a pseudo-diff from file contents."""
-        diff_content = ""
+        # Reads are I/O waits, so several files are read at once
+        if len(file_paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(file_paths))) as pool:
+                contents = list(pool.map(self._read_source, file_paths))
+        else:
+            contents = [self._read_source(file_path) for file_path in file_paths]
         
-        for file_path in file_paths:
-            if os.path.exists(file_path):
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    diff_content += f"--- a/{file_path}\n"
-                    diff_content += f"+++ b/{file_path}\n"
-                    
-                    for i, line in enumerate(content.splitlines(), 1):
-                        diff_content += f"+{i}: {line}\n"
-                    
-                    diff_content += "\n"
-                    
-                except Exception as e:
-                    logger.error(f"Failed to read file {file_path}: {e}")
+        # Chunks are joined once at the end; growing one string line by line copies it every time
+        parts = []
         
-        return diff_content
+        for file_path, content in zip(file_paths, contents):
+            if content is None:
+                continue
+            
+            parts.append(f"--- a/{file_path}\n+++ b/{file_path}\n")
+            parts.extend(f"+{i}: {line}\n" for i, line in enumerate(content.splitlines(), 1))
+            parts.append("\n")
+        
+        return "".join(parts)
     
     def _parse_diff(self, diff_content: str) -> List[Dict[str, Any]]:
         """Parse git diff content into structured changes."""
+        return self._parse_diff_lines(diff_content.splitlines())
+    
+    def _parse_diff_lines(self, lines: Iterable[str]) -> List[Dict[str, Any]]:
+        """Parse git diff lines into structured changes."""
         changes = []
         current_file = None
         current_hunk = []
+        added_count = 0
+        line_number = 0
         
-        for line in diff_content.splitlines():
-            if line.startswith("--- a/") or line.startswith("--- /dev/null"):
+        # Dispatch on the first character so content lines, the bulk of any diff, skip the
+        # header checks; a full prefix test only runs for lines that can be headers
+        for line in lines:
+            marker = line[:1]
+            if marker == "@":
+                if line.startswith("@@"):
+                    if current_hunk and current_file:
+                        changes.append({
+                            "file": current_file,
+                            "type": "modification",
+                            "lines": current_hunk,
+                            "added_count": added_count
+                        })
+                    current_hunk = []
+                    added_count = 0
+                    line_number = 0
+            elif marker == "-" and line.startswith(("--- a/", "--- /dev/null")):
                 current_file = line[6:] if line.startswith("--- a/") else None
-            elif line.startswith("+++ b/"):
+            elif marker == "+" and line.startswith("+++ b/"):
                 current_file = line[6:]
-            elif line.startswith("@@"):
-                if current_hunk and current_file:
-                    changes.append({
-                        "file": current_file,
-                        "type": "modification",
-                        "lines": current_hunk.copy()
-                    })
-                current_hunk = []
-            elif line.startswith(("+", "-", " ")):
+            else:
+                line_type = DIFF_LINE_TYPES.get(marker)
+                if line_type is None:
+                    continue
+                if marker == "+":
+                    added_count += 1
+                line_number += 1
                 current_hunk.append({
-                    "type": "added" if line.startswith("+") else "removed" if line.startswith("-") else "context",
+                    "type": line_type,
                     "content": line[1:],
-                    "line_number": len(current_hunk) + 1
+                    "line_number": line_number
                 })
         
         # Add final hunk
@@ -197,7 +343,8 @@ class AICodeReviewAssistant:
             changes.append({
                 "file": current_file,
                 "type": "modification",
-                "lines": current_hunk
+                "lines": current_hunk,
+                "added_count": added_count
             })
         
         return changes
@@ -205,26 +352,20 @@ class AICodeReviewAssistant:
     async def _review_code_quality(self, changes: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Review code quality aspects."""
         try:
-            # Extract added/modified code
-            code_changes = []
-            for change in changes:
-                added_lines = [
-                    line["content"] for line in change.get("lines", [])
-                    if line["type"] == "added"
-                ]
-                if added_lines:
-                    code_changes.append({
-                        "file": change["file"],
-                        "code": "\n".join(added_lines)
-                    })
-            
-            if not code_changes:
+            # Diffs that only remove lines give the model nothing to review
+            if not any(change.get("added_count") for change in changes):
                 return {"issues": [], "suggestions": []}
             
-            # Prepare code for AI review
+            # Prepare code for AI review: the added lines of every hunk that has any, joined
+            # straight into the prompt text (str.join turns a generator into a list first
+            # anyway, so the comprehensions stay lists)
             code_for_review = "\n\n".join([
-                f"File: {change['file']}\n{change['code']}"
-                for change in code_changes
+                "File: {}\n{}".format(
+                    change["file"],
+                    "\n".join([line["content"] for line in change["lines"] if line["type"] == "added"])
+                )
+                for change in changes
+                if change.get("added_count")
             ])
             
             prompt = f"""
@@ -258,62 +399,99 @@ class AICodeReviewAssistant:
             }}
             """
             
-            response = requests.post(
-                f"{self.ollama_url}/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": prompt,
-                    "stream": False
-                },
-                timeout=self.timeout
-            )
+            # The blocking HTTP call runs in a thread so it does not stall the event loop
+            ai_response = await asyncio.to_thread(self._generate_review, prompt)
             
-            if response.status_code == 200:
-                result = response.json()
-                ai_response = result.get("response", "{}")
-                
-                # Try to parse JSON response
-                try:
-                    return json.loads(ai_response)
-                except json.JSONDecodeError:
-                    # Fallback if AI doesn't return valid JSON
-                    return {
-                        "issues": [{"description": "AI review completed but response format was invalid"}],
-                        "summary": ai_response[:500]  # First 500 chars
-                    }
-            else:
+            if ai_response is None:
                 return {"error": "AI service unavailable"}
+            
+            # Try to parse JSON response
+            try:
+                review = loads_json(ai_response)
+            except json.JSONDecodeError:
+                # Fallback if AI doesn't return valid JSON
+                return {
+                    "issues": [{"description": "AI review completed but response format was invalid"}],
+                    "summary": ai_response[:500]  # First 500 chars
+                }
+            
+            return review
                 
         except Exception as e:
             logger.error(f"Code quality review failed: {e}")
             return {"error": f"Quality review error: {str(e)}"}
     
+    def _generate_review(self, prompt: str) -> Optional[str]:
+        """Stream the model's answer to prompt, or return None when Ollama is unavailable.
+        
+        An answer that starts as a JSON object is complete once that object closes, so the
+        stream is dropped there instead of waiting for whatever the model adds after it.
+        """
+        response = get_session().post(
+            f"{self.ollama_url}/api/generate",
+            json={
+                "model": self.model,
+                "prompt": prompt,
+                "stream": True,
+                "format": "json",
+                "options": REVIEW_GENERATION_OPTIONS
+            },
+            timeout=self.timeout,
+            stream=True
+        )
+        
+        with response:
+            if response.status_code != 200:
+                return None
+            
+            fragments = []
+            # Brace depth of the JSON object the answer opens with (None until it opens,
+            # -1 once the answer turns out not to start with an object)
+            depth = None
+            in_string = False
+            escaped = False
+            
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = loads_json(line)
+                fragment = chunk.get("response", "")
+                fragments.append(fragment)
+                if chunk.get("done"):
+                    break
+                if depth == -1:
+                    continue
+                
+                for index, char in enumerate(fragment):
+                    if depth is None:
+                        if char.isspace():
+                            continue
+                        depth = 0 if char == "{" else -1
+                        if depth == -1:
+                            break
+                    if in_string:
+                        if escaped:
+                            escaped = False
+                        elif char == "\\":
+                            escaped = True
+                        elif char == '"':
+                            in_string = False
+                    elif char == '"':
+                        in_string = True
+                    elif char == "{":
+                        depth += 1
+                    elif char == "}":
+                        depth -= 1
+                        if depth == 0:
+                            # The object is closed; drop the rest and stop the generation
+                            fragments[-1] = fragment[:index + 1]
+                            return "".join(fragments)
+            
+            return "".join(fragments)
+    
     async def _review_security(self, changes: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Review security aspects of code changes."""
         try:
-            security_patterns = {
-                "sql_injection": [
-                    r"execute\s*\(\s*[\"'].*%.*[\"']",
-                    r"\.format\s*\(",
-                    r"f[\"'].*\{.*\}.*[\"'].*execute"
-                ],
-                "hardcoded_secrets": [
-                    r"password\s*=\s*[\"'][^\"']+[\"']",
-                    r"api_key\s*=\s*[\"'][^\"']+[\"']",
-                    r"secret\s*=\s*[\"'][^\"']+[\"']",
-                    r"token\s*=\s*[\"'][^\"']+[\"']"
-                ],
-                "unsafe_deserialize": [
-                    r"pickle\.loads?",
-                    r"eval\s*\(",
-                    r"exec\s*\("
-                ],
-                "path_traversal": [
-                    r"open\s*\(\s*.*\+",
-                    r"\.\./"
-                ]
-            }
-            
             security_issues = []
             
             for change in changes:
@@ -321,11 +499,13 @@ class AICodeReviewAssistant:
                 for line in change.get("lines", []):
                     if line["type"] == "added":
                         content = line["content"]
+                        if not SECURITY_SCREEN.search(content):
+                            continue
                         
                         # Check for security patterns
-                        for vulnerability_type, patterns in security_patterns.items():
+                        for vulnerability_type, patterns in SECURITY_PATTERNS.items():
                             for pattern in patterns:
-                                if re.search(pattern, content, re.IGNORECASE):
+                                if pattern.search(content):
                                     security_issues.append({
                                         "severity": "high",
                                         "category": "security",
@@ -347,6 +527,10 @@ class AICodeReviewAssistant:
             logger.error(f"Security review failed: {e}")
             return {"error": f"Security review error: {str(e)}"}
     
+    def _is_python_source(self, file_name: str) -> bool:
+        """Whether a changed file is hand-written Python worth scanning line by line."""
+        return file_name.endswith('.py') and not SKIPPED_FILE_PATTERN.search(file_name)
+    
     async def _review_code_style(self, changes: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Review code style and conventions."""
         try:
@@ -354,7 +538,7 @@ class AICodeReviewAssistant:
             
             for change in changes:
                 file_name = change["file"]
-                if not file_name.endswith('.py'):
+                if not self._is_python_source(file_name):
                     continue
                 
                 for line in change.get("lines", []):
@@ -381,31 +565,21 @@ class AICodeReviewAssistant:
         try:
             performance_issues = []
             
-            performance_patterns = {
-                "inefficient_loop": [
-                    r"for.*in.*range\(len\(",
-                    r"while.*len\("
-                ],
-                "repeated_computation": [
-                    r"for.*in.*:.*\..*\(",
-                    r"while.*:.*\..*\("
-                ],
-                "memory_inefficient": [
-                    r"\[\].*for.*in",  # List comprehension that could be generator
-                    r"\.append\(.*for.*in"  # Append in loop
-                ]
-            }
-            
             for change in changes:
                 file_name = change["file"]
+                # The anti-patterns are Python idioms; other files would only produce noise
+                if not self._is_python_source(file_name):
+                    continue
                 for line in change.get("lines", []):
                     if line["type"] == "added":
                         content = line["content"]
+                        if not PERFORMANCE_SCREEN.search(content):
+                            continue
                         
                         # Check for performance anti-patterns
-                        for issue_type, patterns in performance_patterns.items():
+                        for issue_type, patterns in PERFORMANCE_PATTERNS.items():
                             for pattern in patterns:
-                                if re.search(pattern, content):
+                                if pattern.search(content):
                                     performance_issues.append({
                                         "severity": "medium",
                                         "category": "performance",
@@ -467,7 +641,7 @@ class AICodeReviewAssistant:
             })
         
         # Variable naming (basic check)
-        import_match = re.search(r'^\s*import\s+([A-Z])', content)
+        import_match = UPPERCASE_IMPORT_PATTERN.match(content)
         if import_match:
             issues.append({
                 "severity": "low",
@@ -500,22 +674,27 @@ class AICodeReviewAssistant:
         }
         return suggestions.get(issue_type, "Consider optimizing this code for better performance")
     
+    def _bucket_issues(self, review_results: Dict[str, Any]) -> Dict[Any, List[Dict[str, Any]]]:
+        """Group the issues of every review aspect by their severity, keeping report order."""
+        issues_by_severity = defaultdict(list)
+        for results in review_results.values():
+            if "issues" in results:
+                for issue in results["issues"]:
+                    issues_by_severity[issue.get("severity")].append(issue)
+        return issues_by_severity
+    
     def _generate_overall_assessment(
         self, 
         review_results: Dict[str, Any], 
+        issues_by_severity: Dict[Any, List[Dict[str, Any]]],
         severity_threshold: str
     ) -> Dict[str, Any]:
         """Generate overall code review assessment."""
-        all_issues = []
         total_score = 0
         score_count = 0
         
-        # Collect all issues
+        # Collect scores
         for review_type, results in review_results.items():
-            if "issues" in results:
-                all_issues.extend(results["issues"])
-            
-            # Collect scores
             if "score" in results:
                 total_score += results["score"]
                 score_count += 1
@@ -523,21 +702,21 @@ class AICodeReviewAssistant:
                 total_score += results[f"{review_type}_score"]
                 score_count += 1
         
-        # Filter by severity threshold
-        severity_order = {"low": 0, "medium": 1, "high": 2, "critical": 3}
-        threshold_level = severity_order.get(severity_threshold, 1)
-        
-        filtered_issues = [
-            issue for issue in all_issues
-            if severity_order.get(issue.get("severity", "medium"), 1) >= threshold_level
-        ]
+        # Filter by severity threshold (issues without a known severity count as medium)
+        threshold_level = SEVERITY_ORDER.get(severity_threshold, 1)
+        total_issues = 0
+        filtered_issues = 0
+        for severity, issues in issues_by_severity.items():
+            total_issues += len(issues)
+            if SEVERITY_ORDER.get(severity, 1) >= threshold_level:
+                filtered_issues += len(issues)
         
         # Calculate overall score
         overall_score = round(total_score / max(score_count, 1), 1)
         
         # Determine approval status
-        critical_issues = [i for i in filtered_issues if i.get("severity") == "critical"]
-        high_issues = [i for i in filtered_issues if i.get("severity") == "high"]
+        critical_issues = issues_by_severity.get("critical", []) if SEVERITY_ORDER["critical"] >= threshold_level else []
+        high_issues = issues_by_severity.get("high", []) if SEVERITY_ORDER["high"] >= threshold_level else []
         
         if critical_issues:
             approval = "blocked"
@@ -553,31 +732,20 @@ class AICodeReviewAssistant:
         return {
             "overall_score": overall_score,
             "approval_status": approval,
-            "total_issues": len(all_issues),
-            "filtered_issues": len(filtered_issues),
+            "total_issues": total_issues,
+            "filtered_issues": filtered_issues,
             "critical_issues": len(critical_issues),
             "high_issues": len(high_issues),
             "recommendation": self._get_approval_recommendation(approval, filtered_issues)
         }
     
-    def _create_action_plan(
-        self, 
-        review_results: Dict[str, Any], 
-        severity_threshold: str
-    ) -> List[Dict[str, Any]]:
+    def _create_action_plan(self, issues_by_severity: Dict[Any, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
         """Create actionable plan for addressing review issues."""
         actions = []
         
-        # Collect all issues
-        all_issues = []
-        for results in review_results.values():
-            if "issues" in results:
-                all_issues.extend(results["issues"])
-        
-        # Group by severity
-        critical_issues = [i for i in all_issues if i.get("severity") == "critical"]
-        high_issues = [i for i in all_issues if i.get("severity") == "high"]
-        medium_issues = [i for i in all_issues if i.get("severity") == "medium"]
+        critical_issues = issues_by_severity.get("critical", [])
+        high_issues = issues_by_severity.get("high", [])
+        medium_issues = issues_by_severity.get("medium", [])
         
         # Create prioritized actions
         if critical_issues:
@@ -609,7 +777,7 @@ class AICodeReviewAssistant:
         
         return actions
     
-    def _get_approval_recommendation(self, approval_status: str, issues: List[Dict[str, Any]]) -> str:
+    def _get_approval_recommendation(self, approval_status: str, issue_count: int) -> str:
         """Get recommendation based on approval status."""
         recommendations = {
             "approved": "Code looks good! Ready to merge.",
@@ -620,8 +788,7 @@ class AICodeReviewAssistant:
         
         base_rec = recommendations.get(approval_status, "Review completed.")
         
-        if issues:
-            issue_count = len(issues)
+        if issue_count:
             base_rec += f" {issue_count} issue{'s' if issue_count != 1 else ''} found."
         
         return base_rec
@@ -20,11 +20,12 @@ import json
 import logging
 import os
 import re
-import requests
 from contextlib import suppress
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 
+from .ollama_client import get_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -305,7 +306,7 @@ class AIDocumentationWriter:
             Return the complete code with added docstrings.
             """
             
-            response = requests.post(
+            response = get_session().post(
                 f"{self.ollama_url}/api/generate",
                 json={
                     "model": self.model,
@@ -363,7 +364,7 @@ class AIDocumentationWriter:
             Include code examples and practical use cases.
             """
             
-            response = requests.post(
+            response = get_session().post(
                 f"{self.ollama_url}/api/generate",
                 json={
                     "model": self.model,
@@ -425,7 +426,7 @@ class AIDocumentationWriter:
             Include type information and be precise about behavior.
             """
             
-            response = requests.post(
+            response = get_session().post(
                 f"{self.ollama_url}/api/generate",
                 json={
                     "model": self.model,
@@ -490,7 +491,7 @@ class AIDocumentationWriter:
             Include explanations of why certain approaches are used.
             """
             
-            response = requests.post(
+            response = get_session().post(
                 f"{self.ollama_url}/api/generate",
                 json={
                     "model": self.model,
@@ -13,6 +13,11 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 
+from .ollama_client import get_session, is_ollama_available
+
+# JSON array embedded in a model answer that may carry prose around it
+JSON_ARRAY_PATTERN = re.compile(r'\[.*\]', re.DOTALL)
+
 
 class AISmartRefactorer:
     """Suggests intelligent refactoring using local Ollama LLMs."""
@@ -259,7 +264,7 @@ For each suggestion, provide:
 Format as JSON array of suggestions.
 """
             
-            response = requests.post(
+            response = get_session().post(
                 f"{self.ollama_url}/api/generate",
                 json={
                     "model": self.default_model,
@@ -281,7 +286,7 @@ Format as JSON array of suggestions.
                 # Try to parse JSON from the response
                 try:
                     # Extract JSON from response if it's wrapped in other text
-                    json_match = re.search(r'\[.*\]', suggestion_text, re.DOTALL)
+                    json_match = JSON_ARRAY_PATTERN.search(suggestion_text)
                     if json_match:
                         suggestions = json.loads(json_match.group())
                         return suggestions
@@ -330,7 +335,7 @@ Please provide:
 Format the response as a clear code example.
 """
             
-            response = requests.post(
+            response = get_session().post(
                 f"{self.ollama_url}/api/generate",
                 json={
                     "model": self.default_model,
@@ -416,7 +421,7 @@ For each element, suggest:
 Focus on clarity, convention, and domain-specific meaning.
 """
             
-            response = requests.post(
+            response = get_session().post(
                 f"{self.ollama_url}/api/generate",
                 json={
                     "model": self.default_model,
@@ -488,7 +493,7 @@ Suggest specific ways to reduce complexity:
 Provide concrete, actionable suggestions.
 """
                 
-                response = requests.post(
+                response = get_session().post(
                     f"{self.ollama_url}/api/generate",
                     json={
                         "model": self.default_model,
@@ -541,8 +546,4 @@ Provide concrete, actionable suggestions.
     
     def _check_ollama_available(self) -> bool:
         """Check if Ollama is running and accessible."""
-        try:
-            response = requests.get(f"{self.ollama_url}/api/tags", timeout=5)
-            return response.status_code == 200
-        except requests.RequestException:
-            return False
+        return is_ollama_available(self.ollama_url)
@@ -15,25 +15,23 @@ Features:
 """
 
 import ast
+import asyncio
 import json
 import logging
 import os
 import re
-import requests
 from contextlib import suppress
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 
-# Import configuration directly
-try:
-    from ..config import OLLAMA_CONFIG
-except ImportError:
-    # Fallback configuration if import fails
-    OLLAMA_CONFIG = {
-        "url": "http://localhost:11434",
-        "model": "deepseek-r1:8b",
-        "timeout": 30
-    }
+from .ollama_client import get_session
+
+# Default Ollama configuration (the worker has no config package to import it from)
+OLLAMA_CONFIG = {
+    "url": "http://localhost:11434",
+    "model": "deepseek-r1:8b",
+    "timeout": 30
+}
 
 logger = logging.getLogger(__name__)
 
@@ -358,7 +356,9 @@ class AITestGenerator:
             Return only the test code, no explanations.
             """
             
-            response = requests.post(
+            # The blocking HTTP call runs in a thread so several files can be generated at once
+            response = await asyncio.to_thread(
+                get_session().post,
                 f"{self.ollama_url}/api/generate",
                 json={
                     "model": self.model,
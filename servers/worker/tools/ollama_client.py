@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Shared Ollama HTTP client for the AI development tools.
+
+All worker tools talk to the same local Ollama server, so they share one
+keep-alive connection pool instead of opening a new connection per request.
+"""
+
+import time
+import threading
+import functools
+from typing import Dict, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# How long an availability probe result is trusted before asking Ollama again
+AVAILABILITY_TTL_SECONDS = 10.0
+
+_availability: Dict[str, Tuple[float, bool]] = {}
+_availability_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def get_session() -> requests.Session:
+    """Return the process-wide pooled session used for Ollama requests."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def is_ollama_available(ollama_url: str, timeout: float = 5) -> bool:
+    """Check whether Ollama answers at ollama_url, reusing recent probe results."""
+    now = time.monotonic()
+    with _availability_lock:
+        cached = _availability.get(ollama_url)
+        if cached and cached[0] > now:
+            return cached[1]
+
+    try:
+        response = get_session().get(f"{ollama_url}/api/tags", timeout=timeout)
+        available = response.status_code == 200
+    except requests.RequestException:
+        available = False
+
+    with _availability_lock:
+        _availability[ollama_url] = (now + AVAILABILITY_TTL_SECONDS, available)
+    return available